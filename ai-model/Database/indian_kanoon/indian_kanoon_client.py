@@ -22,12 +22,56 @@ import logging
 import time
 import asyncio
 import re
-from typing import Dict, List, Optional, Any, Union, Tuple
-from dataclasses import dataclass, field
+import string
+import hashlib
+import pickle
+import sqlite3
+import threading
+import weakref
+import heapq
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AbstractSet, Dict, List, Optional, Any, Union, Tuple, Set, FrozenSet
+from dataclasses import dataclass, field, fields, asdict, is_dataclass, replace
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
 
+import httpx
+import numpy as np
+
+# Optional JIT compilation for the batch relevance scorer
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional multi-pattern matchers for the keyword tables: Hyperscan, Aho-Corasick, then RE2 or re
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+# Optional fast JSON serialization for responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import the official Indian Kanoon API client
 try:
     from old.indian_kanoon.ikapi import IKApi, FileStorage, setup_logging
@@ -65,20 +109,20 @@ class SearchContext(Enum):
     PROCEDURAL = "procedural"
     EMERGENCY = "emergency"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QueryClassification:
-    """Enhanced query classification for agentic flow"""
+    """Enhanced query classification for agentic flow (immutable and hashable, safe to cache)"""
     query_type: QueryType
     urgency: UrgencyLevel
     confidence: float
     requires_legal_counsel: bool
     jurisdiction: str = "india"
-    keywords: List[str] = field(default_factory=list)
+    keywords: Tuple[str, ...] = ()
     search_context: SearchContext = SearchContext.GENERAL
     priority_score: int = 0
-    legal_sections: List[str] = field(default_factory=list)
+    legal_sections: Tuple[str, ...] = ()
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedSearchResult:
     """Enhanced search result with agentic context"""
     doc_id: str
@@ -91,8 +135,19 @@ class EnhancedSearchResult:
     query_type_match: bool = False
     urgency_indicators: List[str] = field(default_factory=list)
     legal_concepts: List[str] = field(default_factory=list)
+    emergency_score: float = 0.0
+    strategic_score: float = 0.0
+    # Casefolded "title snippet" and court, computed once and shared by every scorer
+    _content_lower: str = field(default="", repr=False)
+    _court_lower: str = field(default="", repr=False)
     
-@dataclass 
+    def __post_init__(self):
+        if not self._content_lower:
+            self._content_lower = f"{self.title} {self.snippet}".casefold()
+        if not self._court_lower:
+            self._court_lower = self.court.casefold()
+    
+@dataclass(slots=True)
 class ContextualCaseDocument:
     """Case document with enhanced context for RAG"""
     doc_id: str
@@ -107,28 +162,23 @@ class ContextualCaseDocument:
     case_type: str = "general"
     outcome: str = ""
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgenticSearchStrategy:
-    """Search strategy based on query classification"""
-    primary_keywords: List[str]
-    secondary_keywords: List[str]
-    legal_sections: List[str]
+    """Search strategy based on query classification (immutable, as strategies are shared from a cache)"""
+    primary_keywords: Tuple[str, ...]
+    secondary_keywords: Tuple[str, ...]
+    legal_sections: Tuple[str, ...]
     case_type_filter: str
     max_results: int
     search_depth: str  # "shallow", "deep", "comprehensive"
-    priority_courts: List[str] = field(default_factory=list)
-
-@dataclass
-class SearchResult:
-    """Represents a case law search result"""
-    doc_id: str
-    title: str
-    court: str
-    date: str
-    snippet: str = ""
-    position: int = 0
+    priority_courts: Tuple[str, ...] = ()
+    # Lowercased priority courts, derived once for the result scorer
+    priority_courts_lower: FrozenSet[str] = field(init=False, repr=False, compare=False)
     
-@dataclass 
+    def __post_init__(self):
+        object.__setattr__(self, "priority_courts_lower", frozenset(court.casefold() for court in self.priority_courts))
+
+@dataclass(slots=True)
 class CaseDocument:
     """Represents a full case law document"""
     doc_id: str
@@ -139,6 +189,599 @@ class CaseDocument:
     citations: List[str]
     cited_by: List[str]
 
+# Rule tables for query classification (compiled once by QueryClassifier)
+_CLASSIFICATION_RULES = {
+    QueryType.CONSUMER_PROTECTION: {
+        "keywords": ["purchase", "bottle", "price", "consumer", "overcharge", "defective product", 
+                   "warranty", "refund", "service deficiency", "product liability"],
+        "legal_sections": ["Consumer Protection Act 2019", "Legal Metrology Act"],
+        "urgency_indicators": ["financial loss", "health risk"]
+    },
+    QueryType.CRIMINAL_LAW: {
+        "keywords": ["rape case", "false case", "extortion", "blackmail", "threat", "assault", 
+                   "harassment", "dowry", "domestic violence", "fraud"],
+        "legal_sections": ["IPC", "CrPC", "Protection of Women Act"],
+        "urgency_indicators": ["immediate threat", "safety risk", "ongoing harassment"]
+    },
+    QueryType.FAMILY_LAW: {
+        "keywords": ["divorce", "marriage", "custody", "maintenance", "alimony", "adoption",
+                   "property settlement", "domestic disputes"],
+        "legal_sections": ["Hindu Marriage Act", "Special Marriage Act", "Family Courts Act"],
+        "urgency_indicators": ["child welfare", "domestic violence"]
+    },
+    QueryType.PROPERTY_LAW: {
+        "keywords": ["property", "land", "ownership", "title", "registration", "partition",
+                   "easement", "encroachment", "possession"],
+        "legal_sections": ["Transfer of Property Act", "Registration Act", "Land Acquisition Act"],
+        "urgency_indicators": ["illegal occupation", "forced eviction"]
+    }
+}
+
+# Emergency keywords with weights
+_EMERGENCY_INDICATORS = {
+    "immediate": 2.0,
+    "urgent": 2.0,
+    "emergency": 2.0,
+    "protection": 1.5,
+    "relief": 1.5,
+    "interim": 1.5,
+    "bail": 1.5,
+    "safety": 1.5,
+    "danger": 2.0,
+    "threat": 2.0,
+}
+
+# Explicit urgency markers and signals that a query needs a lawyer; matched in the
+# same pass over the query as the classification keywords
+_EXPLICIT_URGENCY_MARKERS = frozenset({"urgent", "emergency", "immediate", "critical", "life threatening"})
+_LEGAL_COUNSEL_INDICATORS = frozenset({
+    "court case", "lawsuit", "legal notice", "sue", "trial", "hearing date",
+    "summons", "warrant", "police complaint", "fir", "arrest", "bail"
+})
+
+# Static response tables shared read-only by every client
+_COMMON_IMMEDIATE_ACTIONS: Tuple[str, ...] = (
+    "Contact a local lawyer immediately",
+    "Document all relevant evidence and communications"
+)
+
+_IMMEDIATE_ACTIONS: Dict[QueryType, Tuple[str, ...]] = {
+    QueryType.CRIMINAL_LAW: (
+        "If facing arrest, apply for anticipatory bail",
+        "Consult with a criminal defense lawyer",
+        "Do not make statements to police without a lawyer present"
+    ),
+    QueryType.FAMILY_LAW: (
+        "Consider obtaining a protection order if facing threats",
+        "Secure important documents and financial information",
+        "Ensure children's safety and document any incidents"
+    ),
+    QueryType.CONSUMER_PROTECTION: (
+        "File a formal complaint with the service provider/retailer",
+        "Contact consumer protection authorities",
+        "Document all defects and communication with seller"
+    ),
+    QueryType.PROPERTY_LAW: (
+        "File a police complaint if there's forcible dispossession",
+        "Secure property documents and proof of ownership",
+        "Consider filing for emergency injunction"
+    )
+}
+
+_COMMON_EMERGENCY_CONTACTS: Tuple[Dict[str, str], ...] = (
+    {"name": "Police Emergency", "number": "100"},
+    {"name": "Legal Services Authority", "number": "1516"}
+)
+
+_EMERGENCY_CONTACTS: Dict[QueryType, Tuple[Dict[str, str], ...]] = {
+    QueryType.CRIMINAL_LAW: (
+        {"name": "National Legal Services Authority", "number": "1516"},
+        {"name": "Women's Helpline", "number": "181"}
+    ),
+    QueryType.FAMILY_LAW: (
+        {"name": "Women's Helpline", "number": "181"},
+        {"name": "Child Helpline", "number": "1098"}
+    ),
+    QueryType.CONSUMER_PROTECTION: (
+        {"name": "Consumer Helpline", "number": "1800-11-4000"},
+        {"name": "State Consumer Dispute Redressal Commission", "number": "Varies by state"}
+    ),
+    QueryType.PROPERTY_LAW: (
+        {"name": "Local Police Station", "number": "Check local directory"},
+        {"name": "Municipal Corporation", "number": "Varies by city"}
+    )
+}
+
+_COMMON_LEGAL_PROTECTIONS: Tuple[str, ...] = (
+    "Constitutional rights under Article 21 (Right to life and liberty)",
+    "Right to legal representation"
+)
+
+_LEGAL_PROTECTIONS: Dict[QueryType, Tuple[str, ...]] = {
+    QueryType.CRIMINAL_LAW: (
+        "Right to silence under Article 20(3)",
+        "Protection against arbitrary arrest under Article 22",
+        "Right to fair trial under Article 21"
+    ),
+    QueryType.FAMILY_LAW: (
+        "Protection of Women from Domestic Violence Act, 2005",
+        "Maintenance under Section 125 of CrPC",
+        "Child custody protections under Guardian and Wards Act"
+    ),
+    QueryType.CONSUMER_PROTECTION: (
+        "Consumer Protection Act, 2019 protections",
+        "Right to compensation for defective products/services",
+        "Right to file class action suits"
+    ),
+    QueryType.PROPERTY_LAW: (
+        "Protection against forcible dispossession",
+        "Right to peaceful possession under Section 6 of Specific Relief Act",
+        "Right to injunction against interference"
+    )
+}
+
+_RECOMMENDATIONS_BY_TYPE: Dict[QueryType, Tuple[str, ...]] = {
+    QueryType.CONSUMER_PROTECTION: (
+        "File a formal complaint with the business first",
+        "Approach the consumer forum if the complaint is not resolved",
+        "Gather all bills, warranties, and communication as evidence"
+    ),
+    QueryType.CRIMINAL_LAW: (
+        "Consult with a criminal lawyer immediately",
+        "Do not give statements without legal representation",
+        "Understand your rights during investigation and trial"
+    ),
+    QueryType.FAMILY_LAW: (
+        "Consider mediation for family disputes",
+        "Consult a family law specialist",
+        "Focus on documentation and maintaining records"
+    ),
+    QueryType.PROPERTY_LAW: (
+        "Verify property documents and ownership history",
+        "Consider getting a legal title search done",
+        "File appropriate documentation with relevant authorities"
+    )
+}
+
+_NEXT_STEPS_BY_TYPE: Dict[QueryType, Tuple[str, ...]] = {
+    QueryType.CONSUMER_PROTECTION: (
+        "📋 Gather all receipts, warranty information, and product documentation",
+        "📋 Write a formal complaint letter to the business",
+        "📋 Research the consumer dispute resolution process in your jurisdiction"
+    ),
+    QueryType.CRIMINAL_LAW: (
+        "📋 Do not discuss your case with anyone except your lawyer",
+        "📋 Collect all relevant documents and evidence",
+        "📋 Understand the charges and potential consequences"
+    ),
+    QueryType.FAMILY_LAW: (
+        "📋 Gather all financial documents and records",
+        "📋 Document all communications related to the dispute",
+        "📋 Consider the welfare of any children involved"
+    ),
+    QueryType.PROPERTY_LAW: (
+        "📋 Verify property records at the local registry",
+        "📋 Check for any encumbrances or liens on the property",
+        "📋 Ensure all property taxes and dues are up to date"
+    )
+}
+
+class _TermMatcher:
+    """Finds which of a fixed set of literal terms occur in a text in one linear scan.
+    
+    Uses a Hyperscan database or an Aho-Corasick automaton when available, otherwise
+    a single RE2 (or stdlib re) alternation of the terms.
+    """
+    
+    def __init__(self, terms: Tuple[str, ...]):
+        # Longest first so phrases win over their prefixes; a phrase match also
+        # implies every shorter term it contains (e.g. "immediate threat" -> "threat")
+        self.terms = sorted(set(terms), key=len, reverse=True)
+        self.implied = {term: frozenset(other for other in self.terms if other in term) for term in self.terms}
+        
+        if HYPERSCAN_AVAILABLE:
+            # Hyperscan reports every (overlapping) pattern once; scratch space isn't thread-safe
+            self._database = hyperscan.Database()
+            self._database.compile(
+                expressions=[re.escape(term).encode("utf-8") for term in self.terms],
+                ids=list(range(len(self.terms))),
+                elements=len(self.terms),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self.terms)
+            )
+            self._scan_lock = threading.Lock()
+        elif AHOCORASICK_AVAILABLE:
+            # The automaton reports every (overlapping) term ending at each position
+            self._automaton = ahocorasick.Automaton()
+            for term in self.terms:
+                self._automaton.add_word(term, term)
+            self._automaton.make_automaton()
+        else:
+            self.pattern = _regex_engine.compile("|".join(map(re.escape, self.terms)))
+    
+    def find(self, text: str) -> Set[str]:
+        """Return every term occurring in text"""
+        found = set()
+        if HYPERSCAN_AVAILABLE:
+            hit_ids = []
+            with self._scan_lock:
+                self._database.scan(text.encode("utf-8"),
+                                    match_event_handler=lambda term_id, *_: hit_ids.append(term_id))
+            for term_id in hit_ids:
+                found |= self.implied[self.terms[term_id]]
+        elif AHOCORASICK_AVAILABLE:
+            for _, term in self._automaton.iter(text):
+                found.add(term)
+        else:
+            # Restart one character past each match start so overlapping terms aren't
+            # skipped ("court case study" holds both "court case" and "case study");
+            # the longest term at a start implies every shorter term there
+            search = self.pattern.search
+            match = search(text, 0)
+            while match is not None:
+                found |= self.implied[match.group()]
+                match = search(text, match.start() + 1)
+        return found
+
+@lru_cache(maxsize=256)
+def _compile_terms(terms: Tuple[str, ...]) -> _TermMatcher:
+    """Build (and cache) the matcher for a set of literal terms"""
+    return _TermMatcher(terms)
+
+def _find_terms(text: str, terms: Tuple[str, ...]) -> Set[str]:
+    """Return every term occurring in text using a single matcher pass"""
+    if not terms:
+        return set()
+    return _compile_terms(terms).find(text)
+
+# Classification rules flattened into aligned per-category tables (indexed by rule order),
+# so scoring touches only the columns it needs
+_QT_INDEX: Tuple[QueryType, ...] = tuple(_CLASSIFICATION_RULES)
+_QT_KEYWORDS: Tuple[Tuple[str, ...], ...] = tuple(tuple(rules["keywords"]) for rules in _CLASSIFICATION_RULES.values())
+_QT_URGENCY: Tuple[Tuple[str, ...], ...] = tuple(tuple(rules["urgency_indicators"]) for rules in _CLASSIFICATION_RULES.values())
+_QT_SECTIONS: Tuple[Tuple[str, ...], ...] = tuple(tuple(rules["legal_sections"]) for rules in _CLASSIFICATION_RULES.values())
+_QT_COUNT = len(_QT_INDEX)
+
+# Every classification keyword/urgency term mapped to the (category index, weight) pairs it scores
+_TERM_WEIGHTS: Dict[str, List[Tuple[int, int]]] = {}
+for _index in range(_QT_COUNT):
+    for _term in _QT_KEYWORDS[_index]:
+        _TERM_WEIGHTS.setdefault(_term, []).append((_index, 1))
+    for _term in _QT_URGENCY[_index]:
+        _TERM_WEIGHTS.setdefault(_term, []).append((_index, 2))  # Higher weight for urgency
+del _index, _term
+
+# Category terms, urgency markers and counsel indicators share one automaton,
+# so the whole classification needs a single scan of the query
+_CLASSIFIER_MATCHER = _compile_terms(
+    tuple(sorted(set(_TERM_WEIGHTS) | _EXPLICIT_URGENCY_MARKERS | _LEGAL_COUNSEL_INDICATORS))
+)
+
+# Common legal context indicators and the search keywords each one adds
+_LEGAL_INDICATORS: Dict[str, Tuple[str, ...]] = {
+    "contract": ("agreement", "breach", "terms"),
+    "injury": ("accident", "medical", "negligence"),
+    "property": ("ownership", "title", "dispute"),
+    "employment": ("workplace", "salary", "termination"),
+    "family": ("spouse", "children", "inheritance")
+}
+_LEGAL_INDICATOR_TERMS = tuple(_LEGAL_INDICATORS)
+
+# Trimmed from both ends of a query before scoring so "refund?" and "refund" share
+# a cache slot; no term contains punctuation, so matches are unaffected
+_QUERY_EDGE_CHARS = string.punctuation + string.whitespace
+
+@lru_cache(maxsize=4096)
+def _score_query(query_lower: str) -> Tuple[Optional[int], int, Tuple[str, ...], Tuple[str, ...], FrozenSet[str]]:
+    """Score a normalized, lowercased query against the classification rules.
+    
+    Returns (best category index or None, its score, its matched keywords, its matched
+    urgency indicators, every term found). Pure, so results are memoized.
+    """
+    found = frozenset(_CLASSIFIER_MATCHER.find(query_lower))
+    
+    scores = [0] * _QT_COUNT
+    term_weights = _TERM_WEIGHTS.get  # Bound once for the loop
+    for term in found:
+        for index, weight in term_weights(term, ()):
+            scores[index] += weight
+    
+    # Determine best match: argmax over the fixed-size score array (first maximum, so ties
+    # resolve by rule order); an all-zero array means nothing matched
+    top_score = max(scores)
+    if not top_score:
+        return None, 0, (), (), found
+    best = scores.index(top_score)
+    
+    return (
+        best,
+        top_score,
+        tuple(keyword for keyword in _QT_KEYWORDS[best] if keyword in found),
+        tuple(indicator for indicator in _QT_URGENCY[best] if indicator in found),
+        found
+    )
+
+# Persisted classifications are keyed on the rule tables and the record layout, so
+# changing either invalidates them
+_CLASSIFIER_SCHEMA_VERSION = 2
+_CLASSIFIER_VERSION = hashlib.blake2b(
+    repr((_CLASSIFIER_SCHEMA_VERSION, _CLASSIFICATION_RULES,
+          sorted(_EXPLICIT_URGENCY_MARKERS), sorted(_LEGAL_COUNSEL_INDICATORS))).encode("utf-8"), digest_size=8
+).hexdigest()
+
+# Cached search results are refreshed after a week (an hour for deep, urgent searches);
+# bump the schema version whenever the cached result record changes shape
+_SEARCH_CACHE_TTL = 7 * 24 * 3600
+_FRESH_SEARCH_TTL = 3600
+_SEARCH_SCHEMA_VERSION = 3
+
+# Year at the end of a date string ("12-03-2019"), or leading an ISO date as
+# returned by the search API ("2019-03-12")
+_YEAR_RE = re.compile(r"^(\d{4})-\d{1,2}-\d{1,2}|(\d{4})\s*$")
+
+def _parse_year(date: str) -> int:
+    """Extract the year from a date string, 0 if absent"""
+    match = _YEAR_RE.search(date) if date else None
+    return int(match.group(1) or match.group(2)) if match else 0
+
+# Fields of a search result exposed in responses (internal ones are underscore-prefixed)
+_PUBLIC_RESULT_FIELDS = tuple(f.name for f in fields(EnhancedSearchResult) if not f.name.startswith('_'))
+
+def _public_results(results: List[EnhancedSearchResult]) -> List[Dict[str, Any]]:
+    """Convert result records to plain dicts, without internal fields, before they leave the client"""
+    return [{name: getattr(result, name) for name in _PUBLIC_RESULT_FIELDS} for result in results]
+
+# Async HTTP endpoint used for batched document fetches
+_IK_API_BASE_URL = "https://api.indiankanoon.org"
+
+# Seconds a synchronous search() caller waits for its result
+_SYNC_SEARCH_TIMEOUT = 30.0
+
+# Indian Kanoon API requests per second (IK_RPS), and retries after a 429 response
+_IK_RPS = float(os.getenv("IK_RPS", "5"))
+_RATE_LIMIT_RETRIES = 3
+
+# Process-wide event loop serving synchronous callers from a daemon thread, so their
+# connection pools survive between calls
+_BG_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BG_LOOP_LOCK = threading.Lock()
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use"""
+    global _BG_LOOP
+    with _BG_LOOP_LOCK:
+        if _BG_LOOP is None:
+            _BG_LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_BG_LOOP.run_forever, name="indian-kanoon-loop", daemon=True).start()
+    return _BG_LOOP
+
+# Indian Kanoon wraps matched terms in HTML tags inside titles and headlines
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Court tier weights indexed by court code: 0 = other, 1 = supreme, 2 = high, 3 = district
+_COURT_WEIGHTS = np.array([0.0, 2.0, 1.5, 1.0])
+
+def _relevance_scores_loop(keyword_hits: np.ndarray, court_codes: np.ndarray,
+                           years: np.ndarray, current_year: int) -> np.ndarray:
+    """Relevance kernel over typed arrays; a year of 0 means the date was unparseable"""
+    scores = np.empty(keyword_hits.shape[0], dtype=np.float64)
+    for i in range(keyword_hits.shape[0]):
+        score = keyword_hits[i] + _COURT_WEIGHTS[court_codes[i]]
+        if years[i] != 0:
+            recency = 1.0 - 0.05 * (current_year - years[i])  # 5% deduction per year
+            if recency > 0.0:
+                score += recency
+        scores[i] = score
+    return scores
+
+def _relevance_scores_numpy(keyword_hits: np.ndarray, court_codes: np.ndarray,
+                            years: np.ndarray, current_year: int) -> np.ndarray:
+    """Vectorized equivalent of _relevance_scores_loop for environments without numba"""
+    recency = np.where(years != 0, np.maximum(1.0 - 0.05 * (current_year - years), 0.0), 0.0)
+    return keyword_hits + _COURT_WEIGHTS[court_codes] + recency
+
+if NUMBA_AVAILABLE:
+    # Compiled on first call in each process; numba's on-disk cache is not used because it
+    # fails to load when this module is imported under a different name than when it was written
+    _relevance_scores = numba.njit(fastmath=True)(_relevance_scores_loop)
+else:
+    _relevance_scores = _relevance_scores_numpy
+
+def _json_default(value: Any) -> Any:
+    """json.dumps fallback for the types orjson serializes natively"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def serialize_response(response: Dict[str, Any]) -> bytes:
+    """
+    Serialize a client response to JSON bytes.
+    
+    Responses carry datetime timestamps (and may carry enums or dataclasses), which
+    orjson handles natively; without orjson the standard library is used.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(response)
+    return json.dumps(response, default=_json_default, ensure_ascii=False).encode("utf-8")
+
+# Parses search responses; orjson is several times faster on the large payloads fan-outs fetch
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _cache_key(prefix: str, text: str) -> str:
+    """Build a process-stable cache key (unlike hash(), which is randomized per process)"""
+    return f"{prefix}_{hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()}"
+
+class LRUCache(OrderedDict):
+    """Size-bounded mapping that evicts the least recently used entry"""
+    
+    def __init__(self, maxsize: int = 4096):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+class SQLiteCache:
+    """Disk-backed key/value cache shared by every worker process using the same data_dir"""
+    
+    TABLES = ("classifications", "searches")
+    
+    def __init__(self, path: Path):
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            for table in self.TABLES:
+                self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, blob BLOB, ts REAL)")
+            self._conn.commit()
+    
+    def get(self, table: str, key: str, max_age: Optional[float] = None) -> Any:
+        """Return the cached value, or None if missing or older than max_age seconds"""
+        entry = self.get_entry(table, key, max_age)
+        return entry[0] if entry is not None else None
+    
+    def get_entry(self, table: str, key: str, max_age: Optional[float] = None) -> Optional[Tuple[Any, float]]:
+        """Return (value, stored-at timestamp), or None if missing or older than max_age seconds"""
+        with self._lock:
+            row = self._conn.execute(f"SELECT blob, ts FROM {table} WHERE key = ?", (key,)).fetchone()
+        
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+        
+        try:
+            return pickle.loads(row[0]), row[1]
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry in {table}: {e}")
+            return None
+    
+    def set(self, table: str, key: str, value: Any):
+        """Store a value, replacing any existing entry"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(f"INSERT OR REPLACE INTO {table} (key, blob, ts) VALUES (?, ?, ?)",
+                               (key, blob, time.time()))
+            self._conn.commit()
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+@lru_cache(maxsize=8192)
+def _classify_cached(query_lower: str) -> QueryClassification:
+    """Process-wide classification memo keyed on the casefolded query alone (the classifier is stateless)"""
+    return IndianKanoonClient.QueryClassifier().classify_query(query_lower, query_lower)
+
+# Cost per operation (in Rs)
+_OPERATION_COSTS = {
+    'search': 0.5,
+    'document': 0.25,
+    'meta': 0.10
+}
+
+_DISCLAIMERS: Tuple[str, ...] = (
+    "This information is for educational purposes only and does not constitute legal advice.",
+    "Consult with a qualified lawyer for specific legal guidance."
+)
+
+# User-context cues: (label, trigger terms), reported in this order
+_CONTEXT_FACTORS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Contractual relationship", ("contract",)),
+    ("Potential damages or injuries", ("injury", "damage")),
+    ("Evidentiary considerations", ("evidence", "proof")),
+    ("Time-sensitive elements", ("time", "deadline")),
+)
+
+_POTENTIAL_ISSUES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Potential statute of limitations concerns", ("deadline", "limitation")),
+    ("Jurisdictional considerations", ("jurisdiction", "state")),
+    ("Documentation requirements", ("document",)),
+)
+
+# Every trigger term, so factors and issues are found in one scan of the context
+_CONTEXT_TERMS: Tuple[str, ...] = tuple(dict.fromkeys(
+    term for _, terms in _CONTEXT_FACTORS + _POTENTIAL_ISSUES for term in terms
+))
+
+@dataclass(frozen=True, slots=True)
+class _IKApiArgs:
+    """Arguments object expected by IKApi, tuned for cost control"""
+    token: str
+    datadir: str
+    maxcites: int = 5  # Limit citations to control costs
+    maxcitedby: int = 5  # Limit cited by to control costs
+    orig: bool = False  # Don't download original documents
+    maxpages: int = 1  # Limit to 1 page for cost control
+    pathbysrc: bool = False
+    numworkers: int = 1
+    addedtoday: bool = False
+    fromdate: Optional[str] = None
+    todate: Optional[str] = None
+    sortby: Optional[str] = None
+
+class _TokenBucket:
+    """
+    Proactive rate limiter: at most `rate` acquisitions per second, with bursts of up to `capacity`.
+    
+    Each caller reserves the next free slot under a thread lock and sleeps exactly until it,
+    so nobody polls and one bucket can serve every event loop in the process. A 429 response
+    halves the rate; successful calls restore it gradually.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        self.max_rate = rate
+        self.min_rate = rate / 16
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self._next_free = time.monotonic()
+        self._lock = threading.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available"""
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self.rate
+            # Idle time banks up to `capacity` tokens
+            slot = max(self._next_free, now - (self.capacity - 1) * interval)
+            self._next_free = slot + interval
+        
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+    
+    def throttle(self):
+        """Halve the rate after the server rejected a request for exceeding its limit"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+        logger.warning(f"Indian Kanoon rate limit hit, slowing to {self.rate:.2f} requests/s")
+    
+    def recover(self):
+        """Step the rate back towards its configured maximum after a successful request"""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate * 1.25)
+
 class BudgetTracker:
     """Track API usage and budget"""
     
@@ -149,31 +792,30 @@ class BudgetTracker:
         self.document_count = 0
         self.meta_count = 0
         
-        # Cost per operation (in Rs)
-        self.cost_per_search = 0.5  
-        self.cost_per_document = 0.25
-        self.cost_per_meta = 0.10
+        # Guards check-and-record so concurrent searches cannot overshoot the limit
+        self._lock = threading.Lock()
         
     def can_afford(self, operation: str, count: int = 1) -> bool:
         """Check if we can afford an operation"""
-        costs = {
-            'search': self.cost_per_search * count,
-            'document': self.cost_per_document * count,
-            'meta': self.cost_per_meta * count
-        }
-        
-        cost = costs.get(operation, 0)
+        cost = _OPERATION_COSTS.get(operation, 0) * count
         return (self.current_spending + cost) <= self.budget_limit
     
+    def reserve(self, operation: str, count: int = 1) -> bool:
+        """Atomically check the budget and record the usage if affordable"""
+        with self._lock:
+            if not self.can_afford(operation, count):
+                return False
+            self._record(operation, count)
+            return True
+    
     def record_usage(self, operation: str, count: int = 1):
         """Record API usage"""
-        costs = {
-            'search': self.cost_per_search * count,
-            'document': self.cost_per_document * count,
-            'meta': self.cost_per_meta * count
-        }
-        
-        cost = costs.get(operation, 0)
+        with self._lock:
+            self._record(operation, count)
+    
+    def _record(self, operation: str, count: int):
+        """Record usage; caller must hold the lock"""
+        cost = _OPERATION_COSTS.get(operation, 0) * count
         self.current_spending += cost
         
         if operation == 'search':
@@ -185,6 +827,13 @@ class BudgetTracker:
             
         logger.info(f"API Usage - {operation}: +{cost:.2f} Rs, Total: {self.current_spending:.2f} Rs")
     
+    def remaining_operations(self, operation: str) -> int:
+        """Number of operations of this type the remaining budget can pay for"""
+        cost = _OPERATION_COSTS.get(operation, 0)
+        if cost <= 0:
+            return 0
+        return max(0, int((self.budget_limit - self.current_spending) // cost))
+    
     def get_status(self) -> Dict[str, Any]:
         """Get budget status"""
         return {
@@ -203,7 +852,9 @@ class IndianKanoonClient:
     Implements intelligent query routing, context-aware search, and response synthesis.
     """
     
-    def __init__(self, api_token: str, budget_limit: float = 500.0, data_dir: str = "temp_data"):
+    def __init__(self, api_token: str, budget_limit: float = 500.0, data_dir: str = "temp_data",
+                 cache_size: int = 4096, persistent_cache: bool = True,
+                 max_concurrent_searches: int = 8):
         """
         Initialize the Indian Kanoon client with agentic capabilities.
         
@@ -211,6 +862,9 @@ class IndianKanoonClient:
             api_token: Indian Kanoon API token
             budget_limit: Budget limit in Rs (default: 500)
             data_dir: Directory for temporary data storage
+            cache_size: Maximum entries kept in each in-memory cache
+            persistent_cache: Back the in-memory caches with SQLite in data_dir
+            max_concurrent_searches: Search API calls allowed in flight at once
         """
         if not IKAPI_AVAILABLE:
             raise ImportError("Indian Kanoon API client (ikapi) not available. Please check installation.")
@@ -225,36 +879,36 @@ class IndianKanoonClient:
         self.query_classifier = self.QueryClassifier()
         self.search_engine = self.AgenticSearchEngine()
         
-        # Initialize the official API client
+        # Initialize the official API client (its settings drive the async calls below)
         self._init_api_client()
         
-        # Enhanced caching with classification-based keys
-        self.search_cache = {}
-        self.doc_cache = {}
-        self.classification_cache = {}
+        # Bounds concurrent search calls (fan-out searches) per event loop to spare the API server
+        self.max_concurrent_searches = max_concurrent_searches
+        self._search_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+        
+        # Keeps every API call under the account's request rate instead of retrying after failures
+        self._rate_limiter = _TokenBucket(_IK_RPS)
+        
+        # Enhanced caching with classification-based keys (bounded for long-running servers);
+        # search entries are (stored-at timestamp, results) so they expire like the disk tier
+        self.search_cache = LRUCache(maxsize=cache_size)
+        self.doc_cache = LRUCache(maxsize=cache_size)
+        # Classifications already read from or written to the disk tier, so hits skip SQLite
+        self.classification_cache = LRUCache(maxsize=cache_size)
+        
+        # Pooled keep-alive HTTP clients for searches and document fetches, one per event loop
+        # (pooled connections belong to the loop that opened them), created lazily
+        self._http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        
+        # On-disk tier so restarts and other worker processes reuse results
+        self.persistent_cache = SQLiteCache(self.data_dir / "cache.sqlite") if persistent_cache else None
         
         logger.info(f"Agentic Indian Kanoon client initialized with budget limit: Rs {budget_limit}")
     
     def _init_api_client(self):
         """Initialize the official Indian Kanoon API client"""
         try:
-            # Create a simple args object for the API client
-            class Args:
-                def __init__(self, token, datadir):
-                    self.token = token
-                    self.datadir = str(datadir)
-                    self.maxcites = 5  # Limit citations to control costs
-                    self.maxcitedby = 5  # Limit cited by to control costs
-                    self.orig = False  # Don't download original documents
-                    self.maxpages = 1  # Limit to 1 page for cost control
-                    self.pathbysrc = False
-                    self.numworkers = 1
-                    self.addedtoday = False
-                    self.fromdate = None
-                    self.todate = None
-                    self.sortby = None
-            
-            args = Args(self.api_token, self.data_dir)
+            args = _IKApiArgs(token=self.api_token, datadir=str(self.data_dir))
             storage = FileStorage(str(self.data_dir))
             
             self.api_client = IKApi(args, storage)
@@ -276,8 +930,12 @@ class IndianKanoonClient:
             Dictionary containing classification, search results, and recommendations
         """
         try:
+            # Normalize once; every matcher downstream reuses these casefolded forms
+            query_lower = query.casefold()
+            user_context_lower = user_context.casefold() if user_context else None
+            
             # Step 1: Query Classification (following mermaid flow)
-            classification = self.classify_query(query)
+            classification = self.classify_query(query, query_lower)
             logger.info(f"Query classified as {classification.query_type.value} with urgency {classification.urgency.value}")
             
             # Step 2: Urgency Assessment & Routing
@@ -285,13 +943,14 @@ class IndianKanoonClient:
                 return await self._handle_critical_query(query, classification, user_context)
             
             # Step 3: Knowledge Retrieval Strategy
-            search_strategy = self.search_engine.create_search_strategy(classification, user_context)
+            search_strategy = self.search_engine.create_search_strategy(classification, user_context, user_context_lower)
             
             # Step 4: Execute Search
             search_results = await self._execute_strategic_search(query, search_strategy, classification)
             
             # Step 5: Response Synthesis
-            response = self._synthesize_agentic_response(query, classification, search_results, user_context)
+            response = self._synthesize_agentic_response(query, classification, search_results, user_context,
+                                                         user_context_lower)
             
             return response
             
@@ -299,17 +958,223 @@ class IndianKanoonClient:
             logger.error(f"Agentic search failed: {e}")
             return self.generate_error_response(query, str(e))
     
-    def classify_query(self, query: str) -> QueryClassification:
-        """Classify query with caching"""
-        cache_key = f"classify_{hash(query)}"
+    def classify_query(self, query: str, query_lower: Optional[str] = None) -> QueryClassification:
+        """Classify query with caching (in-memory LRU, then SQLite, then the process-wide memo); pass query_lower if already casefolded"""
+        if query_lower is None:
+            query_lower = query.casefold()
+        if not self.persistent_cache:
+            return _classify_cached(query_lower)
+        
+        classification = self.classification_cache.get(query_lower)
+        if classification is not None:
+            return classification
+        
+        cache_key = _cache_key("classify", f"{_CLASSIFIER_VERSION}:{query_lower}")
+        classification = self.persistent_cache.get("classifications", cache_key)
+        if classification is None:
+            classification = _classify_cached(query_lower)
+            self.persistent_cache.set("classifications", cache_key, classification)
+        
+        self.classification_cache[query_lower] = classification
+        return classification
+    
+    def clear_cache(self):
+        """Clear all in-memory caches (the classification LRU is shared by every client)"""
+        self.search_cache.clear()
+        self.doc_cache.clear()
+        self.classification_cache.clear()
+        _classify_cached.cache_clear()
+    
+    def close(self):
+        """Clear caches and release the sync callers' HTTP client and the cache database"""
+        self.clear_cache()
+        
+        # The background loop's client can be closed from any thread
+        bg_client = self._http_clients.pop(_BG_LOOP, None) if _BG_LOOP is not None else None
+        if bg_client is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(bg_client.aclose(), _BG_LOOP).result(timeout=5)
+            except Exception as e:
+                logger.warning(f"Failed to close background HTTP client: {e}")
+        
+        if self.persistent_cache:
+            self.persistent_cache.close()
+    
+    async def aclose(self):
+        """Close the pooled HTTP clients, then release everything close() releases"""
+        current_loop = asyncio.get_running_loop()
+        for loop, client in list(self._http_clients.items()):
+            if loop is current_loop:
+                await client.aclose()
+            elif loop is not _BG_LOOP and loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+            else:
+                continue  # Closed loops took their connections with them; close() handles the background loop
+            del self._http_clients[loop]
+        self.close()
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return this event loop's keep-alive HTTP client, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        client = self._http_clients.get(loop)
+        if client is None:
+            # Idle connections are kept long enough to skip TLS handshakes between queries
+            client = self._http_clients[loop] = httpx.AsyncClient(
+                base_url=_IK_API_BASE_URL,
+                headers={"Authorization": f"Token {self.api_token}", "Accept": "application/json"},
+                transport=httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=8, keepalive_expiry=75.0),
+                    retries=3
+                ),
+                timeout=30.0
+            )
+        return client
+    
+    def _get_search_semaphore(self) -> asyncio.Semaphore:
+        """Return this event loop's search concurrency limiter"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._search_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._search_semaphores[loop] = asyncio.Semaphore(self.max_concurrent_searches)
+        return semaphore
+    
+    async def fetch_documents(self, doc_ids: List[str], max_concurrency: int = 8) -> List[ContextualCaseDocument]:
+        """Fetch several case documents concurrently over one connection pool"""
+        doc_ids = list(dict.fromkeys(doc_ids))  # Never pay twice for the same document
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded_fetch(doc_id: str) -> Optional[ContextualCaseDocument]:
+            async with semaphore:
+                return await self._fetch_document(doc_id)
+        
+        documents = await asyncio.gather(*(bounded_fetch(doc_id) for doc_id in doc_ids), return_exceptions=True)
+        
+        fetched = []
+        for doc_id, document in zip(doc_ids, documents):
+            if isinstance(document, Exception):
+                logger.error(f"Failed to fetch document {doc_id}: {document}")
+            elif document is not None:
+                fetched.append(document)
+        return fetched
+    
+    async def _fetch_document(self, doc_id: str) -> Optional[ContextualCaseDocument]:
+        """Fetch a single case document, using the document cache and budget"""
+        cache_key = _cache_key("doc", str(doc_id))
+        if cache_key in self.doc_cache:
+            return self.doc_cache[cache_key]
+        
+        if not self.budget.reserve('document'):
+            logger.warning(f"Budget limit reached, skipping document fetch: {doc_id}")
+            return None
+        
+        # Same citation limits as the IKApi client to control costs
+        response = await self._api_post(
+            f"/doc/{doc_id}/",
+            {"maxcites": self.api_client.maxcites, "maxcitedby": self.api_client.maxcitedby}
+        )
+        data = response.json()
+        
+        if 'errmsg' in data:
+            logger.warning(f"Indian Kanoon document error for {doc_id}: {data['errmsg']}")
+            return None
+        
+        document = ContextualCaseDocument(
+            doc_id=str(doc_id),
+            title=_HTML_TAG_RE.sub('', data.get('title', '')),
+            content=_HTML_TAG_RE.sub('', data.get('doc', '')),
+            court=data.get('docsource', ''),
+            date=data.get('publishdate', ''),
+            citations=[cite.get('title', '') for cite in data.get('citeList') or []],
+            cited_by=[cite.get('title', '') for cite in data.get('citedbyList') or []]
+        )
+        self.doc_cache[cache_key] = document
+        return document
+    
+    async def _api_post(self, path: str, params: Dict[str, Any],
+                        semaphore: Optional[asyncio.Semaphore] = None) -> httpx.Response:
+        """POST to the API within the rate limit, backing off (and slowing the limiter) on 429 responses"""
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            # Wait for a search slot before taking a rate token, so tokens are not spent queueing
+            if semaphore is not None:
+                async with semaphore:
+                    async with self._rate_limiter:
+                        response = await self._get_http().post(path, params=params)
+            else:
+                async with self._rate_limiter:
+                    response = await self._get_http().post(path, params=params)
+            
+            if response.status_code != 429:
+                self._rate_limiter.recover()
+                break
+            
+            self._rate_limiter.throttle()
+            if attempt == _RATE_LIMIT_RETRIES:
+                break
+            
+            # Honour Retry-After when given (in seconds), else back off exponentially
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else 2.0 ** attempt
+            logger.warning(f"Rate limited on {path}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        
+        response.raise_for_status()
+        return response
+    
+    async def _perform_api_search(self, query: str, max_results: int = 5,
+                                  max_age: float = _SEARCH_CACHE_TTL) -> List[EnhancedSearchResult]:
+        """Search Indian Kanoon over the pooled HTTP client, reusing cached results up to max_age seconds old"""
+        cache_key = _cache_key("search", f"{_SEARCH_SCHEMA_VERSION}:{max_results}:{query}")
+        entry = self.search_cache.get(cache_key)
+        if entry is not None and time.time() - entry[0] <= max_age:
+            return entry[1]
+        
+        if self.persistent_cache:
+            entry = self.persistent_cache.get_entry("searches", cache_key, max_age=max_age)
+            if entry is not None:
+                results, stored_at = entry
+                self.search_cache[cache_key] = (stored_at, results)
+                return results
+        
+        if not self.budget.reserve('search'):
+            logger.warning(f"Budget limit reached, skipping search: {query}")
+            return []
         
-        if cache_key in self.classification_cache:
-            return self.classification_cache[cache_key]
+        response = await self._api_post(
+            "/search/",
+            {"formInput": query, "pagenum": 0, "maxpages": self.api_client.maxpages},
+            self._get_search_semaphore()
+        )
+        raw_results = response.text
+        
+        results = self._parse_search_results(raw_results, max_results)
+        self.search_cache[cache_key] = (time.time(), results)
+        if self.persistent_cache:
+            self.persistent_cache.set("searches", cache_key, results)
+        return results
+    
+    def _parse_search_results(self, raw_results: Optional[str], max_results: int) -> List[EnhancedSearchResult]:
+        """Convert a raw Indian Kanoon search response into result records"""
+        try:
+            data = _json_loads(raw_results) if raw_results else {}
+        except (ValueError, TypeError) as e:
+            logger.error(f"Invalid search response from Indian Kanoon: {e}")
+            return []
         
-        classification = self.query_classifier.classify_query(query)
-        self.classification_cache[cache_key] = classification
+        if 'errmsg' in data:
+            logger.warning(f"Indian Kanoon search error: {data['errmsg']}")
+            return []
         
-        return classification
+        return [
+            EnhancedSearchResult(
+                doc_id=str(doc.get('tid', '')),
+                title=_HTML_TAG_RE.sub('', doc.get('title', '')),
+                court=doc.get('docsource', ''),
+                date=doc.get('publishdate', ''),
+                snippet=_HTML_TAG_RE.sub('', doc.get('headline', '')),
+                position=position
+            )
+            for position, doc in enumerate(data.get('docs', [])[:max_results], start=1)
+        ]
     
     async def _handle_critical_query(self, query: str, classification: QueryClassification, 
                                    user_context: Optional[str]) -> Dict[str, Any]:
@@ -331,243 +1196,182 @@ class IndianKanoonClient:
                 "emergency_contacts": self._get_emergency_contacts(classification.query_type),
                 "legal_protections": self._get_legal_protections(classification.query_type)
             },
-            "search_results": emergency_results,
+            "search_results": _public_results(emergency_results),
             "advocate_recommendation": True,
             "disclaimer": "⚠️ URGENT LEGAL MATTER - Seek immediate legal counsel. This is informational only."
         }
     
-    async def _emergency_search(self, query: str, classification: QueryClassification) -> List[Dict[str, Any]]:
+    async def _emergency_search(self, query: str, classification: QueryClassification) -> List[EnhancedSearchResult]:
         """Perform emergency search with priority results"""
         emergency_keywords = [
             "immediate relief", "urgent", "anticipatory bail", "protection order",
             "emergency provisions", "interim relief"
         ]
         
-        enhanced_query = f"{query} {' '.join(emergency_keywords[:3])}"
+        # One sub-query per emergency keyword, capped by what the budget can pay for
+        affordable = min(3, self.budget.remaining_operations('search'))
+        subqueries = [f"{query} {keyword}" for keyword in emergency_keywords[:affordable]]
+        if not subqueries:
+            logger.warning("Budget limit reached, skipping emergency search")
+            return []
+        
+        # Run the sub-queries concurrently so latency is the slowest call, not the sum
+        batches = await asyncio.gather(
+            *(self._perform_api_search(subquery, max_results=10) for subquery in subqueries),
+            return_exceptions=True
+        )
         
-        # Increase search depth for critical queries
-        results = await self._perform_api_search(enhanced_query, max_results=20)
+        results = []
+        for batch in batches:
+            if isinstance(batch, Exception):
+                logger.error(f"Emergency sub-search failed: {batch}")
+                continue
+            results.extend(batch)
         
         # Filter and prioritize results
-        return self._prioritize_emergency_results(results, classification)
+        return self._prioritize_emergency_results(self._deduplicate_results(results), classification)
     
-    def _prioritize_emergency_results(self, results: List[Dict[str, Any]], classification: QueryClassification) -> List[Dict[str, Any]]:
+    def _prioritize_emergency_results(self, results: List[EnhancedSearchResult], classification: QueryClassification) -> List[EnhancedSearchResult]:
         """Prioritize results for emergency queries"""
-        # Tag results with emergency relevance scores
-        for result in results:
-            result["emergency_score"] = self._calculate_emergency_relevance(result, classification)
-            result["relevance_score"] = result["emergency_score"]  # Use emergency score as main relevance
-            
-        # Sort by emergency score
-        sorted_results = sorted(results, key=lambda x: x.get("emergency_score", 0), reverse=True)
+        if not results:
+            return []
+        
+        # Emergency relevance scores, computed for the whole batch at once
+        scores = self._calculate_emergency_relevance_batch(results, classification)
+        
+        # Return top results (higher limit for emergency situations); stable like sorted().
+        # Scores go on copies, as the results may be shared from the search cache
+        top_indices = np.argsort(-scores, kind="stable")[:10]
+        return [
+            replace(results[i], emergency_score=score, relevance_score=score)  # Use emergency score as main relevance
+            for i, score in zip(top_indices.tolist(), scores[top_indices].tolist())
+        ]
+    
+    def _calculate_relevance_batch(self, results: List[EnhancedSearchResult], classification: QueryClassification) -> np.ndarray:
+        """Vectorized _calculate_relevance over a list of results"""
+        contents = np.array([r._content_lower for r in results])
+        courts = np.array([r._court_lower for r in results])
+        
+        # Keyword matching in title and snippet, one column-wise test per keyword
+        keyword_hits = np.zeros(len(results), dtype=np.float64)
+        for keyword in classification.keywords:
+            keyword_hits += np.char.find(contents, keyword.casefold()) >= 0
+        
+        # Court priority tiers
+        court_codes = np.select(
+            [np.char.find(courts, 'supreme court') >= 0,
+             np.char.find(courts, 'high court') >= 0,
+             np.char.find(courts, 'district') >= 0],
+            [1, 2, 3],
+            default=0
+        ).astype(np.int64)
+        
+        # Tokenization stays in Python; the arithmetic runs in the (optionally JIT-compiled) kernel
+        years = np.fromiter((_parse_year(r.date) for r in results), dtype=np.int64, count=len(results))
+        return _relevance_scores(keyword_hits, court_codes, years, datetime.now().year)
+    
+    def _calculate_emergency_relevance_batch(self, results: List[EnhancedSearchResult], classification: QueryClassification) -> np.ndarray:
+        """Vectorized _calculate_emergency_relevance over a list of results"""
+        scores = self._calculate_relevance_batch(results, classification)  # Base relevance
         
-        # Return top results (higher limit for emergency situations)
-        return sorted_results[:10]
+        contents = np.array([r._content_lower for r in results])
+        for keyword, weight in _EMERGENCY_INDICATORS.items():
+            scores += weight * (np.char.find(contents, keyword) >= 0)
+        
+        return scores
     
-    def _calculate_emergency_relevance(self, result: Dict[str, Any], classification: QueryClassification) -> float:
+    def _calculate_emergency_relevance(self, result: EnhancedSearchResult, classification: QueryClassification,
+                                       current_year: Optional[int] = None) -> float:
         """Calculate emergency relevance score"""
-        score = self._calculate_relevance(result, classification)  # Base relevance
+        score = self._calculate_relevance(result, classification, current_year)  # Base relevance
         
         # Additional emergency-specific scoring
-        content = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
-        
-        # Emergency keywords with weights
-        emergency_indicators = {
-            "immediate": 2.0,
-            "urgent": 2.0,
-            "emergency": 2.0,
-            "protection": 1.5,
-            "relief": 1.5,
-            "interim": 1.5,
-            "bail": 1.5,
-            "safety": 1.5,
-            "danger": 2.0,
-            "threat": 2.0,
-        }
+        content = result._content_lower
         
         # Score based on emergency keywords
-        for keyword, weight in emergency_indicators.items():
-            if keyword in content:
-                score += weight
+        for keyword in _find_terms(content, tuple(_EMERGENCY_INDICATORS)):
+            score += _EMERGENCY_INDICATORS[keyword]
         
         return score
     
     def _get_immediate_actions(self, query_type: QueryType) -> List[str]:
         """Get immediate actions based on query type"""
-        common_actions = [
-            "Contact a local lawyer immediately",
-            "Document all relevant evidence and communications"
-        ]
-        
-        actions_by_type = {
-            QueryType.CRIMINAL_LAW: [
-                "If facing arrest, apply for anticipatory bail",
-                "Consult with a criminal defense lawyer",
-                "Do not make statements to police without a lawyer present"
-            ],
-            QueryType.FAMILY_LAW: [
-                "Consider obtaining a protection order if facing threats",
-                "Secure important documents and financial information",
-                "Ensure children's safety and document any incidents"
-            ],
-            QueryType.CONSUMER_PROTECTION: [
-                "File a formal complaint with the service provider/retailer",
-                "Contact consumer protection authorities",
-                "Document all defects and communication with seller"
-            ],
-            QueryType.PROPERTY_LAW: [
-                "File a police complaint if there's forcible dispossession",
-                "Secure property documents and proof of ownership",
-                "Consider filing for emergency injunction"
-            ]
-        }
-        
-        specific_actions = actions_by_type.get(query_type, [])
-        return common_actions + specific_actions[:3]  # Combine common + type-specific actions
+        specific_actions = _IMMEDIATE_ACTIONS.get(query_type, ())
+        return list(_COMMON_IMMEDIATE_ACTIONS + specific_actions[:3])  # Combine common + type-specific actions
     
     def _get_emergency_contacts(self, query_type: QueryType) -> List[Dict[str, str]]:
         """Get relevant emergency contacts based on query type"""
-        common_contacts = [
-            {"name": "Police Emergency", "number": "100"},
-            {"name": "Legal Services Authority", "number": "1516"}
-        ]
-        
-        contacts_by_type = {
-            QueryType.CRIMINAL_LAW: [
-                {"name": "National Legal Services Authority", "number": "1516"},
-                {"name": "Women's Helpline", "number": "181"}
-            ],
-            QueryType.FAMILY_LAW: [
-                {"name": "Women's Helpline", "number": "181"},
-                {"name": "Child Helpline", "number": "1098"}
-            ],
-            QueryType.CONSUMER_PROTECTION: [
-                {"name": "Consumer Helpline", "number": "1800-11-4000"},
-                {"name": "State Consumer Dispute Redressal Commission", "number": "Varies by state"}
-            ],
-            QueryType.PROPERTY_LAW: [
-                {"name": "Local Police Station", "number": "Check local directory"},
-                {"name": "Municipal Corporation", "number": "Varies by city"}
-            ]
-        }
-        
-        specific_contacts = contacts_by_type.get(query_type, [])
-        return common_contacts + specific_contacts
+        specific_contacts = _EMERGENCY_CONTACTS.get(query_type, ())
+        # Copy the shared contact dicts so callers can't mutate the module tables
+        return [dict(contact) for contact in _COMMON_EMERGENCY_CONTACTS + specific_contacts]
     
     def _get_legal_protections(self, query_type: QueryType) -> List[str]:
         """Get relevant legal protections based on query type"""
-        common_protections = [
-            "Constitutional rights under Article 21 (Right to life and liberty)",
-            "Right to legal representation"
-        ]
-        
-        protections_by_type = {
-            QueryType.CRIMINAL_LAW: [
-                "Right to silence under Article 20(3)",
-                "Protection against arbitrary arrest under Article 22",
-                "Right to fair trial under Article 21"
-            ],
-            QueryType.FAMILY_LAW: [
-                "Protection of Women from Domestic Violence Act, 2005",
-                "Maintenance under Section 125 of CrPC",
-                "Child custody protections under Guardian and Wards Act"
-            ],
-            QueryType.CONSUMER_PROTECTION: [
-                "Consumer Protection Act, 2019 protections",
-                "Right to compensation for defective products/services",
-                "Right to file class action suits"
-            ],
-            QueryType.PROPERTY_LAW: [
-                "Protection against forcible dispossession",
-                "Right to peaceful possession under Section 6 of Specific Relief Act",
-                "Right to injunction against interference"
-            ]
-        }
-        
-        specific_protections = protections_by_type.get(query_type, [])
-        return common_protections + specific_protections
+        specific_protections = _LEGAL_PROTECTIONS.get(query_type, ())
+        return list(_COMMON_LEGAL_PROTECTIONS + specific_protections)
     
-    def _deduplicate_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate search results based on document ID"""
-        seen_ids = set()
-        unique_results = []
-        
+    def _deduplicate_results(self, results: List[EnhancedSearchResult]) -> List[EnhancedSearchResult]:
+        """Remove duplicate search results based on document ID, keeping the first occurrence"""
+        # dict preserves insertion order, so one structure does both the seen-set and ordering;
+        # results without a document ID can't be told apart and are dropped
+        unique_results = {}
         for result in results:
-            doc_id = result.get("doc_id")
-            if doc_id not in seen_ids:
-                seen_ids.add(doc_id)
-                unique_results.append(result)
+            doc_id = result.doc_id
+            if doc_id:
+                unique_results.setdefault(doc_id, result)
         
-        return unique_results
+        return list(unique_results.values())
     
     def _synthesize_agentic_response(self, query: str, classification: QueryClassification, 
-                                   search_results: List[Dict[str, Any]], user_context: Optional[str]) -> Dict[str, Any]:
+                                   search_results: List[EnhancedSearchResult], user_context: Optional[str],
+                                   user_context_lower: Optional[str] = None) -> Dict[str, Any]:
         """Synthesize final response with agentic insights"""
-        # Base response structure
-        response = {
+        if user_context:
+            return self._synthesize_with_context(query, classification, search_results, user_context, user_context_lower)
+        return self._synthesize_simple(query, classification, search_results)
+    
+    def _synthesize_simple(self, query: str, classification: QueryClassification,
+                           search_results: List[EnhancedSearchResult]) -> Dict[str, Any]:
+        """Build the response when there is no user context (the common case)"""
+        return {
             "query": query,
             "classification": {
                 "query_type": classification.query_type.value,
                 "urgency": classification.urgency.value,
                 "requires_legal_counsel": classification.requires_legal_counsel
             },
-            "search_results": search_results,
+            "search_results": _public_results(search_results),
             "recommendations": self._generate_recommendations(classification, search_results),
-            "disclaimers": [
-                "This information is for educational purposes only and does not constitute legal advice.",
-                "Consult with a qualified lawyer for specific legal guidance."
-            ],
-            "timestamp": datetime.now().isoformat()
+            "disclaimers": list(_DISCLAIMERS),
+            "timestamp": datetime.now(),
+            # Add next steps based on classification
+            "next_steps": self._generate_next_steps(classification, search_results)
+        }
+    
+    def _synthesize_with_context(self, query: str, classification: QueryClassification,
+                                 search_results: List[EnhancedSearchResult], user_context: str,
+                                 user_context_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Build the response and add analysis of the user's context"""
+        response = self._synthesize_simple(query, classification, search_results)
+        
+        if user_context_lower is None:
+            user_context_lower = user_context.casefold()
+        response["context_analysis"] = {
+            "relevant_factors": self._extract_context_factors(user_context, user_context_lower),
+            "potential_issues": self._identify_potential_issues(user_context, classification, user_context_lower)
         }
-        
-        # Add user context analysis if available
-        if user_context:
-            response["context_analysis"] = {
-                "relevant_factors": self._extract_context_factors(user_context),
-                "potential_issues": self._identify_potential_issues(user_context, classification)
-            }
-        
-        # Add next steps based on classification
-        response["next_steps"] = self._generate_next_steps(classification, search_results)
         
         return response
     
     def _generate_recommendations(self, classification: QueryClassification, 
-                               search_results: List[Dict[str, Any]]) -> List[str]:
+                               search_results: List[EnhancedSearchResult]) -> List[str]:
         """Generate tailored recommendations based on query classification and results"""
-        recommendations = []
-        
         # Add general recommendations based on query type
-        query_type_recs = {
-            QueryType.CONSUMER_PROTECTION: [
-                "File a formal complaint with the business first",
-                "Approach the consumer forum if the complaint is not resolved",
-                "Gather all bills, warranties, and communication as evidence"
-            ],
-            QueryType.CRIMINAL_LAW: [
-                "Consult with a criminal lawyer immediately",
-                "Do not give statements without legal representation",
-                "Understand your rights during investigation and trial"
-            ],
-            QueryType.FAMILY_LAW: [
-                "Consider mediation for family disputes",
-                "Consult a family law specialist",
-                "Focus on documentation and maintaining records"
-            ],
-            QueryType.PROPERTY_LAW: [
-                "Verify property documents and ownership history",
-                "Consider getting a legal title search done",
-                "File appropriate documentation with relevant authorities"
-            ]
-        }
-        
-        # Add recommendations based on query type
-        type_specific = query_type_recs.get(classification.query_type, [])
-        recommendations.extend(type_specific)
+        recommendations = list(_RECOMMENDATIONS_BY_TYPE.get(classification.query_type, ()))
         
         # Add case-law based recommendations if available
         if search_results:
-            recommendations.append(f"Review similar cases from {search_results[0].get('court', 'courts')}")
+            recommendations.append(f"Review similar cases from {search_results[0].court}")
         
         # Add urgency-based recommendations
         if classification.urgency in [UrgencyLevel.HIGH, UrgencyLevel.MEDIUM]:
@@ -575,41 +1379,26 @@ class IndianKanoonClient:
         
         return recommendations
     
-    def _extract_context_factors(self, user_context: str) -> List[str]:
-        """Extract relevant factors from user context"""
+    def _extract_context_factors(self, user_context: str, user_context_lower: Optional[str] = None) -> List[str]:
+        """Extract relevant factors from user context (pass user_context_lower if already computed)"""
         # This is a simplified implementation
         # In production, this would use NLP to extract entities and context
-        factors = []
-        
-        # Look for common legal factors in context
-        if "contract" in user_context.lower():
-            factors.append("Contractual relationship")
-        if "injury" in user_context.lower() or "damage" in user_context.lower():
-            factors.append("Potential damages or injuries")
-        if "evidence" in user_context.lower() or "proof" in user_context.lower():
-            factors.append("Evidentiary considerations")
-        if "time" in user_context.lower() or "deadline" in user_context.lower():
-            factors.append("Time-sensitive elements")
-        
-        return factors
-    
-    def _identify_potential_issues(self, user_context: str, classification: QueryClassification) -> List[str]:
-        """Identify potential legal issues from user context"""
+        if user_context_lower is None:
+            user_context_lower = user_context.casefold()
+        found = _find_terms(user_context_lower, _CONTEXT_TERMS)
+        return [label for label, terms in _CONTEXT_FACTORS if found.intersection(terms)]
+    
+    def _identify_potential_issues(self, user_context: str, classification: QueryClassification,
+                                   user_context_lower: Optional[str] = None) -> List[str]:
+        """Identify potential legal issues from user context (pass user_context_lower if already computed)"""
         # Simplified implementation
-        issues = []
-        
-        # Check for common legal issues
-        if "deadline" in user_context.lower() or "limitation" in user_context.lower():
-            issues.append("Potential statute of limitations concerns")
-        if "jurisdiction" in user_context.lower() or "state" in user_context.lower():
-            issues.append("Jurisdictional considerations")
-        if "document" in user_context.lower():
-            issues.append("Documentation requirements")
-        
-        return issues
+        if user_context_lower is None:
+            user_context_lower = user_context.casefold()
+        found = _find_terms(user_context_lower, _CONTEXT_TERMS)
+        return [label for label, terms in _POTENTIAL_ISSUES if found.intersection(terms)]
     
     def _generate_next_steps(self, classification: QueryClassification, 
-                          search_results: List[Dict[str, Any]]) -> List[str]:
+                          search_results: List[EnhancedSearchResult]) -> List[str]:
         """Generate concrete next steps based on classification"""
         next_steps = []
         
@@ -622,36 +1411,12 @@ class IndianKanoonClient:
             next_steps.append("📋 Research your legal options and document your situation")
         
         # Add query type specific steps
-        query_type_steps = {
-            QueryType.CONSUMER_PROTECTION: [
-                "📋 Gather all receipts, warranty information, and product documentation",
-                "📋 Write a formal complaint letter to the business",
-                "📋 Research the consumer dispute resolution process in your jurisdiction"
-            ],
-            QueryType.CRIMINAL_LAW: [
-                "📋 Do not discuss your case with anyone except your lawyer",
-                "📋 Collect all relevant documents and evidence",
-                "📋 Understand the charges and potential consequences"
-            ],
-            QueryType.FAMILY_LAW: [
-                "📋 Gather all financial documents and records",
-                "📋 Document all communications related to the dispute",
-                "📋 Consider the welfare of any children involved"
-            ],
-            QueryType.PROPERTY_LAW: [
-                "📋 Verify property records at the local registry",
-                "📋 Check for any encumbrances or liens on the property",
-                "📋 Ensure all property taxes and dues are up to date"
-            ]
-        }
-        
-        # Add type-specific steps
-        type_steps = query_type_steps.get(classification.query_type, [])
+        type_steps = _NEXT_STEPS_BY_TYPE.get(classification.query_type, ())
         next_steps.extend(type_steps)
         
         # Add result-based steps if available
         if search_results:
-            court = search_results[0].get('court', 'the relevant court')
+            court = search_results[0].court
             next_steps.append(f"📋 Research similar cases from {court} to understand precedent")
         
         return next_steps
@@ -661,29 +1426,31 @@ class IndianKanoonClient:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit with cleanup"""
-        self.clear_cache()
+        self.close()
     
     async def __aenter__(self):
         """Async context manager entry"""
+        self._get_http()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit with cleanup"""
-        self.clear_cache()
+        await self.aclose()
         
-    def _calculate_relevance(self, result: Dict[str, Any], classification: QueryClassification) -> float:
-        """Calculate relevance score for search result"""
+    def _calculate_relevance(self, result: EnhancedSearchResult, classification: QueryClassification,
+                             current_year: Optional[int] = None) -> float:
+        """Calculate relevance score for search result; callers scoring a batch pass current_year once"""
         score = 0.0
         
         # Keyword matching in title and snippet
-        content = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
+        content = result._content_lower
         
-        for keyword in classification.keywords:
-            if keyword.lower() in content:
-                score += 1.0
+        keywords = [keyword.casefold() for keyword in classification.keywords]
+        found = _find_terms(content, tuple(keywords))
+        score += sum(1.0 for keyword in keywords if keyword in found)
         
         # Court priority scoring
-        court = result.get('court', '').lower()
+        court = result._court_lower
         if 'supreme court' in court:
             score += 2.0
         elif 'high court' in court:
@@ -692,16 +1459,13 @@ class IndianKanoonClient:
             score += 1.0
             
         # Date recency scoring
-        date = result.get('date', '')
-        try:
-            if date and len(date) > 4:  # Valid date format
-                year = int(date[-4:])  # Extract year from end of date string
+        year = _parse_year(result.date)
+        if year:
+            if current_year is None:
                 current_year = datetime.now().year
-                # More recent cases get higher scores
-                recency_score = 1.0 - (0.05 * (current_year - year))  # 5% deduction per year
-                score += max(0, recency_score)  # Ensure non-negative
-        except (ValueError, TypeError):
-            pass  # Ignore date parsing errors
+            # More recent cases get higher scores
+            recency_score = 1.0 - (0.05 * (current_year - year))  # 5% deduction per year
+            score += max(0, recency_score)  # Ensure non-negative
             
         return score
     
@@ -721,43 +1485,23 @@ class IndianKanoonClient:
                 "Visit your nearest legal aid center",
                 "Check legal aid websites for similar cases"
             ],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
     
     # Legacy method for backward compatibility
-    def search(self, query: str, max_results: int = 5) -> List[SearchResult]:
+    def search(self, query: str, max_results: int = 5) -> List[EnhancedSearchResult]:
         """
         Legacy search method for backward compatibility.
         For new implementations, use agentic_search() instead.
         """
+        # Run on the shared background loop so connection pools persist across sync callers;
+        # async callers should await _perform_api_search() directly
+        future = asyncio.run_coroutine_threadsafe(self._perform_api_search(query, max_results), _background_loop())
         try:
-            # Convert to async call
-            import asyncio
-            if asyncio.get_event_loop().is_running():
-                # If already in async context, create new event loop
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                results = loop.run_until_complete(self._perform_api_search(query, max_results))
-                loop.close()
-            else:
-                results = asyncio.run(self._perform_api_search(query, max_results))
-            
-            # Convert to SearchResult objects for backward compatibility
-            search_results = []
-            for result in results:
-                search_result = SearchResult(
-                    doc_id=result["doc_id"],
-                    title=result["title"],
-                    court=result["court"],
-                    date=result["date"],
-                    snippet=result["snippet"],
-                    position=result["position"]
-                )
-                search_results.append(search_result)
-            
-            return search_results
+            return future.result(timeout=_SYNC_SEARCH_TIMEOUT)
             
         except Exception as e:
+            future.cancel()
             logger.error(f"Search error: {e}")
             return []
             
@@ -765,98 +1509,50 @@ class IndianKanoonClient:
     class QueryClassifier:
         """Intelligent query classification for agentic routing"""
         
+        # Stateless: no per-instance dict
+        __slots__ = ()
+        
         def __init__(self):
-            # Legal keywords mapping for classification
-            self.classification_rules = {
-                QueryType.CONSUMER_PROTECTION: {
-                    "keywords": ["purchase", "bottle", "price", "consumer", "overcharge", "defective product", 
-                               "warranty", "refund", "service deficiency", "product liability"],
-                    "legal_sections": ["Consumer Protection Act 2019", "Legal Metrology Act"],
-                    "urgency_indicators": ["financial loss", "health risk"]
-                },
-                QueryType.CRIMINAL_LAW: {
-                    "keywords": ["rape case", "false case", "extortion", "blackmail", "threat", "assault", 
-                               "harassment", "dowry", "domestic violence", "fraud"],
-                    "legal_sections": ["IPC", "CrPC", "Protection of Women Act"],
-                    "urgency_indicators": ["immediate threat", "safety risk", "ongoing harassment"]
-                },
-                QueryType.FAMILY_LAW: {
-                    "keywords": ["divorce", "marriage", "custody", "maintenance", "alimony", "adoption",
-                               "property settlement", "domestic disputes"],
-                    "legal_sections": ["Hindu Marriage Act", "Special Marriage Act", "Family Courts Act"],
-                    "urgency_indicators": ["child welfare", "domestic violence"]
-                },
-                QueryType.PROPERTY_LAW: {
-                    "keywords": ["property", "land", "ownership", "title", "registration", "partition",
-                               "easement", "encroachment", "possession"],
-                    "legal_sections": ["Transfer of Property Act", "Registration Act", "Land Acquisition Act"],
-                    "urgency_indicators": ["illegal occupation", "forced eviction"]
-                }
-            }
-        
-        def classify_query(self, query: str) -> QueryClassification:
-            """Classify query using rule-based approach with scoring"""
-            query_lower = query.lower()
-            scores = {}
-            
-            # Calculate scores for each query type
-            for query_type, rules in self.classification_rules.items():
-                score = 0
-                matched_keywords = []
-                urgency_indicators = []
-                
-                # Keyword matching
-                for keyword in rules["keywords"]:
-                    if keyword in query_lower:
-                        score += 1
-                        matched_keywords.append(keyword)
-                
-                # Urgency detection
-                for indicator in rules["urgency_indicators"]:
-                    if indicator in query_lower:
-                        urgency_indicators.append(indicator)
-                        score += 2  # Higher weight for urgency
-                
-                if score > 0:
-                    scores[query_type] = {
-                        "score": score,
-                        "keywords": matched_keywords,
-                        "urgency_indicators": urgency_indicators
-                    }
+            # Rules are compiled once at module level into the flat _QT_* tables
+            pass
+        
+        def classify_query(self, query: str, query_lower: Optional[str] = None) -> QueryClassification:
+            """Classify query using rule-based approach with scoring; pass query_lower if already casefolded"""
+            if query_lower is None:
+                query_lower = query.casefold()
+            query_lower = query_lower.strip(_QUERY_EDGE_CHARS)
             
-            # Determine best match
-            if not scores:
+            # Single (memoized) pass over the query for all categories, urgency markers and counsel indicators
+            index, score, keywords, urgency_indicators, found = _score_query(query_lower)
+            if index is None:
                 return self._default_classification(query)
             
-            best_match = max(scores.items(), key=lambda x: x[1]["score"])
-            query_type, match_data = best_match
-            
             # Determine urgency level
-            urgency = self._calculate_urgency(query_lower, match_data["urgency_indicators"])
+            urgency = self._calculate_urgency(query_lower, urgency_indicators, found)
             
             # Determine if legal counsel is required
-            requires_legal_counsel = self._needs_legal_counsel(query_lower, urgency)
+            requires_legal_counsel = self._needs_legal_counsel(query_lower, urgency, found)
             
             # Calculate confidence based on score
-            confidence = min(0.5 + (best_match[1]["score"] * 0.1), 0.95)
+            confidence = min(0.5 + (score * 0.1), 0.95)
             
             # Calculate priority score
-            priority_score = best_match[1]["score"]
+            priority_score = score
             if urgency == UrgencyLevel.HIGH:
                 priority_score += 10
             elif urgency == UrgencyLevel.MEDIUM:
                 priority_score += 5
             
             return QueryClassification(
-                query_type=query_type,
-                keywords=match_data["keywords"],
+                query_type=_QT_INDEX[index],
+                keywords=keywords,
                 urgency=urgency,
                 requires_legal_counsel=requires_legal_counsel,
                 confidence=confidence,
                 jurisdiction="india",
                 search_context=SearchContext.GENERAL,
                 priority_score=priority_score,
-                legal_sections=self.classification_rules[query_type]["legal_sections"]
+                legal_sections=_QT_SECTIONS[index]
             )
         
         def _default_classification(self, query: str) -> QueryClassification:
@@ -864,79 +1560,98 @@ class IndianKanoonClient:
             # Default to general legal query with low urgency
             return QueryClassification(
                 query_type=QueryType.GENERAL,
-                keywords=[],
+                keywords=(),
                 urgency=UrgencyLevel.LOW,
                 requires_legal_counsel=False,
                 confidence=0.5,
                 jurisdiction="india",
                 search_context=SearchContext.GENERAL,
                 priority_score=0,
-                legal_sections=[]
+                legal_sections=()
             )
         
-        def _calculate_urgency(self, query: str, urgency_indicators: List[str]) -> UrgencyLevel:
-            """Determine urgency level based on indicators and language"""
-            # Check for explicit urgency markers
-            explicit_urgency = ["urgent", "emergency", "immediate", "critical", "life threatening"]
+        def _calculate_urgency(self, query: str, urgency_indicators: Tuple[str, ...],
+                               found: Optional[AbstractSet[str]] = None) -> UrgencyLevel:
+            """Determine urgency level based on indicators and language; found is the matcher's hits for query"""
+            # Several urgency indicators settle it without looking at the markers
+            if len(urgency_indicators) > 1:
+                return UrgencyLevel.HIGH
             
-            if any(marker in query for marker in explicit_urgency) or len(urgency_indicators) > 1:
+            if found is None:
+                found = _CLASSIFIER_MATCHER.find(query)
+            
+            # Check for explicit urgency markers (a set intersection, not a scan per marker)
+            if not found.isdisjoint(_EXPLICIT_URGENCY_MARKERS):
                 return UrgencyLevel.HIGH
             elif urgency_indicators:
                 return UrgencyLevel.MEDIUM
             else:
                 return UrgencyLevel.LOW
         
-        def _needs_legal_counsel(self, query: str, urgency: UrgencyLevel) -> bool:
-            """Determine if query needs professional legal counsel"""
-            legal_counsel_indicators = [
-                "court case", "lawsuit", "legal notice", "sue", "trial", "hearing date", 
-                "summons", "warrant", "police complaint", "fir", "arrest", "bail"
-            ]
+        def _needs_legal_counsel(self, query: str, urgency: UrgencyLevel,
+                                 found: Optional[AbstractSet[str]] = None) -> bool:
+            """Determine if query needs professional legal counsel; found is the matcher's hits for query"""
+            # High urgency situations likely need a lawyer
+            if urgency == UrgencyLevel.HIGH:
+                return True
             
-            # Complex legal issues or high urgency situations likely need a lawyer
-            return any(indicator in query for indicator in legal_counsel_indicators) or urgency == UrgencyLevel.HIGH
+            if found is None:
+                found = _CLASSIFIER_MATCHER.find(query)
+            
+            # So do complex legal issues
+            return not found.isdisjoint(_LEGAL_COUNSEL_INDICATORS)
     
     class AgenticSearchEngine:
         """Search strategy engine for optimized legal queries"""
         
+        # Stateless: no per-instance dict
+        __slots__ = ()
+        
         def __init__(self):
             pass
             
-        def create_search_strategy(self, classification: QueryClassification, user_context: Optional[str] = None) -> AgenticSearchStrategy:
-            """Create optimal search strategy based on query classification"""
-            query_type = classification.query_type
-            urgency = classification.urgency
+        def create_search_strategy(self, classification: QueryClassification, user_context: Optional[str] = None,
+                                   user_context_lower: Optional[str] = None) -> AgenticSearchStrategy:
+            """Create optimal search strategy based on query classification (pass user_context_lower if already computed)"""
+            # The context only contributes its (at most three) extracted keywords
+            context_keywords = ()
+            if user_context:
+                if user_context_lower is None:
+                    user_context_lower = user_context.casefold()
+                context_keywords = tuple(self._extract_context_keywords(user_context_lower))
             
+            return self._build_strategy(classification.query_type, classification.urgency,
+                                        classification.keywords, classification.legal_sections, context_keywords)
+        
+        @staticmethod
+        @lru_cache(maxsize=512)
+        def _build_strategy(query_type: QueryType, urgency: UrgencyLevel, keywords: Tuple[str, ...],
+                            legal_sections: Tuple[str, ...], context_keywords: Tuple[str, ...]) -> AgenticSearchStrategy:
+            """Build (and memoize) the strategy for a classification's hashable parts"""
             # Default search parameters
-            primary_keywords = classification.keywords
-            secondary_keywords = []
-            legal_sections = classification.legal_sections
+            primary_keywords = keywords + context_keywords
+            secondary_keywords = ()
             case_type_filter = "all"
             max_results = 5
             search_depth = "shallow"
-            priority_courts = []
-            
-            # Enhance keywords based on user context if provided
-            if user_context:
-                context_keywords = self._extract_context_keywords(user_context.lower())
-                primary_keywords.extend(context_keywords)
+            priority_courts = ()
             
             # Adjust strategy based on query type
             if query_type == QueryType.CONSUMER_PROTECTION:
-                secondary_keywords = ["consumer forum", "district commission", "complaint", "compensation"]
-                priority_courts = ["National Consumer Disputes Redressal Commission", "Supreme Court"]
+                secondary_keywords = ("consumer forum", "district commission", "complaint", "compensation")
+                priority_courts = ("National Consumer Disputes Redressal Commission", "Supreme Court")
                 
             elif query_type == QueryType.CRIMINAL_LAW:
-                secondary_keywords = ["bail", "arrest", "custody", "investigation", "evidence"]
-                priority_courts = ["Supreme Court", "High Court"]
+                secondary_keywords = ("bail", "arrest", "custody", "investigation", "evidence")
+                priority_courts = ("Supreme Court", "High Court")
                 
             elif query_type == QueryType.FAMILY_LAW:
-                secondary_keywords = ["divorce", "maintenance", "custody", "alimony"]
-                priority_courts = ["High Court", "Family Court"]
+                secondary_keywords = ("divorce", "maintenance", "custody", "alimony")
+                priority_courts = ("High Court", "Family Court")
                 
             elif query_type == QueryType.PROPERTY_LAW:
-                secondary_keywords = ["title", "possession", "registration", "transfer"]
-                priority_courts = ["High Court", "Civil Court"]
+                secondary_keywords = ("title", "possession", "registration", "transfer")
+                priority_courts = ("High Court", "Civil Court")
             
             # Adjust based on urgency
             if urgency == UrgencyLevel.HIGH:
@@ -961,25 +1676,24 @@ class IndianKanoonClient:
             """Extract relevant keywords from user context"""
             context_keywords = []
             
-            # Common legal context indicators
-            legal_indicators = {
-                "contract": ["agreement", "breach", "terms"],
-                "injury": ["accident", "medical", "negligence"],
-                "property": ["ownership", "title", "dispute"],
-                "employment": ["workplace", "salary", "termination"],
-                "family": ["spouse", "children", "inheritance"]
-            }
-            
-            for indicator, related_keywords in legal_indicators.items():
-                if indicator in context:
+            # One scan of the context for every indicator, then stop once the limit is reached
+            found = _find_terms(context, _LEGAL_INDICATOR_TERMS)
+            for indicator, related_keywords in _LEGAL_INDICATORS.items():
+                if indicator in found:
                     context_keywords.extend(related_keywords)
+                    if len(context_keywords) >= 3:
+                        break
             
             return context_keywords[:3]  # Limit to avoid query bloat
 
     async def _execute_strategic_search(self, query: str, search_strategy: AgenticSearchStrategy, 
-                                   classification: QueryClassification) -> List[Dict[str, Any]]:
+                                   classification: QueryClassification) -> List[EnhancedSearchResult]:
         """Execute search using the strategic approach"""
         try:
+            # Deep strategies also search each priority court concurrently
+            if search_strategy.search_depth == "deep":
+                return await self._execute_strategic_search_fanout(query, search_strategy, classification)
+            
             # Construct enhanced query using strategy
             enhanced_query = self._build_strategic_query(query, search_strategy)
             
@@ -996,6 +1710,32 @@ class IndianKanoonClient:
             # Fallback to simple search
             return await self._perform_api_search(query, 5)
 
+    async def _execute_strategic_search_fanout(self, query: str, search_strategy: AgenticSearchStrategy,
+                                               classification: QueryClassification) -> List[EnhancedSearchResult]:
+        """Run the strategic query plus one query per priority court concurrently (accepting only
+        recently cached results, as deep searches serve urgent queries), then merge and score"""
+        subqueries = [self._build_strategic_query(query, search_strategy)]
+        subqueries.extend(f"{query} {court}" for court in search_strategy.priority_courts)
+        
+        # Never fan out further than the budget can pay for
+        subqueries = subqueries[:max(1, self.budget.remaining_operations('search'))]
+        
+        # Latency is the slowest sub-search, not the sum; the search semaphore bounds server load
+        batches = await asyncio.gather(
+            *(self._perform_api_search(subquery, search_strategy.max_results, max_age=_FRESH_SEARCH_TTL)
+              for subquery in subqueries),
+            return_exceptions=True
+        )
+        
+        results = []
+        for batch in batches:
+            if isinstance(batch, Exception):
+                logger.error(f"Strategic sub-search failed: {batch}")
+                continue
+            results.extend(batch)
+        
+        return self._score_results_with_strategy(self._deduplicate_results(results), search_strategy, classification)
+
     def _build_strategic_query(self, query: str, strategy: AgenticSearchStrategy) -> str:
         """Build enhanced query using search strategy"""
         query_parts = [query]
@@ -1010,32 +1750,31 @@ class IndianKanoonClient:
         
         return " ".join(query_parts)
 
-    def _score_results_with_strategy(self, results: List[Dict[str, Any]], 
+    def _score_results_with_strategy(self, results: List[EnhancedSearchResult], 
                                strategy: AgenticSearchStrategy, 
-                               classification: QueryClassification) -> List[Dict[str, Any]]:
+                               classification: QueryClassification) -> List[EnhancedSearchResult]:
         """Score results based on strategic alignment"""
-        scored_results = []
+        if not results:
+            return []
         
-        for result in results:
-            # Base score from relevance calculation
-            base_score = self._calculate_relevance(result, classification)
-            
+        scores = []
+        current_year = datetime.now().year
+        priority_courts_lower = strategy.priority_courts_lower
+        
+        # Base scores from relevance calculation, vectorized over the batch (fan-outs return many results)
+        base_scores = self._calculate_relevance_batch(results, classification).tolist()
+        
+        for result, base_score in zip(results, base_scores):
             # Court priority bonus
-            court = result.get('court', '').lower()
-            if court in [c.lower() for c in strategy.priority_courts]:
+            if result._court_lower in priority_courts_lower:
                 base_score += 1.5  # Bonus for priority courts
             
             # Recency bonus
-            date = result.get('date', '')
-            try:
-                if date and len(date) > 4:  # Valid date format
-                    year = int(date[-4:])  # Extract year from end of date string
-                    current_year = datetime.now().year
-                    # More recent cases get higher scores
-                    recency_bonus = max(0, 1.0 - (0.05 * (current_year - year)))  # 5% deduction per year
-                    base_score += recency_bonus
-            except (ValueError, TypeError):
-                pass  # Ignore date parsing errors
+            year = _parse_year(result.date)
+            if year:
+                # More recent cases get higher scores
+                recency_bonus = max(0, 1.0 - (0.05 * (current_year - year)))  # 5% deduction per year
+                base_score += recency_bonus
             
             # Strategic scoring adjustments
             if strategy.search_depth == "deep":
@@ -1044,14 +1783,10 @@ class IndianKanoonClient:
                 base_score *= 0.9  # Decrease weight for shallow searches
             
             # Ensure non-negative score
-            final_score = max(0, base_score)
-            
-            # Add score to result
-            result["strategic_score"] = final_score
-            scored_results.append(result)
-        
-        # Sort results by strategic score (highest first)
-        sorted_scored_results = sorted(scored_results, key=lambda x: x.get("strategic_score", 0), reverse=True)
+            scores.append(max(0, base_score))
         
-        # Return top results
-        return sorted_scored_results[:strategy.max_results]
+        # Return top results by strategic score (highest first, ties in original order);
+        # a partial heap sort since max_results is small next to a fan-out's result count.
+        # Only the returned results are scored, on copies, as the originals may be shared from the search cache
+        top_indices = heapq.nlargest(strategy.max_results, range(len(results)), key=scores.__getitem__)
+        return [replace(results[i], strategic_score=scores[i]) for i in top_indices]
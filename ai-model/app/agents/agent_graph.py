@@ -2,11 +2,21 @@
 Agent Graph - LangGraph Implementation for Interactive LegalLink AI
 Following Technical Flow: Agentic Conversation System
 """
-from typing import Dict, List, Optional, Any, TypedDict, Annotated
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, TypedDict, Annotated
 import operator
 from datetime import datetime
 import logging
+import os
 import asyncio
+import copy
+import hashlib
+import itertools
+import re
+import time
+import weakref
+from collections import ChainMap, OrderedDict
+from dataclasses import replace
+from functools import lru_cache
 
 # LangGraph imports (if available, otherwise use our custom implementation)
 try:
@@ -19,47 +29,208 @@ except ImportError:
     pass
 
 from .legal_agents import (
-    AgentState, DialogueAgent, ClassificationAgent, ClarificationAgent,
+    AgentState, BaseAgent, DialogueAgent, ClassificationAgent, ClarificationAgent,
     LegalReasoningAgent, RiskAssessmentAgent, RecommendationAgent,
-    ContextAgent, ProgressAgent, MemoryAgent
+    ContextAgent, ProgressAgent, MemoryAgent, has_location
 )
+from app.models import UserContext, ConversationStage, UrgencyLevel, MessageType
+from app.utils import classify_legal_domain, get_current_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Agents that open every turn; they touch disjoint parts of the state so they run together
+INTAKE_AGENTS = ("context", "dialogue")
+
+# Specialized agents that run concurrently once a message has been classified
+SPECIALIZED_AGENTS = ("clarification", "legal_reasoning", "risk_assessment", "recommendation")
+
+# Upper bound on agent calls in flight across all sessions handled by a graph
+AGENT_LLM_CONCURRENCY = int(os.getenv("AGENT_LLM_CONCURRENCY", "6"))
+
+# Conversation stages in which the flow keeps gathering input
+_CONTINUE_STAGES = frozenset({"greeting", "information_gathering"})
+
+# Number of recent turns handed to the agents; older turns survive only as a rolling summary
+AGENT_HISTORY_WINDOW = int(os.getenv("AGENT_HISTORY_WINDOW", "6"))
+
+# Specialized agent selection thresholds
+CLARIFICATION_CONFIDENCE_THRESHOLD = 0.75
+_RISK_URGENCY_LEVELS = frozenset({UrgencyLevel.HIGH, UrgencyLevel.CRITICAL})
+_RISK_LEGAL_DOMAINS = frozenset({"criminal"})
+
+# AgentState fields a specialized agent may overwrite on its own branch
+_MERGED_FIELDS = (
+    "conversation_stage", "extracted_entities", "intent", "confidence",
+    "urgency_level", "legal_domain", "next_action"
+)
+
+# Messages that are nothing but a greeting, a sign-off or feedback skip the agent pipeline;
+# matched against the whole message, so "hi, my landlord evicted me" is not a greeting
+_GREETING_PATTERN = re.compile(
+    r"^\s*(?:hi|hello|hey|namaste|namaskar|good\s+(?:morning|afternoon|evening))(?:\s+there)?[\s!.,]*$",
+    re.IGNORECASE
+)
+_CLOSING_PATTERN = re.compile(
+    r"^\s*(?:(?:ok(?:ay)?\s+)?(?:thanks|thank\s+you|thx)(?:\s+(?:so\s+much|a\s+lot))?|bye|goodbye|good\s+bye|see\s+you)[\s!.,]*$",
+    re.IGNORECASE
+)
+_SATISFACTION_PATTERN = re.compile(
+    r"^\s*(?:(?:ok(?:ay)?|yes|great)[\s,!.]+)?(?:that\s+(?:was\s+|is\s+)?(?:very\s+|really\s+)?(?:helpful|useful)"
+    r"|that\s+helps|very\s+(?:helpful|useful)|great\s+answer|(?:i\s+am\s+|im\s+)?satisfied|helpful)[\s!.,]*$",
+    re.IGNORECASE
+)
+_SOCIAL_PATTERNS = (
+    ("greeting", _GREETING_PATTERN),
+    ("closing", _CLOSING_PATTERN),
+    ("satisfaction", _SATISFACTION_PATTERN)
+)
+
+def match_social_message(message: str) -> Optional[str]:
+    """The kind of social message ("greeting", "closing" or "satisfaction") the whole message is, if any"""
+    for kind, pattern in _SOCIAL_PATTERNS:
+        if pattern.match(message):
+            return kind
+    return None
+
+# Response templates
+GREETING_TEMPLATES = (
+    "Hello! I'm your Legal AI Assistant. I'm here to help you with your legal questions and connect you with qualified advocates.",
+    "Welcome to LegalLink AI! How can I assist you with your legal matter today?",
+    "Hi there! I'm here to provide legal guidance and help you find the right advocate for your case."
+)
+CLOSING_RESPONSE = "You're welcome! Feel free to come back anytime you need help with a legal matter."
+CLARIFICATION_PREFIX = "I'd like to better understand your situation to provide the most helpful guidance. "
+CLARIFICATION_FALLBACK = "Could you provide more details about your legal issue?"
+RECOMMENDATION_INTRO = "Based on your legal issue, I recommend the following:\n\n"
+RECOMMENDATION_OUTRO = "\nWould you like me to help you find qualified advocates in your area?"
+DOMAIN_RESPONSE_TEMPLATE = "I understand you have a {domain} related matter. Let me help you with that."
+GENERAL_RESPONSE = "I'm here to help with your legal question. Could you tell me more about your situation?"
+
+# Response cache lifetime per next action, in seconds
+RESPONSE_CACHE_TTLS = {
+    "provide_greeting": 300,
+    "request_clarification": 900,
+    "provide_legal_guidance": 3600,
+    "recommend_advocates": 3600
+}
+DEFAULT_RESPONSE_CACHE_TTL = 600
+RESPONSE_CACHE_SIZE = int(os.getenv("AGENT_RESPONSE_CACHE_SIZE", "1024"))
+
+# Last formatted response timestamp, as [epoch seconds, ISO string]
+_timestamp_cache = [0.0, ""]
+
+def _now_iso() -> str:
+    """Current local time in ISO format; response timestamps only need millisecond precision"""
+    now = time.time()
+    if now - _timestamp_cache[0] >= 0.001:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.fromtimestamp(now).isoformat()
+    return _timestamp_cache[1]
+
+def _number_turns(conversation_history: List[Dict[str, Any]], memory: Dict[str, Any]) -> None:
+    """Give the history entries added since the last message increasing turn ids, which survive trimming"""
+    start = len(conversation_history)
+    while start and "turn_id" not in conversation_history[start - 1]:
+        start -= 1
+    
+    # Ids continue from the newest numbered turn, or past the summary if the history no longer has one
+    if start:
+        next_id = conversation_history[start - 1]["turn_id"] + 1
+    else:
+        next_id = memory.get("summarized_through", -1) + 1
+    for turn_id, entry in enumerate(conversation_history[start:], next_id):
+        entry["turn_id"] = turn_id
+
+class ResponseCache:
+    """LRU cache of graph responses for opening messages, with per-entry TTL"""
+    
+    def __init__(self, max_size: int = RESPONSE_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached entry if it has not expired"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return None
+        
+        self.entries.move_to_end(key)
+        return value
+    
+    def put(self, key: str, value: Dict[str, Any], ttl: float):
+        """Store an entry, evicting the least recently used one when full"""
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
 class AgentGraphState(TypedDict):
-    """State structure for the agent graph"""
-    session_id: str
-    user_id: str
-    current_message: str
-    conversation_history: List[Dict[str, Any]]
-    user_context: Dict[str, Any]
-    conversation_stage: str
-    extracted_entities: Dict[str, Any]
-    intent: str
-    confidence: float
-    urgency_level: str
-    legal_domain: str
-    next_action: str
-    response_data: Dict[str, Any]
-    memory: Dict[str, Any]
+    """State structure for the agent graph - agents read and update the AgentState in place"""
+    agent_state: AgentState
     flow_decision: str
     processing_complete: bool
 
+# Agent implementations by graph role
+AGENT_CLASSES = {
+    "dialogue": DialogueAgent,
+    "classification": ClassificationAgent,
+    "clarification": ClarificationAgent,
+    "legal_reasoning": LegalReasoningAgent,
+    "risk_assessment": RiskAssessmentAgent,
+    "recommendation": RecommendationAgent,
+    "context": ContextAgent,
+    "progress": ProgressAgent,
+    "memory": MemoryAgent
+}
+
+@lru_cache(maxsize=1)
+def _build_agents() -> Dict[str, BaseAgent]:
+    """Construct the agent set once per process; agents hold no per-conversation state"""
+    return {name: agent_class() for name, agent_class in AGENT_CLASSES.items()}
+
 class AgentGraph:
     """Main agent orchestration graph following the technical flow"""
     
-    def __init__(self):
-        self.agents = {
-            "dialogue": DialogueAgent(),
-            "classification": ClassificationAgent(),
-            "clarification": ClarificationAgent(),
-            "legal_reasoning": LegalReasoningAgent(),
-            "risk_assessment": RiskAssessmentAgent(),
-            "recommendation": RecommendationAgent(),
-            "context": ContextAgent(),
-            "progress": ProgressAgent(),
-            "memory": MemoryAgent()
-        }
+    _instance: Optional["AgentGraph"] = None
+    
+    # Response builder per next action; looked up by name so subclasses can override builders
+    _RESPONSE_BUILDERS = {
+        "provide_greeting": "_generate_greeting_response",
+        "request_clarification": "_generate_clarification_response",
+        "provide_legal_guidance": "_generate_guidance_response",
+        "recommend_advocates": "_generate_recommendation_response"
+    }
+    
+    @classmethod
+    def get(cls) -> "AgentGraph":
+        """Return the process-wide graph, building and compiling it on first use"""
+        # Look in the class's own namespace so subclasses get their own instance
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = cls._instance = cls()
+        return instance
+    
+    def __init__(self, agents: Optional[Dict[str, BaseAgent]] = None):
+        # Shared agents by default; injected ones override by role. Copy so the shared set stays intact
+        self.agents = {**_build_agents(), **(agents or {})}
+        
+        # Shared across sessions so concurrent conversations cannot multiply in-flight calls
+        self._llm_sem = asyncio.Semaphore(AGENT_LLM_CONCURRENCY)
+        self.response_cache = ResponseCache()
+        
+        # One lock per active session; entries vanish once no turn holds them
+        self._session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        
+        # Memory writes still in flight, by session
+        self._pending_writes: Dict[str, asyncio.Task] = {}
+        
+        # Greetings rotate through the templates rather than being drawn at random
+        self._greetings = itertools.cycle(GREETING_TEMPLATES)
         
         self.graph = None
         self._build_graph()
@@ -76,40 +247,28 @@ class AgentGraph:
         workflow = StateGraph(AgentGraphState)
         
         # Add nodes for each processing stage
-        workflow.add_node("context_agent", self._context_agent_node)
+        workflow.add_node("intake_fanout", self._intake_fanout_node)
         workflow.add_node("dialogue_agent", self._dialogue_agent_node)
         workflow.add_node("classification_agent", self._classification_agent_node)
-        workflow.add_node("clarification_agent", self._clarification_agent_node)
-        workflow.add_node("legal_reasoning_agent", self._legal_reasoning_agent_node) 
-        workflow.add_node("risk_assessment_agent", self._risk_assessment_agent_node)
-        workflow.add_node("recommendation_agent", self._recommendation_agent_node)
-        workflow.add_node("memory_agent", self._memory_agent_node)
+        workflow.add_node("specialized_fanout", self._specialized_fanout_node)
         workflow.add_node("progress_agent", self._progress_agent_node)
         workflow.add_node("flow_decision", self._flow_decision_node)
         
         # Define the flow following the technical architecture
-        workflow.set_entry_point("context_agent")
+        workflow.set_entry_point("intake_fanout")
         
-        # Context → Dialogue
-        workflow.add_edge("context_agent", "dialogue_agent")
+        # Context + Dialogue (concurrently) → Classification
+        workflow.add_edge("intake_fanout", "classification_agent")
         
-        # Dialogue → Classification
+        # Dialogue → Classification, for turns looping back from the flow decision
         workflow.add_edge("dialogue_agent", "classification_agent")
         
-        # Classification → Parallel processing of specialized agents
-        workflow.add_edge("classification_agent", "clarification_agent")
-        workflow.add_edge("classification_agent", "legal_reasoning_agent")
-        workflow.add_edge("classification_agent", "risk_assessment_agent")
-        workflow.add_edge("classification_agent", "recommendation_agent")
+        # Classification → Parallel processing of specialized agents (single fan-out node,
+        # since plain edges would run them one after another)
+        workflow.add_edge("classification_agent", "specialized_fanout")
         
-        # All specialized agents → Memory
-        workflow.add_edge("clarification_agent", "memory_agent")
-        workflow.add_edge("legal_reasoning_agent", "memory_agent")
-        workflow.add_edge("risk_assessment_agent", "memory_agent") 
-        workflow.add_edge("recommendation_agent", "memory_agent")
-        
-        # Memory → Progress
-        workflow.add_edge("memory_agent", "progress_agent")
+        # Specialized agents → Progress (memory is written behind the response)
+        workflow.add_edge("specialized_fanout", "progress_agent")
         
         # Progress → Flow Decision
         workflow.add_edge("progress_agent", "flow_decision")
@@ -129,13 +288,12 @@ class AgentGraph:
     def _build_custom_graph(self):
         """Build custom graph execution when LangGraph is not available"""
         self.execution_order = [
-            "context_agent",
-            "dialogue_agent", 
-            "classification_agent",
-            # Parallel processing
-            ["clarification_agent", "legal_reasoning_agent", "risk_assessment_agent", "recommendation_agent"],
-            "memory_agent",
-            "progress_agent",
+            # Context and dialogue together
+            list(INTAKE_AGENTS),
+            "classification",
+            # Parallel processing of the specialized agents this message needs
+            "specialized",
+            "progress",
             "flow_decision"
         ]
     
@@ -149,103 +307,378 @@ class AgentGraph:
         memory: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Process a user message through the agent graph"""
-        
-        # Initialize state
-        initial_state = AgentGraphState(
-            session_id=session_id,
-            user_id=user_id,
-            current_message=message,
-            conversation_history=conversation_history,
-            user_context=user_context,
-            conversation_stage="greeting",
-            extracted_entities={},
-            intent="",
-            confidence=0.0,
-            urgency_level="LOW",
-            legal_domain="",
-            next_action="",
-            response_data={},
-            memory=memory,
-            flow_decision="",
-            processing_complete=False
-        )
-        
-        if LANGGRAPH_AVAILABLE and self.graph:
-            # Use LangGraph execution
-            result = await self.graph.ainvoke(initial_state)
-            return result
-        else:
-            # Use custom execution
-            return await self._execute_custom_graph(initial_state)
+        response = None
+        async for frame in self.stream_message(
+            session_id, user_id, message, conversation_history, user_context, memory
+        ):
+            response = frame
+        return response
     
-    async def _execute_custom_graph(self, state: AgentGraphState) -> Dict[str, Any]:
-        """Execute the graph using custom implementation"""
-        agent_state = self._convert_to_agent_state(state)
+    async def stream_message(
+        self,
+        session_id: str,
+        user_id: str,
+        message: str,
+        conversation_history: List[Dict[str, Any]],
+        user_context: Dict[str, Any],
+        memory: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Process a user message, yielding a partial frame once it is classified and the full response last"""
+        # Turns of one session run one at a time; they share its history and memory
+        async with self._session_lock(session_id):
+            async for frame in self._stream_message(
+                session_id, user_id, message, conversation_history, user_context, memory
+            ):
+                yield frame
+    
+    def _session_lock(self, session_id: str) -> asyncio.Lock:
+        """Get or create the lock serializing a session's turns"""
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = self._session_locks[session_id] = asyncio.Lock()
+        return lock
+    
+    async def _stream_message(
+        self,
+        session_id: str,
+        user_id: str,
+        message: str,
+        conversation_history: List[Dict[str, Any]],
+        user_context: Dict[str, Any],
+        memory: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Unlocked body of stream_message"""
+        # Read-your-writes: the previous turn's memory update must land before this turn reads it
+        pending_write = self._pending_writes.get(session_id)
+        if pending_write is not None:
+            await asyncio.wait({pending_write})
+        
+        # Greetings and sign-offs need no agents at all
+        fast_path = self._fast_path(message, conversation_history)
+        if fast_path:
+            yield self._fast_path_response(fast_path, session_id, message, conversation_history)
+            return
+        
+        # Opening messages of a fresh session depend on nothing but the message itself
+        cache_key = self._response_cache_key(message, conversation_history, user_context, memory)
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Response cache hit for session {session_id}")
+                yield self._replay_cached_response(cached, session_id, conversation_history, memory)
+                return
+        
+        # Agents only see a window of recent turns; new turns are copied back afterwards
+        _number_turns(conversation_history, memory)
+        window_start = max(len(conversation_history) - AGENT_HISTORY_WINDOW, 0)
+        history_view = conversation_history[window_start:]
+        view_length = len(history_view)
+        
+        # Turns before the window not yet in the rolling summary, found by turn id
+        summarized_through = memory.get("summarized_through", -1)
+        evicted_start = window_start
+        while evicted_start and conversation_history[evicted_start - 1]["turn_id"] > summarized_through:
+            evicted_start -= 1
         
         try:
-            for step in self.execution_order:
-                if isinstance(step, list):
-                    # Parallel execution
-                    tasks = []
-                    for agent_name in step:
-                        if agent_name in self.agents:
-                            tasks.append(self.agents[agent_name].process(agent_state))
-                    
-                    # Wait for all parallel agents to complete
-                    if tasks:
-                        await asyncio.gather(*tasks)
-                else:
-                    # Sequential execution
-                    if step == "flow_decision":
-                        flow_decision = await self._flow_decision_logic(agent_state)
-                        agent_state.response_data["flow_decision"] = flow_decision
-                        
-                        if flow_decision == "end":
-                            break
-                    elif step in self.agents:
-                        agent_state = await self.agents[step].process(agent_state)
+            # Initialize state - enums and UserContext are built once here, at the API boundary
+            agent_state = self._build_agent_state(
+                session_id, user_id, message, history_view, user_context, memory
+            )
+            agent_state.history_summary = memory.get("rolling_summary", "")
+            agent_state.evicted_history = conversation_history[evicted_start:window_start]
             
-            return self._prepare_response(agent_state)
+            if LANGGRAPH_AVAILABLE and self.graph:
+                # Use LangGraph execution
+                steps = self._execute_langgraph(agent_state)
+            else:
+                # Use custom execution
+                steps = self._execute_custom_graph(agent_state)
             
+            # Agents update agent_state in place, so it is current after every step
+            async for step in steps:
+                if step == "classification":
+                    yield self._prepare_partial_response(agent_state, "classified")
         except Exception as e:
             logger.error(f"Error in agent graph execution: {e}")
-            return {
+            yield {
                 "type": "error",
                 "content": "I apologize, but I encountered an error processing your request. Please try again.",
-                "timestamp": datetime.now().isoformat(),
-                "session_id": state["session_id"]
+                "timestamp": _now_iso(),
+                "session_id": session_id
             }
+            return
+        finally:
+            conversation_history.extend(history_view[view_length:])
+        
+        response = self._prepare_response(agent_state)
+        
+        on_written = None
+        if cache_key:
+            # Cached only once memory is written, so a replay carries the complete update
+            ttl = RESPONSE_CACHE_TTLS.get(agent_state.next_action, DEFAULT_RESPONSE_CACHE_TTL)
+            entry = copy.deepcopy({
+                "response": response,
+                "history_entries": history_view[view_length:]
+            })
+            
+            def on_written():
+                entry["memory"] = copy.deepcopy(memory)
+                self.response_cache.put(cache_key, entry, ttl)
+        
+        self._schedule_memory_write(agent_state, on_written)
+        
+        yield response
     
-    def _convert_to_agent_state(self, graph_state: AgentGraphState) -> AgentState:
-        """Convert graph state to agent state"""
-        from app.models import UserContext, ConversationStage, UrgencyLevel
+    def _schedule_memory_write(self, agent_state: AgentState, on_written: Optional[Any] = None):
+        """Run the memory agent in the background; the response does not depend on it"""
+        # The memory agent gets its own response layer; memory and history are shared with the session
+        snapshot = replace(agent_state, response_data={})
+        session_id = agent_state.session_id
+        task = asyncio.create_task(self._write_memory(snapshot, on_written))
+        self._pending_writes[session_id] = task
+        
+        def discard(done: asyncio.Task):
+            if self._pending_writes.get(session_id) is done:
+                del self._pending_writes[session_id]
+        
+        task.add_done_callback(discard)
+    
+    async def flush_memory_writes(self):
+        """Wait for outstanding memory writes, e.g. before shutdown"""
+        if self._pending_writes:
+            await asyncio.wait(set(self._pending_writes.values()))
+    
+    async def _write_memory(self, snapshot: AgentState, on_written: Optional[Any] = None):
+        """Memory agent write-behind task"""
+        try:
+            await self._run_agent("memory", snapshot)
+        except Exception as e:
+            logger.error(f"Error updating memory for session {snapshot.session_id}: {e}")
+            return
         
+        if on_written is not None:
+            on_written()
+    
+    def _fast_path(self, message: str, conversation_history: List[Dict[str, Any]]) -> Optional[str]:
+        """Classify messages that can be answered without running the graph"""
+        if not message or len(message) > 40:
+            return None
+        
+        # A greeting only opens a conversation; later in a session it goes through the graph
+        kind = match_social_message(message)
+        if kind == "greeting" and conversation_history:
+            return None
+        return kind if kind in ("greeting", "closing") else None
+    
+    def _fast_path_response(
+        self,
+        kind: str,
+        session_id: str,
+        message: str,
+        conversation_history: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the response for a fast-path message, recording it in history like the context agent would"""
+        conversation_history.append({
+            "timestamp": get_current_timestamp(),
+            "type": MessageType.USER,
+            "content": message,
+            "intent": kind,
+            "entities": {}
+        })
+        
+        if kind == "greeting":
+            content = self._generate_greeting_response(None)
+            stage = ConversationStage.GREETING
+        else:
+            content = self._generate_closing_response()
+            stage = ConversationStage.CLOSURE
+        
+        response = {
+            "type": "ai_response",
+            "timestamp": _now_iso(),
+            "session_id": session_id,
+            "content": content,
+            "metadata": {
+                "intent": kind,
+                "confidence": 1.0,
+                "legal_domain": "",
+                "urgency_level": UrgencyLevel.LOW.value,
+                "conversation_stage": stage.value
+            }
+        }
+        if kind == "closing":
+            response["metadata"]["flow_decision"] = "end"
+        return response
+    
+    def _response_cache_key(
+        self,
+        message: str,
+        conversation_history: List[Dict[str, Any]],
+        user_context: Dict[str, Any],
+        memory: Dict[str, Any]
+    ) -> Optional[str]:
+        """Cache key for a message, or None when session state could change the response"""
+        if conversation_history or memory:
+            return None
+        if any(user_context.get(field) for field in ("legal_issue", "location", "budget_range")):
+            return None
+        if user_context.get("urgency_level", "LOW") != "LOW":
+            return None
+        
+        normalized = " ".join(message.casefold().split())
+        intent = self.agents["dialogue"]._extract_intent(normalized)
+        legal_domain = classify_legal_domain(normalized)
+        return hashlib.sha1(f"{intent}|{legal_domain}|{normalized}".encode("utf-8")).hexdigest()
+    
+    def _replay_cached_response(
+        self,
+        cached: Dict[str, Any],
+        session_id: str,
+        conversation_history: List[Dict[str, Any]],
+        memory: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Apply a cached run's history and memory updates to this session and return its response"""
+        for entry in copy.deepcopy(cached["history_entries"]):
+            if "timestamp" in entry:
+                entry["timestamp"] = get_current_timestamp()
+            conversation_history.append(entry)
+        memory.update(copy.deepcopy(cached["memory"]))
+        
+        response = copy.deepcopy(cached["response"])
+        response["timestamp"] = _now_iso()
+        response["session_id"] = session_id
+        return response
+    
+    async def _execute_langgraph(self, agent_state: AgentState) -> AsyncIterator[str]:
+        """Execute the compiled LangGraph, yielding the agent role of each completed node"""
+        async for output in self.graph.astream(AgentGraphState(
+            agent_state=agent_state,
+            flow_decision="",
+            processing_complete=False
+        )):
+            for node_name in output:
+                yield node_name.removesuffix("_agent")
+    
+    async def _execute_custom_graph(self, agent_state: AgentState) -> AsyncIterator[str]:
+        """Execute the graph using custom implementation, yielding each completed step"""
+        for step in self.execution_order:
+            if isinstance(step, list):
+                # Parallel execution
+                await self._run_parallel_agents(agent_state, step)
+            else:
+                # Sequential execution
+                if step == "specialized":
+                    await self._run_parallel_agents(agent_state, self._select_specialized_agents(agent_state))
+                elif step == "flow_decision":
+                    flow_decision = self._flow_decision_logic(agent_state)
+                    agent_state.response_data["flow_decision"] = flow_decision
+                    
+                    if flow_decision == "end":
+                        return
+                elif step in self.agents:
+                    await self._run_agent(step, agent_state)
+            
+            yield step
+    
+    def _select_specialized_agents(self, state: AgentState) -> List[str]:
+        """Pick the specialized agents that have something to contribute for this message"""
+        selected = []
+        
+        context = state.user_context
+        if (state.confidence < CLARIFICATION_CONFIDENCE_THRESHOLD
+                or not context.legal_issue_type
+                or not has_location(context)):
+            selected.append("clarification")
+        
+        if state.legal_domain:
+            selected.append("legal_reasoning")
+        
+        if (state.urgency_level in _RISK_URGENCY_LEVELS
+                or state.legal_domain.lower() in _RISK_LEGAL_DOMAINS
+                or state.intent == "emergency"):
+            selected.append("risk_assessment")
+        
+        if state.legal_domain:
+            selected.append("recommendation")
+        
+        skipped = [name for name in SPECIALIZED_AGENTS if name not in selected]
+        if skipped:
+            logger.info(f"Skipping specialized agents {skipped} for session {state.session_id}")
+        return selected
+    
+    async def _run_agent(self, agent_name: str, state: AgentState) -> AgentState:
+        """Run a single agent, bounded by the graph-wide concurrency limit"""
+        async with self._llm_sem:
+            return await self.agents[agent_name].process(state)
+    
+    async def _run_parallel_agents(self, state: AgentState, agent_names: List[str]) -> AgentState:
+        """Run agents concurrently, each on its own branch of the state, and merge their results"""
+        agent_names = [name for name in agent_names if name in self.agents]
+        # Each branch writes to its own layer over the shared response data - no copies, no races
+        branches = [replace(state, response_data=ChainMap({}, state.response_data)) for _ in agent_names]
+        
+        results = await asyncio.gather(
+            *(self._run_agent(name, branch) for name, branch in zip(agent_names, branches)),
+            return_exceptions=True
+        )
+        
+        # Merge in declaration order so later agents win on conflicting keys
+        baseline = {name: getattr(state, name) for name in _MERGED_FIELDS}
+        for agent_name, result in zip(agent_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error in {agent_name} agent: {result}")
+                continue
+            
+            layer = result.response_data
+            if isinstance(layer, ChainMap):
+                layer = layer.maps[0]
+            state.response_data.update(layer)
+            for name, value in baseline.items():
+                updated = getattr(result, name)
+                if updated is not value:
+                    setattr(state, name, updated)
+        
+        return state
+    
+    def _build_agent_state(
+        self,
+        session_id: str,
+        user_id: str,
+        message: str,
+        conversation_history: List[Dict[str, Any]],
+        user_context: Dict[str, Any],
+        memory: Dict[str, Any]
+    ) -> AgentState:
+        """Build the agent state shared by every node for one message"""
         # Create UserContext object
-        user_context = UserContext(
-            legal_issue=graph_state["user_context"].get("legal_issue"),
-            location=graph_state["user_context"].get("location"),
-            urgency_level=UrgencyLevel(graph_state["user_context"].get("urgency_level", "LOW")),
-            budget_range=graph_state["user_context"].get("budget_range")
+        context = UserContext(
+            user_id=user_id,
+            session_id=session_id,
+            legal_issue_type=user_context.get("legal_issue"),
+            location=user_context.get("location") or None,
+            urgency_level=UrgencyLevel(user_context.get("urgency_level", "LOW")),
+            budget_range=user_context.get("budget_range")
         )
         
         return AgentState(
-            session_id=graph_state["session_id"],
-            user_id=graph_state["user_id"],
-            current_message=graph_state["current_message"],
-            conversation_history=graph_state["conversation_history"],
-            user_context=user_context,
-            conversation_stage=ConversationStage(graph_state["conversation_stage"]),
-            extracted_entities=graph_state["extracted_entities"],
-            intent=graph_state["intent"],
-            confidence=graph_state["confidence"],
-            urgency_level=UrgencyLevel(graph_state["urgency_level"]),
-            legal_domain=graph_state["legal_domain"],
-            next_action=graph_state["next_action"],
-            response_data=graph_state["response_data"],
-            memory=graph_state["memory"]
+            session_id=session_id,
+            user_id=user_id,
+            current_message=message,
+            conversation_history=conversation_history,
+            user_context=context,
+            conversation_stage=ConversationStage.GREETING,
+            extracted_entities={},
+            intent="",
+            confidence=0.0,
+            urgency_level=UrgencyLevel.LOW,
+            legal_domain="",
+            next_action="",
+            response_data={},
+            memory=memory
         )
     
-    async def _flow_decision_logic(self, state: AgentState) -> str:
+    def _flow_decision_logic(self, state: AgentState) -> str:
         """Decision logic for flow control"""
         # Check if clarification is needed
         if state.response_data.get("clarification_needed", False):
@@ -257,31 +690,39 @@ class AgentGraph:
             return "end"
         
         # Check conversation stage
-        if state.conversation_stage.value in ["greeting", "information_gathering"]:
+        if state.conversation_stage.value in _CONTINUE_STAGES:
             return "continue"
         
         # Default to continue
         return "continue"
     
+    def _prepare_partial_response(self, state: AgentState, stage: str) -> Dict[str, Any]:
+        """Prepare an interim frame describing what the graph knows so far"""
+        return {
+            "type": "partial",
+            "stage": stage,
+            "timestamp": _now_iso(),
+            "session_id": state.session_id,
+            "metadata": {
+                "intent": state.intent,
+                "confidence": state.confidence,
+                "legal_domain": state.legal_domain,
+                "urgency_level": state.urgency_level.value,
+                "conversation_stage": state.conversation_stage.value
+            }
+        }
+    
     def _prepare_response(self, state: AgentState) -> Dict[str, Any]:
         """Prepare final response based on agent processing"""
         response = {
             "type": "ai_response",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "session_id": state.session_id
         }
         
         # Determine response content based on next action
-        if state.next_action == "provide_greeting":
-            response["content"] = self._generate_greeting_response(state)
-        elif state.next_action == "request_clarification":
-            response["content"] = self._generate_clarification_response(state)
-        elif state.next_action == "provide_legal_guidance":
-            response["content"] = self._generate_guidance_response(state)
-        elif state.next_action == "recommend_advocates":
-            response["content"] = self._generate_recommendation_response(state)
-        else:
-            response["content"] = self._generate_general_response(state)
+        builder = self._RESPONSE_BUILDERS.get(state.next_action, "_generate_general_response")
+        response["content"] = getattr(self, builder)(state)
         
         # Add metadata
         response["metadata"] = {
@@ -306,28 +747,22 @@ class AgentGraph:
         
         return response
     
-    def _generate_greeting_response(self, state: AgentState) -> str:
+    def _generate_greeting_response(self, state: Optional[AgentState]) -> str:
         """Generate greeting response"""
-        greeting_templates = [
-            "Hello! I'm your Legal AI Assistant. I'm here to help you with your legal questions and connect you with qualified advocates.",
-            "Welcome to LegalLink AI! How can I assist you with your legal matter today?",
-            "Hi there! I'm here to provide legal guidance and help you find the right advocate for your case."
-        ]
-        
-        # Select based on time of day or randomize
-        import random
-        return random.choice(greeting_templates)
+        return next(self._greetings)
+    
+    def _generate_closing_response(self) -> str:
+        """Generate closing response"""
+        return CLOSING_RESPONSE
     
     def _generate_clarification_response(self, state: AgentState) -> str:
         """Generate clarification request response"""
-        base_response = "I'd like to better understand your situation to provide the most helpful guidance. "
-        
         questions = state.response_data.get("questions", [])
         if questions:
             question_text = questions[0]["question"]  # Start with first question
-            return base_response + question_text
+            return CLARIFICATION_PREFIX + question_text
         
-        return base_response + "Could you provide more details about your legal issue?"
+        return CLARIFICATION_PREFIX + CLARIFICATION_FALLBACK
     
     def _generate_guidance_response(self, state: AgentState) -> str:
         """Generate legal guidance response"""
@@ -335,115 +770,62 @@ class AgentGraph:
         relevant_laws = state.response_data.get("relevant_laws", [])
         next_steps = state.response_data.get("next_steps", [])
         
-        response = guidance
+        parts = [guidance]
         
         if relevant_laws:
-            response += f"\n\nRelevant laws that may apply: {', '.join(relevant_laws)}"
+            parts.append(f"Relevant laws that may apply: {', '.join(relevant_laws)}")
         
         if next_steps:
-            response += "\n\nRecommended next steps:\n"
-            for i, step in enumerate(next_steps, 1):
-                response += f"{i}. {step}\n"
+            parts.append("Recommended next steps:\n" + "".join(
+                f"{i}. {step}\n" for i, step in enumerate(next_steps, 1)
+            ))
         
-        return response
+        return "\n\n".join(parts)
     
     def _generate_recommendation_response(self, state: AgentState) -> str:
         """Generate advocate recommendation response"""
         recommendations = state.response_data.get("recommendations", [])
         
-        response = "Based on your legal issue, I recommend the following:\n\n"
-        
-        for i, rec in enumerate(recommendations, 1):
-            response += f"{i}. {rec}\n"
-        
-        response += "\nWould you like me to help you find qualified advocates in your area?"
-        
-        return response
+        numbered = "".join(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1))
+        return RECOMMENDATION_INTRO + numbered + RECOMMENDATION_OUTRO
     
     def _generate_general_response(self, state: AgentState) -> str:
         """Generate general response"""
         if state.legal_domain:
-            return f"I understand you have a {state.legal_domain.lower()} related matter. Let me help you with that."
+            return DOMAIN_RESPONSE_TEMPLATE.format(domain=state.legal_domain.lower())
         
-        return "I'm here to help with your legal question. Could you tell me more about your situation?"
+        return GENERAL_RESPONSE
     
     # Node implementations for LangGraph
-    async def _context_agent_node(self, state: AgentGraphState) -> AgentGraphState:
-        """Context agent node"""
-        agent_state = self._convert_to_agent_state(state)
-        result = await self.agents["context"].process(agent_state)
-        return self._update_graph_state(state, result)
+    async def _intake_fanout_node(self, state: AgentGraphState) -> Dict[str, Any]:
+        """Intake node - runs the context and dialogue agents concurrently"""
+        return {"agent_state": await self._run_parallel_agents(state["agent_state"], INTAKE_AGENTS)}
     
-    async def _dialogue_agent_node(self, state: AgentGraphState) -> AgentGraphState:
+    async def _dialogue_agent_node(self, state: AgentGraphState) -> Dict[str, Any]:
         """Dialogue agent node"""
-        agent_state = self._convert_to_agent_state(state)
-        result = await self.agents["dialogue"].process(agent_state)
-        return self._update_graph_state(state, result)
+        return {"agent_state": await self._run_agent("dialogue", state["agent_state"])}
     
-    async def _classification_agent_node(self, state: AgentGraphState) -> AgentGraphState:
+    async def _classification_agent_node(self, state: AgentGraphState) -> Dict[str, Any]:
         """Classification agent node"""
-        agent_state = self._convert_to_agent_state(state)
-        result = await self.agents["classification"].process(agent_state)
-        return self._update_graph_state(state, result)
-    
-    async def _clarification_agent_node(self, state: AgentGraphState) -> AgentGraphState:
-        """Clarification agent node"""
-        agent_state = self._convert_to_agent_state(state)
-        result = await self.agents["clarification"].process(agent_state)
-        return self._update_graph_state(state, result)
-    
-    async def _legal_reasoning_agent_node(self, state: AgentGraphState) -> AgentGraphState:
-        """Legal reasoning agent node"""
-        agent_state = self._convert_to_agent_state(state)
-        result = await self.agents["legal_reasoning"].process(agent_state)
-        return self._update_graph_state(state, result)
-    
-    async def _risk_assessment_agent_node(self, state: AgentGraphState) -> AgentGraphState:
-        """Risk assessment agent node"""
-        agent_state = self._convert_to_agent_state(state)
-        result = await self.agents["risk_assessment"].process(agent_state)
-        return self._update_graph_state(state, result)
-    
-    async def _recommendation_agent_node(self, state: AgentGraphState) -> AgentGraphState:
-        """Recommendation agent node"""
-        agent_state = self._convert_to_agent_state(state)
-        result = await self.agents["recommendation"].process(agent_state)
-        return self._update_graph_state(state, result)
-    
-    async def _memory_agent_node(self, state: AgentGraphState) -> AgentGraphState:
-        """Memory agent node"""
-        agent_state = self._convert_to_agent_state(state)
-        result = await self.agents["memory"].process(agent_state)
-        return self._update_graph_state(state, result)
-    
-    async def _progress_agent_node(self, state: AgentGraphState) -> AgentGraphState:
+        return {"agent_state": await self._run_agent("classification", state["agent_state"])}
+    
+    async def _specialized_fanout_node(self, state: AgentGraphState) -> Dict[str, Any]:
+        """Specialized agents node - runs clarification, legal reasoning, risk and recommendation concurrently"""
+        agent_state = state["agent_state"]
+        agent_names = self._select_specialized_agents(agent_state)
+        return {"agent_state": await self._run_parallel_agents(agent_state, agent_names)}
+    
+    async def _progress_agent_node(self, state: AgentGraphState) -> Dict[str, Any]:
         """Progress agent node"""
-        agent_state = self._convert_to_agent_state(state)
-        result = await self.agents["progress"].process(agent_state)
-        return self._update_graph_state(state, result)
+        return {"agent_state": await self._run_agent("progress", state["agent_state"])}
     
-    async def _flow_decision_node(self, state: AgentGraphState) -> AgentGraphState:
+    def _flow_decision_node(self, state: AgentGraphState) -> Dict[str, Any]:
         """Flow decision node"""
-        agent_state = self._convert_to_agent_state(state)
-        flow_decision = await self._flow_decision_logic(agent_state)
-        state["flow_decision"] = flow_decision
-        state["processing_complete"] = flow_decision == "end"
-        return state
-    
-    def _update_graph_state(self, graph_state: AgentGraphState, agent_state: AgentState) -> AgentGraphState:
-        """Update graph state from agent state"""
-        graph_state.update({
-            "conversation_stage": agent_state.conversation_stage.value,
-            "extracted_entities": agent_state.extracted_entities,
-            "intent": agent_state.intent,
-            "confidence": agent_state.confidence,
-            "urgency_level": agent_state.urgency_level.value,
-            "legal_domain": agent_state.legal_domain,
-            "next_action": agent_state.next_action,
-            "response_data": agent_state.response_data,
-            "memory": agent_state.memory
-        })
-        return graph_state
+        flow_decision = self._flow_decision_logic(state["agent_state"])
+        return {
+            "flow_decision": flow_decision,
+            "processing_complete": flow_decision == "end"
+        }
     
     def _should_continue(self, state: AgentGraphState) -> str:
         """Determine if processing should continue"""
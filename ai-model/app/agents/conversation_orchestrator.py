@@ -3,11 +3,27 @@ Conversation Orchestrator - Interactive LegalLink AI
 Following Technical Flow: Conversation Flow Control & Response Assembly
 """
 import asyncio
+import copy
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
+from types import MappingProxyType
 
-from .agent_graph import AgentGraph
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from .agent_graph import AgentGraph, match_social_message
 from .session_manager import SessionManager, UserSession
 from .enhanced_legal_agent import EnhancedLegalAgent, LegalQuery
 from app.models import (
@@ -15,10 +31,309 @@ from app.models import (
     UserContext, UrgencyLevel
 )
 from app.services import ExpressClient, IndianKanoonClient
-from app.utils import get_current_timestamp
+from app.utils import dumps_json, get_current_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Receives {"type": "delta"} frames while the Enhanced Legal Agent is still generating
+DeltaSink = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class _LegalQueryFlight:
+    """An Enhanced Legal Agent query in flight, shared by every caller asking the same query"""
+    task: Optional[asyncio.Task] = None
+    # Text generated so far, and each waiter's [sink, session_id, chunks already sent]
+    chunks: List[str] = field(default_factory=list)
+    waiters: List[List[Any]] = field(default_factory=list)
+
+# Keyword banks for RAG response analysis; matched as substrings of the lowercased content
+_LEGAL_TERMS = (
+    "section", "act", "law", "court", "petition", "complaint", "jurisdiction",
+    "precedent", "statute", "regulation", "legal", "rights", "liability",
+    "contract", "agreement", "violation", "offense", "penalty", "damages"
+)
+_ACTION_TERMS = (
+    "should", "need to", "must", "recommended", "steps", "process",
+    "file", "submit", "apply", "contact", "gather", "prepare", "visit"
+)
+_HIGH_URGENCY_KEYWORDS = (
+    "urgent", "immediate", "deadline", "time limit", "expire", "arrest", 
+    "detention", "seizure", "eviction", "termination", "emergency"
+)
+_MEDIUM_URGENCY_KEYWORDS = (
+    "court date", "hearing", "notice", "summons", "legal action",
+    "complaint", "dispute", "violation"
+)
+_RISK_KEYWORDS = (
+    "risk", "penalty", "fine", "imprisonment", "liability", "damages",
+    "consequence", "violation", "breach", "default"
+)
+_COMPLIANCE_KEYWORDS = (
+    "must", "required", "mandatory", "obligatory", "compulsory",
+    "shall", "need to", "have to"
+)
+
+_ALL_KEYWORDS = frozenset(
+    _LEGAL_TERMS + _ACTION_TERMS + _HIGH_URGENCY_KEYWORDS + _MEDIUM_URGENCY_KEYWORDS
+    + _RISK_KEYWORDS + _COMPLIANCE_KEYWORDS
+)
+
+# One automaton over every bank, so a text is scanned once rather than once per keyword
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _ALL_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+# RAG analysis is a pure function of the response text; repeated responses reuse it
+RAG_ANALYSIS_CACHE_SIZE = int(os.getenv("RAG_ANALYSIS_CACHE_SIZE", "1024"))
+
+@lru_cache(maxsize=RAG_ANALYSIS_CACHE_SIZE)
+def _find_keywords(text_lower: str) -> FrozenSet[str]:
+    """Return every keyword-bank term occurring in the lowercased text"""
+    if AHOCORASICK_AVAILABLE:
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text_lower))
+    return frozenset(keyword for keyword in _ALL_KEYWORDS if keyword in text_lower)
+
+_CASE_LAW_RE = re.compile(
+    r"(?:\b\d{4}\b.*\b(?:SC|HC|SCC|AIR|PLD)\b)|(?:\bv\.\s+\w+)|(?:\bcase\s+of\b)|(?:\bjudgment\b)|(?:\bruling\b)",
+    re.IGNORECASE
+)
+_ACT_RE = re.compile(r'([A-Z][a-z\s]+Act,?\s*\d{4})')
+_SECTION_RE = re.compile(r'Section\s+(\d+[A-Z]?)')
+_PRINCIPLE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'principle\s+(?:of\s+)?([^.]+)',
+    r'doctrine\s+(?:of\s+)?([^.]+)',
+    r'rule\s+(?:of\s+)?([^.]+)'
+))
+
+@lru_cache(maxsize=RAG_ANALYSIS_CACHE_SIZE)
+def _has_case_law_references(content: str) -> bool:
+    """Check if content contains case law references"""
+    return _CASE_LAW_RE.search(content) is not None
+
+@lru_cache(maxsize=RAG_ANALYSIS_CACHE_SIZE)
+def _applicable_laws(content: str, source_sections: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Applicable laws named in content, plus the sections cited by its case law sources"""
+    laws = []
+    
+    # Extract from content
+    laws.extend(_ACT_RE.findall(content))
+    laws.extend([f"Section {s}" for s in _SECTION_RE.findall(content)])
+    laws.extend(source_sections)
+    
+    return tuple(set(laws))  # Remove duplicates
+
+@lru_cache(maxsize=RAG_ANALYSIS_CACHE_SIZE)
+def _legal_principles(content: str) -> Tuple[str, ...]:
+    """Legal principles named in content"""
+    principles = []
+    
+    # Look for principle-indicating phrases
+    for pattern in _PRINCIPLE_RES:
+        principles.extend(pattern.findall(content))
+    
+    return tuple(principles)
+
+@lru_cache(maxsize=RAG_ANALYSIS_CACHE_SIZE)
+def _risk_factors(content: str) -> Tuple[str, ...]:
+    """First sentence of content mentioning each risk keyword"""
+    keywords = _find_keywords(content.lower())
+    present = [keyword for keyword in _RISK_KEYWORDS if keyword in keywords]
+    if not present:
+        return ()
+    
+    # Split and lowercase once, not once per keyword
+    sentences = content.split('.')
+    lower_sentences = [sentence.lower() for sentence in sentences]
+    
+    risks = []
+    for keyword in present:
+        # Extract sentence containing the risk keyword
+        for sentence, sentence_lower in zip(sentences, lower_sentences):
+            if keyword in sentence_lower:
+                risks.append(sentence.strip())
+                break
+    
+    return tuple(risks)
+
+@lru_cache(maxsize=RAG_ANALYSIS_CACHE_SIZE)
+def _compliance_requirements(content: str) -> Tuple[str, ...]:
+    """Distinct sentences of content stating a compliance requirement"""
+    keywords = _find_keywords(content.lower())
+    present = [keyword for keyword in _COMPLIANCE_KEYWORDS if keyword in keywords]
+    if not present:
+        return ()
+    
+    # Each sentence is lowercased once and checked against every keyword the content contains
+    requirements = set()
+    for sentence in content.split('.'):
+        sentence_lower = sentence.lower()
+        if any(keyword in sentence_lower for keyword in present):
+            requirements.add(sentence.strip())
+    
+    return tuple(requirements)  # Remove duplicates
+
+# Preliminary intent keywords; matched as whole words of the lowercased message
+_INTENT_KEYWORDS = {
+    "emergency": _HIGH_URGENCY_KEYWORDS + ("police", "bail", "threat"),
+    "legal_query": _LEGAL_TERMS + ("lawyer", "advocate", "case", "legal advice")
+}
+_KEYWORD_INTENTS = {
+    keyword: intent for intent, keywords in _INTENT_KEYWORDS.items() for keyword in keywords
+}
+
+# Preliminary intents of messages that are nothing but a social phrase, by the agent graph's
+# kind of social message; "hi, my landlord evicted me" carries a question and is not one
+_SOCIAL_INTENTS = MappingProxyType({
+    "greeting": "greeting",
+    "closing": "closure",
+    "satisfaction": "satisfaction"
+})
+
+MAX_MESSAGE_LENGTH = 1000
+_STRIPPED_CHARACTERS = str.maketrans("", "", "<>\"'")
+_URL_RE = re.compile(r"https?://|www\.", re.IGNORECASE)
+
+if AHOCORASICK_AVAILABLE:
+    _INTENT_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _intent in _KEYWORD_INTENTS.items():
+        _INTENT_AUTOMATON.add_word(_keyword, (_intent, len(_keyword)))
+    _INTENT_AUTOMATON.make_automaton()
+else:
+    _INTENT_RES = {
+        intent: re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b")
+        for intent, keywords in _INTENT_KEYWORDS.items()
+    }
+
+def _intent_hits(text_lower: str) -> FrozenSet[str]:
+    """Intents with at least one keyword occurring as a whole word of the lowercased text"""
+    if not AHOCORASICK_AVAILABLE:
+        return frozenset(intent for intent, pattern in _INTENT_RES.items() if pattern.search(text_lower))
+    
+    hits = set()
+    last = len(text_lower) - 1
+    for end, (intent, length) in _INTENT_AUTOMATON.iter(text_lower):
+        start = end - length + 1
+        if (start == 0 or not text_lower[start - 1].isalnum()) and (end == last or not text_lower[end + 1].isalnum()):
+            hits.add(intent)
+    return frozenset(hits)
+
+# Quick actions offered for each suggested action type
+_QUICK_ACTIONS = MappingProxyType({
+    "filing": MappingProxyType({
+        "label": "Help with Filing",
+        "action": "guide_filing_process",
+        "description": "Guide me through the filing process"
+    }),
+    "consultation": MappingProxyType({
+        "label": "Find Advocate",
+        "action": "find_advocate",
+        "description": "Connect me with a qualified advocate"
+    })
+})
+
+# Advocate specializations implied by the RAG query classification
+_SPECIALIZATION_MAPPING = MappingProxyType({
+    "procedure": ("procedural_law", "court_practice"),
+    "case_law": ("litigation", "legal_research"),
+    "rights": ("constitutional_law", "human_rights"),
+    "guidance": ("legal_consultation", "advisory_services")
+})
+
+_LAW_SPECIALIZATIONS = (
+    ("criminal", "criminal_law"),
+    ("civil", "civil_law"),
+    ("family", "family_law"),
+    ("property", "property_law")
+)
+
+@lru_cache(maxsize=RAG_ANALYSIS_CACHE_SIZE)
+def _specializations(query_type: str, applicable_laws: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Legal specializations for a query classification and its applicable laws"""
+    specializations = list(_SPECIALIZATION_MAPPING.get(query_type, ()))
+    
+    # Add specific law specializations; the first matching keyword decides each law
+    for law in applicable_laws:
+        law_lower = law.lower()
+        for keyword, specialization in _LAW_SPECIALIZATIONS:
+            if keyword in law_lower:
+                specializations.append(specialization)
+                break
+    
+    # Remove duplicates, keeping the order so identical queries list specializations identically
+    return tuple(dict.fromkeys(specializations))
+
+# Response templates following data flow; read-only and shared by every orchestrator
+_RESPONSE_TEMPLATES = MappingProxyType({
+    ConversationStage.GREETING: MappingProxyType({
+        "welcome": "Welcome to LegalLink AI! I'm here to help with your legal questions and connect you with qualified advocates. How can I assist you today?",
+        "returning": "Welcome back! How can I help you with your legal matter today?"
+    }),
+    ConversationStage.INFORMATION_GATHERING: MappingProxyType({
+        "location_needed": "To provide the most relevant guidance, could you please share your location (city/state)?",
+        "details_needed": "Could you provide more details about your legal issue?",
+        "urgency_check": "How urgent is this matter? Do you need immediate assistance?"
+    }),
+    ConversationStage.LEGAL_GUIDANCE: MappingProxyType({
+        "analysis_complete": "Based on your situation, here's my analysis:",
+        "laws_applicable": "The following laws may be relevant to your case:",
+        "next_steps": "I recommend the following next steps:"
+    }),
+    ConversationStage.ADVOCATE_RECOMMENDATION: MappingProxyType({
+        "search_initiated": "Let me help you find qualified advocates in your area.",
+        "recommendations_ready": "I found several advocates who specialize in your type of case:",
+        "booking_offer": "Would you like me to help you schedule a consultation?"
+    }),
+    ConversationStage.CLOSURE: MappingProxyType({
+        "summary": "Here's a summary of our conversation:",
+        "follow_up": "Feel free to reach out if you have more questions!",
+        "satisfaction": "Was this consultation helpful?"
+    })
+})
+
+def _source_type(source: Any) -> str:
+    """Type of a RAG source; the Enhanced Legal Agent reports plain source labels, other sources are dicts"""
+    return source.get("type", "") if isinstance(source, dict) else str(source)
+
+# Enhanced Legal Agent query type for each preliminary intent; anything else asks for general guidance
+_INTENT_QUERY_TYPES = MappingProxyType({
+    "emergency": "urgent",
+    "legal_query": "guidance",
+    "general_query": "guidance"
+})
+
+# Enhanced Legal Agent results are cached in Redis by normalized query
+RAG_CACHE_TTL = int(os.getenv("RAG_CACHE_TTL", "3600"))
+# Filler words that never change a legal question; negations and modals are deliberately kept
+_QUERY_FILLER_WORDS = frozenset({"a", "an", "the", "please", "kindly", "pls", "plz"})
+_QUERY_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+def _rag_cache_key(legal_query: LegalQuery) -> str:
+    """Cache key of a legal query: its normalized text plus everything else that shapes the answer"""
+    words = _QUERY_PUNCTUATION_RE.sub(" ", legal_query.query.lower()).split()
+    normalized = " ".join(word for word in words if word not in _QUERY_FILLER_WORDS)
+    digest = hashlib.blake2b("|".join((
+        normalized,
+        str(legal_query.query_type),
+        str(legal_query.location),
+        str(legal_query.urgency)
+    )).encode()).hexdigest()
+    return f"rag:{digest}"
+
+# Error envelope shared by every failed turn; only the per-turn fields are filled in
+_ERROR_TEMPLATE = MappingProxyType({
+    "type": "error",
+    "content": "I apologize, but I encountered an error processing your request. Please try again."
+})
+
+# This many consecutive upstream failures (RAG or agents) within the window open the circuit,
+# failing non-template turns fast for a while
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("ORCHESTRATOR_CIRCUIT_FAILURES", "5"))
+CIRCUIT_FAILURE_WINDOW = float(os.getenv("ORCHESTRATOR_CIRCUIT_WINDOW_SECONDS", "10"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("ORCHESTRATOR_CIRCUIT_OPEN_SECONDS", "5"))
+
 class ConversationOrchestrator:
     """
     Main orchestrator for conversational AI following the enhanced technical flow:
@@ -36,37 +351,27 @@ class ConversationOrchestrator:
     
     def __init__(self):
         self.session_manager = SessionManager()
-        self.agent_graph = AgentGraph()
+        self.agent_graph = AgentGraph.get()
         self.enhanced_legal_agent = EnhancedLegalAgent()
         self.express_client: Optional[ExpressClient] = None
         self.indian_kanoon_client: Optional[IndianKanoonClient] = None
         
+        # Enhanced Legal Agent queries currently running, by RAG cache key
+        self._inflight: Dict[str, _LegalQueryFlight] = {}
+        
+        # Circuit breaker over the upstream services: times of the latest consecutive failures,
+        # and when an open circuit closes
+        self._failure_times = deque(maxlen=CIRCUIT_FAILURE_THRESHOLD)
+        self._circuit_open_until = 0.0
+        
         # Response templates following data flow
-        self.response_templates = {
-            ConversationStage.GREETING: {
-                "welcome": "Welcome to LegalLink AI! I'm here to help with your legal questions and connect you with qualified advocates. How can I assist you today?",
-                "returning": "Welcome back! How can I help you with your legal matter today?"
-            },
-            ConversationStage.INFORMATION_GATHERING: {
-                "location_needed": "To provide the most relevant guidance, could you please share your location (city/state)?",
-                "details_needed": "Could you provide more details about your legal issue?",
-                "urgency_check": "How urgent is this matter? Do you need immediate assistance?"
-            },
-            ConversationStage.LEGAL_GUIDANCE: {
-                "analysis_complete": "Based on your situation, here's my analysis:",
-                "laws_applicable": "The following laws may be relevant to your case:",
-                "next_steps": "I recommend the following next steps:"
-            },
-            ConversationStage.ADVOCATE_RECOMMENDATION: {
-                "search_initiated": "Let me help you find qualified advocates in your area.",
-                "recommendations_ready": "I found several advocates who specialize in your type of case:",
-                "booking_offer": "Would you like me to help you schedule a consultation?"
-            },
-            ConversationStage.CLOSURE: {
-                "summary": "Here's a summary of our conversation:",
-                "follow_up": "Feel free to reach out if you have more questions!",
-                "satisfaction": "Was this consultation helpful?"
-            }
+        self.response_templates = _RESPONSE_TEMPLATES
+        
+        # Preliminary intents answered straight from the templates, skipping RAG and agents
+        self._fast_paths = {
+            "greeting": self._fast_greeting,
+            "closure": self._fast_closure,
+            "satisfaction": self._fast_satisfaction
         }
     
     async def initialize(self, express_client: ExpressClient, indian_kanoon_client: IndianKanoonClient):
@@ -85,11 +390,15 @@ class ConversationOrchestrator:
         user_id: str,
         message: str,
         websocket = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        on_delta: Optional[DeltaSink] = None
     ) -> Dict[str, Any]:
         """
         Main entry point for processing user messages
         Following Technical Flow: Input → Processing → Response Assembly → Delivery
+        
+        on_delta, if given, receives the RAG answer as it is generated; the returned
+        response supersedes it
         """
         try:
             # 1. SESSION & CONTEXT MANAGEMENT
@@ -97,26 +406,97 @@ class ConversationOrchestrator:
               # 2. INPUT PROCESSING & VALIDATION
             processed_input = await self._process_input(message, session)
             
-            # 3. ENHANCED LEGAL AGENT PROCESSING (RAG + Ollama Gemma3) - PRIMARY
-            enhanced_rag_response = await self.process_with_enhanced_legal_agent_before_agentic(processed_input, session)
+            # Template answers need no upstream service, so they are served even while the circuit is open;
+            # social intents come only from whole-message matches, so no question is answered by a template
+            fast_path = self._fast_paths.get(processed_input["preliminary_intent"])
+            if fast_path:
+                return fast_path(session, processed_input)
+            
+            # While the circuit is open, fail fast instead of piling more turns onto failing services
+            if time.monotonic() < self._circuit_open_until:
+                return self._create_error_response(user_id, session.session_id, "service_unavailable")
             
-            # 4. AGENTIC PROCESSING (LangGraph) - Enhanced with RAG results or Fallback
-            agent_response = await self._process_through_agents(processed_input, session, enhanced_rag_response)
+            # 3./4. ENHANCED LEGAL AGENT (RAG + Ollama Gemma3) AND AGENTIC PROCESSING (LangGraph) - run concurrently
+            try:
+                agent_response = await self._process_through_agents(processed_input, session, on_delta)
+            except Exception:
+                self._record_failure()
+                raise
             
             # 5. RESPONSE ASSEMBLY
-            assembled_response = await self._assemble_response(agent_response, session)
+            assembled_response = self._assemble_response(agent_response, session)
             
             # 6. CONTEXT UPDATE & PERSISTENCE
-            await self._update_session_context(session, message, assembled_response)
+            await self._update_session_context(session, processed_input, assembled_response)
             
-            # 7. DELIVERY PREPARATION
-            delivery_response = await self._prepare_delivery(assembled_response, session)
-            
-            return delivery_response
+            # 7. DELIVERY is the caller's; the connection manager queues and serializes each message once
+            return assembled_response
             
         except Exception as e:
-            logger.error(f"Error processing message for user {user_id}: {e}")
-            return await self._create_error_response(user_id, session_id, str(e))
+            # The detail stays in the server log; the client only gets a stable error code
+            logger.exception(f"Error processing message for user {user_id}: {e}")
+            return self._create_error_response(user_id, session_id, "processing_failed")
+    
+    def _assemble_response(self, agent_response: Dict[str, Any], session: UserSession) -> Dict[str, Any]:
+        """Shape an agent or RAG-primary response into the ai_response message the client renders"""
+        response = dict(agent_response)
+        
+        # RAG-primary responses carry their text as the conversational response
+        if "content" not in response:
+            response["content"] = response.pop("conversational_response", "")
+        
+        response["type"] = "ai_response"
+        response["session_id"] = session.session_id
+        response.setdefault("timestamp", get_current_timestamp())
+        response.setdefault("metadata", {})
+        return response
+    
+    async def _update_session_context(
+        self,
+        session: UserSession,
+        processed_input: Dict[str, Any],
+        response: Dict[str, Any]
+    ):
+        """Record the turn in the session and persist it"""
+        metadata = response["metadata"]
+        
+        # The agent graph records the user message itself; a RAG-primary turn cancelled it before it could
+        if metadata.get("enhancement_type") == "rag_with_agent_interactivity":
+            session.query_history.append({
+                "timestamp": processed_input["timestamp"],
+                "type": MessageType.USER,
+                "content": processed_input["sanitized_message"],
+                "intent": processed_input["preliminary_intent"],
+                "entities": {}
+            })
+        
+        stage = metadata.get("conversation_stage")
+        if stage:
+            session.conversation_state["stage"] = stage
+        
+        await self.session_manager.update_session(session)
+    
+    def _record_failure(self):
+        """Count a failed upstream call (RAG or agents), opening the circuit once failures pile up"""
+        now = time.monotonic()
+        self._failure_times.append(now)
+        
+        if (
+            len(self._failure_times) == CIRCUIT_FAILURE_THRESHOLD
+            and now - self._failure_times[0] <= CIRCUIT_FAILURE_WINDOW
+        ):
+            logger.warning(f"{CIRCUIT_FAILURE_THRESHOLD} consecutive failures, failing fast for {CIRCUIT_OPEN_SECONDS}s")
+            self._circuit_open_until = now + CIRCUIT_OPEN_SECONDS
+            self._failure_times.clear()
+    
+    def _create_error_response(self, user_id: str, session_id: Optional[str], error: str) -> Dict[str, Any]:
+        """Build the error response for a failed turn from the shared template; error is a stable code, never exception text"""
+        response = dict(_ERROR_TEMPLATE)
+        response["timestamp"] = get_current_timestamp()
+        response["session_id"] = session_id
+        response["user_id"] = user_id
+        response["error"] = error
+        return response
     
     async def _get_or_create_session(
         self, 
@@ -148,13 +528,8 @@ class ConversationOrchestrator:
         Following Technical Flow: Input Processing
         """
         
-        # Input validation and sanitization
-        sanitized_message = self._sanitize_input(message)
-        
-        # Input type detection
-        input_type = self._detect_input_type(sanitized_message)
-          # Intent classification (preliminary)
-        preliminary_intent = self._classify_preliminary_intent(sanitized_message)
+        # Input validation and sanitization, type detection and preliminary intent classification
+        sanitized_message, input_type, preliminary_intent = self._scan_message(message)
         
         processed_input = {
             "original_message": message,
@@ -168,59 +543,167 @@ class ConversationOrchestrator:
         logger.info(f"Input processed - Intent: {preliminary_intent}, Type: {input_type}")
         return processed_input
     
+    def _scan_message(self, message: str) -> Tuple[str, str, str]:
+        """Sanitize a message and classify its input type and preliminary intent in one keyword scan"""
+        sanitized = (message or "").translate(_STRIPPED_CHARACTERS)
+        if len(sanitized) > MAX_MESSAGE_LENGTH:
+            sanitized = sanitized[:MAX_MESSAGE_LENGTH] + "..."
+        sanitized = sanitized.strip()
+        if not sanitized:
+            return sanitized, "empty", "general_query"
+        
+        if _URL_RE.search(sanitized):
+            input_type = "link"
+        elif "?" in sanitized:
+            input_type = "question"
+        elif "\n" in sanitized:
+            input_type = "description"
+        else:
+            input_type = "text"
+        
+        social = match_social_message(sanitized)
+        if social:
+            return sanitized, input_type, _SOCIAL_INTENTS[social]
+        
+        hits = _intent_hits(sanitized.lower())
+        if "emergency" in hits:
+            return sanitized, input_type, "emergency"
+        if "legal_query" in hits:
+            return sanitized, input_type, "legal_query"
+        return sanitized, input_type, "general_query"
+    
+    def _fast_greeting(self, session: UserSession, processed_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a greeting from the templates"""
+        templates = _RESPONSE_TEMPLATES[ConversationStage.GREETING]
+        content = templates["returning"] if session.query_history else templates["welcome"]
+        return self._template_response(session, processed_input, ConversationStage.GREETING, content)
+    
+    def _fast_closure(self, session: UserSession, processed_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a sign-off from the templates, asking for feedback"""
+        templates = _RESPONSE_TEMPLATES[ConversationStage.CLOSURE]
+        content = f"{templates['follow_up']} {templates['satisfaction']}"
+        return self._template_response(session, processed_input, ConversationStage.CLOSURE, content)
+    
+    def _fast_satisfaction(self, session: UserSession, processed_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer feedback on the consultation from the templates"""
+        content = _RESPONSE_TEMPLATES[ConversationStage.CLOSURE]["follow_up"]
+        return self._template_response(session, processed_input, ConversationStage.CLOSURE, content)
+    
+    def _template_response(
+        self,
+        session: UserSession,
+        processed_input: Dict[str, Any],
+        stage: ConversationStage,
+        content: str
+    ) -> Dict[str, Any]:
+        """Build a fast-path response, recording the turn in the session history"""
+        intent = processed_input["preliminary_intent"]
+        session.query_history.append({
+            "timestamp": processed_input["timestamp"],
+            "type": MessageType.USER,
+            "content": processed_input["sanitized_message"],
+            "intent": intent,
+            "entities": {}
+        })
+        
+        return {
+            "type": "ai_response",
+            "timestamp": get_current_timestamp(),
+            "session_id": session.session_id,
+            "content": content,
+            "metadata": {
+                "intent": intent,
+                "confidence": 1.0,
+                "conversation_stage": stage.value,
+                "processing_method": "template_fast_path"
+            }
+        }
+    
     async def _process_through_agents(
         self, 
         processed_input: Dict[str, Any], 
         session: UserSession,
-        rag_response: Optional[Dict[str, Any]] = None
+        on_delta: Optional[DeltaSink] = None
     ) -> Dict[str, Any]:
         """
-        Process through the agentic system (LangGraph)
-        Enhanced with RAG response integration
-        Following Technical Flow: Agentic Conversation System
+        Process through the Enhanced Legal Agent and the agentic system (LangGraph) side by side
+        The agent graph starts speculatively and is cancelled when the RAG response is sufficient
+        Following Technical Flow: Enhanced Legal Agent → Agentic Conversation System
         """
         
-        # Prepare agent graph input with RAG enhancement
-        agent_input = {
-            "session_id": session.session_id,
-            "user_id": session.user_id,
-            "message": processed_input["sanitized_message"],
-            "conversation_history": session.query_history,
-            "user_context": session.user_context,
-            "memory": session.conversation_state.get("memory", {}),
-            "rag_response": rag_response  # Include RAG response for agent enhancement
-        }
+        # The agent graph works on copies until its response is actually used
+        history = list(session.query_history)
+        memory = copy.deepcopy(session.memory)
+        
+        rag_task = asyncio.create_task(
+            self.process_with_enhanced_legal_agent_before_agentic(processed_input, session, on_delta)
+        )
+        agent_task = asyncio.create_task(self.agent_graph.process_message(
+            session.session_id,
+            session.user_id,
+            processed_input["sanitized_message"],
+            history,
+            session.user_context,
+            memory
+        ))
         
-        # Check if RAG response provides sufficient answer
-        if rag_response and self._is_rag_response_sufficient(rag_response):
-            # Use RAG response as primary, enhance with agents for interactive elements
-            enhanced_agent_response = await self._enhance_rag_with_agents(
-                rag_response, agent_input
-            )
-            logger.info("Using RAG response as primary with agent enhancement")
-            return enhanced_agent_response
-        else:
+        try:
+            rag_response = await rag_task
+            agent_input = {
+                "session_id": session.session_id,
+                "user_id": session.user_id,
+                "message": processed_input["sanitized_message"],
+                "conversation_history": session.query_history,
+                "user_context": session.user_context,
+                "memory": session.memory,
+                "rag_response": rag_response
+            }
+            
+            # Check if RAG response provides sufficient answer
+            if self._is_enhanced_rag_response_sufficient(rag_response):
+                agent_task.cancel()
+                
+                # Use RAG response as primary, enhance with agents for interactive elements
+                enhanced_agent_response = await self._enhance_rag_with_agents(
+                    rag_response, agent_input
+                )
+                logger.info("Using RAG response as primary with agent enhancement")
+                return enhanced_agent_response
+            
             # Process through full agent graph with RAG context
-            agent_response = await self.agent_graph.process_message(
-                session.session_id,
-                session.user_id,
-                processed_input["sanitized_message"],
-                session.query_history,
-                session.user_context,
-                session.conversation_state.get("memory", {})
-            )
+            try:
+                agent_response = await agent_task
+                agent_error = agent_response.get("content") if agent_response.get("type") == "error" else None
+            except Exception as e:
+                agent_error = str(e)
+            
+            if agent_error is not None:
+                # An answer the user has already seen streaming beats failing the turn
+                if rag_response.get("primary_content", "").strip():
+                    logger.warning(f"Agent graph failed, answering with the RAG response: {agent_error}")
+                    return await self._enhance_rag_with_agents(rag_response, agent_input)
+                raise RuntimeError(f"Agent graph failed: {agent_error}")
+            
+            # The agent turn is kept, so its history and memory become the session's
+            session.query_history[:] = history
+            session.memory = memory
             
             # Merge RAG insights into agent response
-            if rag_response:
-                agent_response = self._merge_rag_into_agent_response(agent_response, rag_response)
+            agent_response = self._merge_enhanced_rag_into_agent_response(agent_response, rag_response)
             
             logger.info(f"Agent processing complete - Stage: {agent_response.get('metadata', {}).get('conversation_stage')}")
             return agent_response
+        
+        finally:
+            for task in (rag_task, agent_task):
+                if not task.done():
+                    task.cancel()
     
     async def process_with_enhanced_legal_agent_before_agentic(
         self, 
         processed_input: Dict[str, Any], 
-        session: UserSession
+        session: UserSession,
+        on_delta: Optional[DeltaSink] = None
     ) -> Dict[str, Any]:
         """
         Process query through Enhanced Legal Agent with RAG capabilities BEFORE agentic processing
@@ -232,17 +715,18 @@ class ConversationOrchestrator:
             logger.info("🔍 Starting Enhanced Legal Agent processing with training data...")
             
             # Create comprehensive LegalQuery object
+            intent = processed_input.get("preliminary_intent")
             legal_query = LegalQuery(
                 query=processed_input["sanitized_message"],
                 user_id=session.user_id,
                 session_id=session.session_id,
-                query_type=self._infer_query_type_from_intent(processed_input.get("preliminary_intent")),
+                query_type=self._infer_query_type_from_intent(intent),
                 location=session.user_context.get("location", {}).get("city"),
-                urgency=session.user_context.get("urgency_level", "medium")
+                urgency="high" if intent == "emergency" else session.user_context.get("urgency_level", "medium")
             )
             
             # Process through Enhanced Legal Agent with RAG
-            rag_response = await self.enhanced_legal_agent.process_legal_query(legal_query)
+            rag_response = await self._run_legal_query(legal_query, session, on_delta)
             
             # Evaluate RAG response quality and completeness
             response_quality = self._evaluate_rag_response_quality(rag_response)
@@ -298,6 +782,113 @@ class ConversationOrchestrator:
                 }
             }
     
+    def _infer_query_type_from_intent(self, intent: Optional[str]) -> str:
+        """Map a preliminary intent to the Enhanced Legal Agent's query type"""
+        return _INTENT_QUERY_TYPES.get(intent, "guidance")
+    
+    def _determine_stage_from_rag_response(self, rag_response: Dict[str, Any]) -> str:
+        """Conversation stage a RAG response leaves the user in"""
+        # Without an answer, more information is needed before guidance can be given
+        if rag_response.get("error") or not rag_response.get("response", "").strip():
+            return ConversationStage.INFORMATION_GATHERING.value
+        
+        if not rag_response.get("context_used", False) and len(rag_response["response"]) < 200:
+            return ConversationStage.INFORMATION_GATHERING.value
+        
+        return ConversationStage.LEGAL_GUIDANCE.value
+    
+    async def _run_legal_query(
+        self,
+        legal_query: LegalQuery,
+        session: UserSession,
+        on_delta: Optional[DeltaSink] = None
+    ) -> Dict[str, Any]:
+        """
+        Answer a legal query from the RAG cache, or through the Enhanced Legal Agent while forwarding its text
+        Identical queries in flight at the same time share one agent run, and every caller receives its deltas
+        """
+        redis_client = self.session_manager.redis_client
+        cache_key = _rag_cache_key(legal_query)
+        
+        if redis_client:
+            try:
+                cached = await redis_client.get(cache_key)
+                if cached:
+                    logger.debug("RAG cache hit")
+                    return json.loads(cached)
+            except Exception as e:
+                logger.error(f"RAG cache lookup failed: {e}")
+        
+        flight = self._inflight.get(cache_key)
+        if flight is None:
+            flight = _LegalQueryFlight()
+            flight.task = asyncio.create_task(self._fly_legal_query(legal_query, cache_key, flight))
+            self._inflight[cache_key] = flight
+            flight.task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        else:
+            logger.debug("Joining in-flight Enhanced Legal Agent query")
+        
+        # A late joiner is caught up on the text so far with the next delta
+        waiter = [on_delta, session.session_id, 0]
+        if on_delta:
+            flight.waiters.append(waiter)
+        try:
+            # Shielded so a cancelled caller does not cancel the query for the others;
+            # every caller gets its own copy, as the response is mutated downstream
+            return copy.deepcopy(await asyncio.shield(flight.task))
+        finally:
+            flight.waiters[:] = [w for w in flight.waiters if w is not waiter]
+    
+    async def _fly_legal_query(
+        self,
+        legal_query: LegalQuery,
+        cache_key: str,
+        flight: _LegalQueryFlight
+    ) -> Dict[str, Any]:
+        """Run a legal query through the Enhanced Legal Agent, fanning its text out to the flight's waiters"""
+        rag_response = None
+        try:
+            async for frame in self.enhanced_legal_agent.stream_legal_query(legal_query):
+                if frame.get("type") != "delta":
+                    rag_response = frame
+                    continue
+                
+                flight.chunks.append(frame["content"])
+                for waiter in list(flight.waiters):
+                    on_delta, session_id, sent = waiter
+                    waiter[2] = len(flight.chunks)
+                    try:
+                        await on_delta({
+                            "type": "delta",
+                            "content": "".join(flight.chunks[sent:]),
+                            "session_id": session_id,
+                            "timestamp": get_current_timestamp()
+                        })
+                    except Exception as e:
+                        # One gone connection must not stop the query for the others
+                        logger.error(f"Delta delivery failed for session {session_id}: {e}")
+                        flight.waiters[:] = [w for w in flight.waiters if w is not waiter]
+        except Exception:
+            self._record_failure()
+            raise
+        
+        # Counted once per agent run, however many callers share it; the agent reports
+        # model and retrieval failures in the response rather than raising
+        if "error" in rag_response:
+            self._record_failure()
+            return rag_response
+        self._failure_times.clear()
+        
+        # Failed queries are retried next time rather than replayed
+        redis_client = self.session_manager.redis_client
+        if redis_client:
+            try:
+                await redis_client.setex(cache_key, RAG_CACHE_TTL, dumps_json(rag_response))
+            except Exception as e:
+                logger.error(f"RAG cache store failed: {e}")
+        
+        return rag_response
+    
     def _evaluate_rag_response_quality(self, rag_response: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate the quality and completeness of RAG response
@@ -307,6 +898,7 @@ class ConversationOrchestrator:
         response_content = rag_response.get("response", "")
         sources = rag_response.get("sources", [])
         context_used = rag_response.get("context_used", False)
+        keywords = _find_keywords(response_content.lower())
         
         # Quality indicators
         indicators = {
@@ -314,9 +906,9 @@ class ConversationOrchestrator:
             "has_sources": len(sources) > 0,
             "context_utilized": context_used,
             "response_length": len(response_content),
-            "source_diversity": len(set(s.get("type", "") for s in sources)),
-            "legal_terminology": self._contains_legal_terminology(response_content),
-            "actionable_guidance": self._contains_actionable_guidance(response_content),
+            "source_diversity": len(set(map(_source_type, sources))),
+            "legal_terminology": not keywords.isdisjoint(_LEGAL_TERMS),
+            "actionable_guidance": not keywords.isdisjoint(_ACTION_TERMS),
             "case_law_references": self._contains_case_law_references(response_content)
         }
         
@@ -382,20 +974,12 @@ class ConversationOrchestrator:
     
     def _extract_suggested_actions_from_rag(self, rag_response: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract actionable recommendations from RAG response"""
-        content = rag_response.get("response", "")
+        content = rag_response.get("response", "").lower()
         
         actions = []
         
-        # Look for action-oriented language
-        action_patterns = [
-            r"should (file|submit|apply|contact|gather|prepare)",
-            r"need to (file|submit|apply|contact|gather|prepare)",
-            r"must (file|submit|apply|contact|gather|prepare)",
-            r"recommended to (file|submit|apply|contact|gather|prepare)"
-        ]
-        
         # Extract immediate, short-term, and long-term actions
-        if "immediate" in content.lower() or "urgent" in content.lower():
+        if "immediate" in content or "urgent" in content:
             actions.append({
                 "type": "immediate",
                 "description": "Urgent action required",
@@ -403,7 +987,7 @@ class ConversationOrchestrator:
                 "timeline": "within 24 hours"
             })
         
-        if "file" in content.lower() and ("complaint" in content.lower() or "petition" in content.lower()):
+        if "file" in content and ("complaint" in content or "petition" in content):
             actions.append({
                 "type": "filing",
                 "description": "File legal complaint or petition",
@@ -411,7 +995,7 @@ class ConversationOrchestrator:
                 "timeline": "within 1-2 weeks"
             })
         
-        if "advocate" in content.lower() or "lawyer" in content.lower():
+        if "advocate" in content or "lawyer" in content:
             actions.append({
                 "type": "consultation",
                 "description": "Consult with legal professional",
@@ -425,29 +1009,18 @@ class ConversationOrchestrator:
         """Assess urgency level based on RAG response and query content"""
         content = rag_response.get("response", "").lower()
         query_content = legal_query.query.lower()
-        
-        # High urgency indicators
-        high_urgency_keywords = [
-            "urgent", "immediate", "deadline", "time limit", "expire", "arrest", 
-            "detention", "seizure", "eviction", "termination", "emergency"
-        ]
-        
-        # Medium urgency indicators
-        medium_urgency_keywords = [
-            "court date", "hearing", "notice", "summons", "legal action",
-            "complaint", "dispute", "violation"
-        ]
+        keywords = _find_keywords(content) | _find_keywords(query_content)
         
         urgency_score = 0
         triggered_keywords = []
         
-        for keyword in high_urgency_keywords:
-            if keyword in content or keyword in query_content:
+        for keyword in _HIGH_URGENCY_KEYWORDS:
+            if keyword in keywords:
                 urgency_score += 2
                 triggered_keywords.append(keyword)
         
-        for keyword in medium_urgency_keywords:
-            if keyword in content or keyword in query_content:
+        for keyword in _MEDIUM_URGENCY_KEYWORDS:
+            if keyword in keywords:
                 urgency_score += 1
                 triggered_keywords.append(keyword)
         
@@ -470,34 +1043,15 @@ class ConversationOrchestrator:
     
     def _contains_legal_terminology(self, content: str) -> bool:
         """Check if content contains legal terminology"""
-        legal_terms = [
-            "section", "act", "law", "court", "petition", "complaint", "jurisdiction",
-            "precedent", "statute", "regulation", "legal", "rights", "liability",
-            "contract", "agreement", "violation", "offense", "penalty", "damages"
-        ]
-        content_lower = content.lower()
-        return any(term in content_lower for term in legal_terms)
+        return not _find_keywords(content.lower()).isdisjoint(_LEGAL_TERMS)
     
     def _contains_actionable_guidance(self, content: str) -> bool:
         """Check if content contains actionable guidance"""
-        action_terms = [
-            "should", "need to", "must", "recommended", "steps", "process",
-            "file", "submit", "apply", "contact", "gather", "prepare", "visit"
-        ]
-        content_lower = content.lower()
-        return any(term in content_lower for term in action_terms)
+        return not _find_keywords(content.lower()).isdisjoint(_ACTION_TERMS)
     
     def _contains_case_law_references(self, content: str) -> bool:
         """Check if content contains case law references"""
-        case_patterns = [
-            r"\b\d{4}\b.*\b(SC|HC|SCC|AIR|PLD)\b",
-            r"\bv\.\s+\w+",
-            r"\bcase\s+of\b",
-            r"\bjudgment\b",
-            r"\bruling\b"
-        ]
-        import re
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in case_patterns)
+        return _has_case_law_references(content)
     
     def _identify_priority_enhancement_areas(self, indicators: Dict[str, Any], missing_elements: List[str]) -> List[str]:
         """Identify priority areas for agentic enhancement"""
@@ -519,48 +1073,25 @@ class ConversationOrchestrator:
     
     def _extract_applicable_laws(self, content: str, sources: List[Dict]) -> List[str]:
         """Extract applicable laws from content and sources"""
-        laws = []
-        
-        # Extract from content
-        import re
-        act_pattern = r'([A-Z][a-z\s]+Act,?\s*\d{4})'
-        section_pattern = r'Section\s+(\d+[A-Z]?)'
-        
-        laws.extend(re.findall(act_pattern, content))
-        laws.extend([f"Section {s}" for s in re.findall(section_pattern, content)])
-        
-        # Extract from sources metadata
-        for source in sources:
-            if source.get("type") == "case_law":
-                relevant_sections = source.get("metadata", {}).get("relevant_sections", [])
-                laws.extend(relevant_sections)
-        
-        return list(set(laws))  # Remove duplicates
+        # Sections cited in case law sources metadata
+        source_sections = tuple(
+            section
+            for source in sources
+            if _source_type(source) == "case_law"
+            for section in source.get("metadata", {}).get("relevant_sections", [])
+        )
+        return list(_applicable_laws(content, source_sections))
     
     def _extract_legal_principles(self, content: str) -> List[str]:
         """Extract legal principles from content"""
-        principles = []
-        
-        # Look for principle-indicating phrases
-        principle_patterns = [
-            r'principle\s+(?:of\s+)?([^.]+)',
-            r'doctrine\s+(?:of\s+)?([^.]+)',
-            r'rule\s+(?:of\s+)?([^.]+)'
-        ]
-        
-        import re
-        for pattern in principle_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            principles.extend(matches)
-        
-        return principles
+        return list(_legal_principles(content))
     
     def _extract_precedents(self, sources: List[Dict]) -> List[Dict[str, str]]:
         """Extract precedents from sources"""
         precedents = []
         
         for source in sources:
-            if source.get("type") == "case_law":
+            if _source_type(source) == "case_law":
                 metadata = source.get("metadata", {})
                 precedents.append({
                     "case_name": metadata.get("case_name", ""),
@@ -573,43 +1104,11 @@ class ConversationOrchestrator:
     
     def _extract_risk_factors(self, content: str) -> List[str]:
         """Extract risk factors from content"""
-        risk_keywords = [
-            "risk", "penalty", "fine", "imprisonment", "liability", "damages",
-            "consequence", "violation", "breach", "default"
-        ]
-        
-        risks = []
-        content_lower = content.lower()
-        
-        for keyword in risk_keywords:
-            if keyword in content_lower:
-                # Extract sentence containing the risk keyword
-                sentences = content.split('.')
-                for sentence in sentences:
-                    if keyword in sentence.lower():
-                        risks.append(sentence.strip())
-                        break
-        
-        return risks
+        return list(_risk_factors(content))
     
     def _extract_compliance_requirements(self, content: str) -> List[str]:
         """Extract compliance requirements from content"""
-        compliance_keywords = [
-            "must", "required", "mandatory", "obligatory", "compulsory",
-            "shall", "need to", "have to"
-        ]
-        
-        requirements = []
-        content_lower = content.lower()
-        
-        for keyword in compliance_keywords:
-            if keyword in content_lower:
-                sentences = content.split('.')
-                for sentence in sentences:
-                    if keyword in sentence.lower():
-                        requirements.append(sentence.strip())
-        
-        return list(set(requirements))  # Remove duplicates
+        return list(_compliance_requirements(content))
     
     def _is_enhanced_rag_response_sufficient(self, enhanced_rag_response: Dict[str, Any]) -> bool:
         """
@@ -634,15 +1133,22 @@ class ConversationOrchestrator:
         Enhance the RAG response with agent-generated interactive elements
         """
         try:
-            # Generate interactive elements using a lightweight agent call
-            interactive_elements = await self._generate_interactive_elements(
-                enhanced_rag_response, agent_input
-            )
+            # Either one failing degrades to an empty result rather than losing the other
+            try:
+                interactive_elements = self._generate_interactive_elements(enhanced_rag_response, agent_input)
+            except Exception as e:
+                logger.error(f"Error generating interactive elements: {e}")
+                interactive_elements = {
+                    "quick_actions": [],
+                    "clarification_options": [],
+                    "follow_up_suggestions": []
+                }
+            advocate_recommendations = self._generate_advocate_recommendations(enhanced_rag_response, agent_input)
             
-            # Generate advocate recommendations if needed
-            advocate_recommendations = await self._generate_advocate_recommendations(
-                enhanced_rag_response, agent_input
-            )
+            # The RAG response belongs to this turn, so its metadata is extended in place
+            metadata = enhanced_rag_response.setdefault("metadata", {})
+            metadata["enhancement_type"] = "rag_with_agent_interactivity"
+            metadata["agent_enhanced"] = True
             
             # Combine RAG response with agent enhancements
             enhanced_response = {
@@ -652,11 +1158,7 @@ class ConversationOrchestrator:
                 "interactive_elements": interactive_elements,
                 "advocate_recommendations": advocate_recommendations,
                 "urgency_assessment": enhanced_rag_response.get("urgency_assessment", {}),
-                "metadata": {
-                    **enhanced_rag_response.get("metadata", {}),
-                    "enhancement_type": "rag_with_agent_interactivity",
-                    "agent_enhanced": True
-                }
+                "metadata": metadata
             }
             
             return enhanced_response
@@ -664,12 +1166,11 @@ class ConversationOrchestrator:
         except Exception as e:
             logger.error(f"Error enhancing RAG with agents: {e}")
             # Return RAG response as-is if enhancement fails
+            metadata = enhanced_rag_response.setdefault("metadata", {})
+            metadata["enhancement_error"] = str(e)
             return {
                 "conversational_response": enhanced_rag_response.get("primary_content", ""),
-                "metadata": {
-                    **enhanced_rag_response.get("metadata", {}),
-                    "enhancement_error": str(e)
-                }
+                "metadata": metadata
             }
     
     def _merge_enhanced_rag_into_agent_response(
@@ -681,36 +1182,33 @@ class ConversationOrchestrator:
         Merge enhanced RAG insights into agent response
         """
         try:
-            # Merge the responses prioritizing agent response but enriching with RAG data
-            merged_response = {
-                **agent_response,
-                "rag_enhanced": True,
-                "training_data_sources": enhanced_rag_response.get("training_data_sources", []),
-                "rag_legal_analysis": enhanced_rag_response.get("legal_analysis", {}),
-                "rag_urgency_assessment": enhanced_rag_response.get("urgency_assessment", {}),
-            }
+            # Enrich the agent response in place, prioritizing agent data over RAG data
+            agent_response["rag_enhanced"] = True
+            agent_response["training_data_sources"] = enhanced_rag_response.get("training_data_sources", [])
+            agent_response["rag_legal_analysis"] = enhanced_rag_response.get("legal_analysis", {})
+            agent_response["rag_urgency_assessment"] = enhanced_rag_response.get("urgency_assessment", {})
             
             # Enhance metadata
-            if "metadata" in merged_response:
-                merged_response["metadata"]["rag_enhanced"] = True
-                merged_response["metadata"]["rag_confidence"] = enhanced_rag_response.get("confidence_score", 0.0)
-                merged_response["metadata"]["training_data_utilized"] = True
+            if "metadata" in agent_response:
+                agent_response["metadata"]["rag_enhanced"] = True
+                agent_response["metadata"]["rag_confidence"] = enhanced_rag_response.get("confidence_score", 0.0)
+                agent_response["metadata"]["training_data_utilized"] = True
             
             # Merge suggested actions if both exist
-            agent_actions = agent_response.get("suggested_actions", [])
+            agent_actions = agent_response.get("suggested_actions")
             rag_actions = enhanced_rag_response.get("suggested_actions", [])
             if agent_actions and rag_actions:
-                merged_response["suggested_actions"] = agent_actions + rag_actions
+                agent_actions.extend(rag_actions)
             elif rag_actions:
-                merged_response["suggested_actions"] = rag_actions
+                agent_response["suggested_actions"] = rag_actions
             
-            return merged_response
+            return agent_response
             
         except Exception as e:
             logger.error(f"Error merging enhanced RAG into agent response: {e}")
             return agent_response
     
-    async def _generate_interactive_elements(
+    def _generate_interactive_elements(
         self, 
         enhanced_rag_response: Dict[str, Any], 
         agent_input: Dict[str, Any]
@@ -726,19 +1224,10 @@ class ConversationOrchestrator:
         
         # Generate quick actions based on suggested actions
         suggested_actions = enhanced_rag_response.get("suggested_actions", [])
-        for action in suggested_actions:
-            if action.get("type") == "filing":
-                interactive_elements["quick_actions"].append({
-                    "label": "Help with Filing",
-                    "action": "guide_filing_process",
-                    "description": "Guide me through the filing process"
-                })
-            elif action.get("type") == "consultation":
-                interactive_elements["quick_actions"].append({
-                    "label": "Find Advocate",
-                    "action": "find_advocate",
-                    "description": "Connect me with a qualified advocate"
-                })
+        interactive_elements["quick_actions"] = [
+            dict(_QUICK_ACTIONS[action["type"]])
+            for action in suggested_actions if action.get("type") in _QUICK_ACTIONS
+        ]
         
         # Generate clarification options based on legal analysis
         legal_analysis = enhanced_rag_response.get("legal_analysis", {})
@@ -758,7 +1247,7 @@ class ConversationOrchestrator:
         
         return interactive_elements
     
-    async def _generate_advocate_recommendations(
+    def _generate_advocate_recommendations(
         self, 
         enhanced_rag_response: Dict[str, Any], 
         agent_input: Dict[str, Any]
@@ -799,32 +1288,9 @@ class ConversationOrchestrator:
         """
         Determine required legal specializations from RAG analysis
         """
-        specializations = []
-        
         legal_analysis = enhanced_rag_response.get("legal_analysis", {})
         applicable_laws = legal_analysis.get("applicable_laws", [])
         query_type = enhanced_rag_response.get("query_classification", "")
         
-        # Map query types to specializations
-        specialization_mapping = {
-            "procedure": ["procedural_law", "court_practice"],
-            "case_law": ["litigation", "legal_research"],
-            "rights": ["constitutional_law", "human_rights"],
-            "guidance": ["legal_consultation", "advisory_services"]
-        }
-        
-        if query_type in specialization_mapping:
-            specializations.extend(specialization_mapping[query_type])
-        
-        # Add specific law specializations
-        for law in applicable_laws:
-            if "criminal" in law.lower():
-                specializations.append("criminal_law")
-            elif "civil" in law.lower():
-                specializations.append("civil_law")
-            elif "family" in law.lower():
-                specializations.append("family_law")
-            elif "property" in law.lower():
-                specializations.append("property_law")
-        
-        return list(set(specializations))  # Remove duplicates
+        # Sorted, so the same laws in another order share a cache entry
+        return list(_specializations(query_type, tuple(sorted(applicable_laws))))
@@ -3,10 +3,18 @@ Enhanced Legal AI Agent with RAG capabilities
 Combines local training data with Ollama Gemma3 model
 """
 
+import asyncio
 import os
+import re
 import logging
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import time
+from collections import deque
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+import numpy as np
 
 from ..services.ollama_service import OllamaService, OllamaConfig
 from ..services.vector_db_service import VectorDBService
@@ -14,7 +22,123 @@ from ..services.indian_kanoon_client import IndianKanoonClient
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Near-duplicate queries (same location and query type) reuse the training data context of a recent query
+PROXIMITY_CACHE_SIZE = int(os.getenv("RAG_PROXIMITY_CACHE_SIZE", "128"))
+PROXIMITY_CACHE_THRESHOLD = float(os.getenv("RAG_PROXIMITY_CACHE_THRESHOLD", "0.97"))
+PROXIMITY_CACHE_TTL = float(os.getenv("RAG_PROXIMITY_CACHE_TTL", "600"))
+
+# System prompts for the legal model; every variant is built once
+_BASE_SYSTEM_PROMPT = """You are LegalLink AI, an expert legal assistant specializing in Indian law. 
+You have access to comprehensive legal training data including case law, procedures, and legal principles.
+
+Your responsibilities:
+1. Provide accurate legal guidance based on Indian legal system
+2. Cite relevant sections, acts, cases, and legal precedents when applicable
+3. Explain legal procedures step-by-step when asked
+4. Clarify legal concepts in simple, understandable language
+5. Always emphasize the importance of consulting qualified legal professionals for specific cases
+
+Guidelines:
+- Be precise and factual in your responses
+- Use the provided context to enhance your answers
+- If uncertain about any legal point, clearly state your limitations
+- Provide practical, actionable advice while maintaining legal accuracy
+- Structure your responses clearly with headings and bullet points when appropriate"""
+_QUERY_TYPE_SYSTEM_PROMPTS = MappingProxyType({
+    "procedure": _BASE_SYSTEM_PROMPT + "\n\nFocus on: Providing step-by-step procedural guidance with timeline and required documents.",
+    "case_law": _BASE_SYSTEM_PROMPT + "\n\nFocus on: Relevant case precedents, legal principles, and judicial interpretations.",
+    "rights": _BASE_SYSTEM_PROMPT + "\n\nFocus on: Legal rights, protections available, and remedies under Indian law."
+})
+_URGENT_SYSTEM_PROMPT = _BASE_SYSTEM_PROMPT + "\n\nNote: This appears to be an urgent legal matter. Prioritize immediate actionable steps and emergency procedures."
+
+# Time budgets of the outbound calls, so a slow service cannot hold a query indefinitely;
+# case law and simplification are optional and fall back to none, the legal model to its partial answer
+KANOON_TIMEOUT_S = float(os.getenv("KANOON_TIMEOUT_S", "2.0"))
+LEGAL_MODEL_TIMEOUT_S = float(os.getenv("LEGAL_MODEL_TIMEOUT_S", "60.0"))
+LANGUAGE_MODEL_TIMEOUT_S = float(os.getenv("LANGUAGE_MODEL_TIMEOUT_S", "30.0"))
+
+# Section headers of the combined context
+_TRAINING_HEADER = "=== TRAINING DATA CONTEXT ===\n"
+_CASE_LAW_HEADER = "=== CASE LAW CONTEXT (Indian Kanoon) ===\n"
+
+# Smallest block of a streamed legal response handed to the Language Model on its own
+SIMPLIFY_BLOCK_CHARS = int(os.getenv("SIMPLIFY_BLOCK_CHARS", "600"))
+
+# User messages whose training data context a chat turn retrieves
+CHAT_CONTEXT_MESSAGES = 3
+
+# Query keywords by legal area, tried in order; matched against the words of the query
+_SEARCH_AREA_KEYWORDS = (
+    (frozenset({"fir", "police", "crime", "criminal"}), "criminal law procedure"),
+    (frozenset({"property", "land", "title", "ownership"}), "property law real estate"),
+    (frozenset({"marriage", "divorce", "family"}), "family law"),
+    (frozenset({"contract", "contracts", "agreement", "agreements", "business"}), "contract law civil")
+)
+
+# Query keywords by query type, tried in order; "how to" is checked as a phrase
+_PROCEDURE_KW = frozenset({"procedure", "process", "steps"})
+_CASE_LAW_KW = frozenset({"case", "cases", "judgment", "judgments", "precedent", "precedents", "court"})
+_RIGHTS_KW = frozenset({"right", "rights", "entitled", "protection"})
+_URGENT_KW = frozenset({"urgent", "emergency", "immediate", "asap"})
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Configuration does not change over the process lifetime, so it is read from the environment once
+# Legal Intelligence Model (llama3.2:3b)
+LEGAL_OLLAMA_CONFIG = OllamaConfig(
+    base_url=os.getenv("AI_LEGAL_MODEL_ENDPOINT", "http://localhost:11434"),
+    model_name=os.getenv("AI_LEGAL_MODEL_NAME", "llama3.2:3b"),
+    temperature=float(os.getenv("AI_TEMPERATURE", "0.7")),
+    max_tokens=int(os.getenv("AI_MAX_TOKENS", "2048")),
+    api=os.getenv("AI_LEGAL_MODEL_API", "ollama")
+)
+
+# Language/Multilingual Model (gemma3)
+LANGUAGE_OLLAMA_CONFIG = OllamaConfig(
+    base_url=os.getenv("AI_LANGUAGE_MODEL_ENDPOINT", "http://localhost:11434"),
+    model_name=os.getenv("AI_LANGUAGE_MODEL_NAME", "gemma3"),
+    temperature=float(os.getenv("AI_TEMPERATURE", "0.7")),
+    max_tokens=int(os.getenv("AI_MAX_TOKENS", "1024")),
+    api=os.getenv("AI_LANGUAGE_MODEL_API", "ollama")
+)
+
+VECTOR_CONFIG = MappingProxyType({
+    "db_path": os.getenv("VECTOR_DB_PATH", "./Database/vector_store"),
+    "training_data_path": os.getenv("TRAINING_DATA_PATH", "./Database/training_data"),
+    "embedding_model": os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
+    "chunk_size": int(os.getenv("RAG_CHUNK_SIZE", "1000")),
+    "chunk_overlap": int(os.getenv("RAG_CHUNK_OVERLAP", "200")),
+    "top_k": int(os.getenv("RAG_TOP_K", "5"))
+})
+
+# Source labels are a pure function of the combined context; repeated contexts reuse them
+RAG_ANALYSIS_CACHE_SIZE = int(os.getenv("RAG_ANALYSIS_CACHE_SIZE", "1024"))
+
+@lru_cache(maxsize=RAG_ANALYSIS_CACHE_SIZE)
+def _context_sources(context: str) -> Tuple[str, ...]:
+    """Extract source information from context"""
+    sources = []
+    
+    # This is a simplified extraction - in a real implementation,
+    # you'd want to track sources more systematically
+    if "Case:" in context:
+        sources.append("Case Law Database")
+    if "Court:" in context:
+        sources.append("Court Hierarchy Information")
+    if "Section" in context:
+        sources.append("Legal Acts and Sections")
+    if "Procedure" in context or "procedure" in context:
+        sources.append("Legal Procedures")
+    
+    return tuple(sources)
+
+# Legal terms that make a response worth a simplification pass
+COMPLEX_LEGAL_TERMS = (
+    "whereas", "heretofore", "notwithstanding", "pursuant", "aforementioned",
+    "inter alia", "prima facie", "res judicata", "ultra vires", "bona fide"
+)
+
+@dataclass(slots=True)
 class LegalQuery:
     """Represents a legal query with context"""
     query: str
@@ -23,6 +147,8 @@ class LegalQuery:
     query_type: Optional[str] = None  # e.g., "procedure", "case_law", "rights", etc.
     location: Optional[str] = None
     urgency: Optional[str] = None  # "low", "medium", "high"
+    # Whether the query is in a non-English script; worked out once, on first use
+    _needs_translation: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
 
 class EnhancedLegalAgent:
     """AI agent that combines local training data with multiple Ollama models and Indian Kanoon API"""
@@ -34,54 +160,29 @@ class EnhancedLegalAgent:
         self.indian_kanoon_client = None
         self.initialized = False
         
-        # Load configuration from environment for different models
-        # Legal Intelligence Model (llama3.2:3b)
-        self.legal_ollama_config = OllamaConfig(
-            base_url=os.getenv("AI_LEGAL_MODEL_ENDPOINT", "http://localhost:11434"),
-            model_name=os.getenv("AI_LEGAL_MODEL_NAME", "llama3.2:3b"),
-            temperature=float(os.getenv("AI_TEMPERATURE", "0.7")),
-            max_tokens=int(os.getenv("AI_MAX_TOKENS", "2048"))
-        )
-        
-        # Language/Multilingual Model (gemma3)
-        self.language_ollama_config = OllamaConfig(
-            base_url=os.getenv("AI_LANGUAGE_MODEL_ENDPOINT", "http://localhost:11434"),
-            model_name=os.getenv("AI_LANGUAGE_MODEL_NAME", "gemma3"),
-            temperature=float(os.getenv("AI_TEMPERATURE", "0.7")),
-            max_tokens=int(os.getenv("AI_MAX_TOKENS", "1024"))
-        )
+        # Recent search queries as (unit embedding, (location, query type), stored at, context)
+        self._proximity_cache = deque(maxlen=PROXIMITY_CACHE_SIZE)
         
-        self.vector_config = {
-            "db_path": os.getenv("VECTOR_DB_PATH", "./Database/vector_store"),
-            "training_data_path": os.getenv("TRAINING_DATA_PATH", "./Database/training_data"),
-            "embedding_model": os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
-            "chunk_size": int(os.getenv("RAG_CHUNK_SIZE", "1000")),
-            "chunk_overlap": int(os.getenv("RAG_CHUNK_OVERLAP", "200")),            "top_k": int(os.getenv("RAG_TOP_K", "5"))
-        }
+        # Configuration for different models, resolved from the environment at import
+        self.legal_ollama_config = LEGAL_OLLAMA_CONFIG
+        self.language_ollama_config = LANGUAGE_OLLAMA_CONFIG
+        self.vector_config = VECTOR_CONFIG
     
     async def initialize(self):
         """Initialize the enhanced legal agent with multiple models and services"""
         try:
             logger.info("Initializing Enhanced Legal Agent with multi-model setup...")
             
-            # Initialize Legal Intelligence Ollama service (llama3.2:3b)
-            logger.info("Initializing Legal Intelligence Model (llama3.2:3b)...")
+            # Legal Intelligence Ollama service (llama3.2:3b)
             self.legal_ollama_service = OllamaService(self.legal_ollama_config)
-            await self.legal_ollama_service.initialize()
             
-            # Initialize Language/Multilingual Ollama service (gemma3)
-            logger.info("Initializing Language Model (gemma3)...")
+            # Language/Multilingual Ollama service (gemma3)
             self.language_ollama_service = OllamaService(self.language_ollama_config)
-            await self.language_ollama_service.initialize()
             
-            # Initialize Indian Kanoon client for case law
-            logger.info("Initializing Indian Kanoon API client...")
-            from ..services.indian_kanoon_client import IndianKanoonClient
+            # Indian Kanoon client for case law
             self.indian_kanoon_client = IndianKanoonClient()
-            await self.indian_kanoon_client.initialize()
             
-            # Initialize Vector DB service for training data
-            logger.info("Initializing Vector Database with training data...")
+            # Vector DB service for training data
             self.vector_db_service = VectorDBService(
                 db_path=self.vector_config["db_path"],
                 training_data_path=self.vector_config["training_data_path"],
@@ -89,7 +190,15 @@ class EnhancedLegalAgent:
                 chunk_size=self.vector_config["chunk_size"],
                 chunk_overlap=self.vector_config["chunk_overlap"]
             )
-            await self.vector_db_service.initialize()
+            
+            # The services are independent, so they start up together
+            logger.info("Initializing Legal Intelligence Model (llama3.2:3b), Language Model (gemma3), Indian Kanoon API client and Vector Database with training data...")
+            await asyncio.gather(
+                self.legal_ollama_service.initialize(),
+                self.language_ollama_service.initialize(),
+                self.indian_kanoon_client.initialize(),
+                self.vector_db_service.initialize()
+            )
             
             self.initialized = True
             logger.info("✅ Enhanced Legal Agent initialized successfully")
@@ -106,19 +215,44 @@ class EnhancedLegalAgent:
         3. llama3.2:3b for legal intelligence & complex reasoning
         4. gemma3 for sentence simplification & multilingual support
         """
+        result = None
+        async for frame in self.stream_legal_query(legal_query):
+            result = frame
+        return result
+    
+    async def stream_legal_query(self, legal_query: LegalQuery) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a legal query like process_legal_query, yielding {"type": "delta"} frames
+        with the legal model's text as it is decoded and the complete result last
+        """
         if not self.initialized:
             raise Exception("Agent not initialized")
         
+        # Simplifications of blocks of the legal response started while it streams
+        simplified_blocks = []
+        
         try:
             logger.info(f"🔍 Processing legal query: {legal_query.query[:100]}...")
             
-            # Step 1: Get relevant context from training data (local knowledge)
-            logger.info("� Retrieving context from local training data...")
-            training_context = await self._get_relevant_context(legal_query)
+            # Steps 1-2: Get relevant context from training data (local knowledge) and
+            # case law from Indian Kanoon API (past legal precedents); they are independent
+            logger.info("📚 Retrieving context from local training data and case law from Indian Kanoon API...")
+            training_context, case_law_context = await asyncio.gather(
+                self._get_relevant_context(legal_query),
+                asyncio.wait_for(self._get_case_law_context(legal_query), KANOON_TIMEOUT_S),
+                return_exceptions=True
+            )
             
-            # Step 2: Get case law from Indian Kanoon API (past legal precedents)
-            logger.info("📚 Retrieving case law from Indian Kanoon API...")
-            case_law_context = await self._get_case_law_context(legal_query)
+            # A failed source contributes no context rather than failing the query
+            if isinstance(training_context, Exception):
+                logger.error(f"Error getting relevant context: {training_context}")
+                training_context = ""
+            if isinstance(case_law_context, asyncio.TimeoutError):
+                logger.warning(f"Indian Kanoon did not answer within {KANOON_TIMEOUT_S}s, continuing without case law")
+                case_law_context = ""
+            elif isinstance(case_law_context, Exception):
+                logger.error(f"Error retrieving case law context: {case_law_context}")
+                case_law_context = ""
             
             # Step 3: Combine all contexts for comprehensive legal knowledge
             combined_context = self._combine_contexts(training_context, case_law_context)
@@ -128,24 +262,43 @@ class EnhancedLegalAgent:
             
             # Step 5: Use Legal Intelligence Model (llama3.2:3b) for complex legal reasoning
             logger.info("🧠 Processing with Legal Intelligence Model (llama3.2:3b) for complex reasoning...")
-            legal_response = await self.legal_ollama_service.generate_response(
-                prompt=legal_query.query,
-                context=combined_context,
-                system_prompt=system_prompt
-            )
+            
+            # A query needing translation is known to need the Language Model before generation,
+            # so each finished block of the legal response is simplified while the rest is generated
+            pipelined = self._query_needs_translation(legal_query)
+            pending = ""
+            
+            legal_chunks = []
+            async for chunk in self._stream_legal_response(legal_query.query, combined_context, system_prompt):
+                legal_chunks.append(chunk)
+                yield {"type": "delta", "content": chunk}
+                
+                if pipelined:
+                    pending += chunk
+                    split_at = pending.rfind("\n\n")
+                    if split_at >= SIMPLIFY_BLOCK_CHARS:
+                        simplified_blocks.append(asyncio.create_task(self._simplify_block(pending[:split_at])))
+                        pending = pending[split_at + 2:]
+            legal_response = "".join(legal_chunks)
             
             # Step 6: Use Language Model (gemma3) for simplification & multilingual support
             logger.info("🔤 Processing with Language Model (gemma3) for simplification...")
-            simplified_response = await self._simplify_response_if_needed(
-                legal_response, legal_query
-            )
+            if pipelined:
+                if pending.strip():
+                    simplified_blocks.append(asyncio.create_task(self._simplify_block(pending)))
+                simplified_response = "\n\n".join(await asyncio.gather(*simplified_blocks))
+            else:
+                # Otherwise complexity can only be judged on the complete response
+                simplified_response = await self._simplify_response_if_needed(
+                    legal_response, legal_query
+                )
             
             # Step 7: Post-process and format final response
             formatted_response = await self._format_response(
                 simplified_response, legal_query, combined_context
             )
             
-            return {
+            yield {
                 "response": formatted_response,
                 "context_used": len(combined_context) > 0,
                 "query_type": legal_query.query_type,
@@ -166,11 +319,45 @@ class EnhancedLegalAgent:
             
         except Exception as e:
             logger.error(f"Error processing legal query: {e}")
-            return {
+            yield {
                 "response": "I apologize, but I encountered an error while processing your query. Please try again or contact support if the issue persists.",
                 "error": str(e),
                 "context_used": False
             }
+        
+        finally:
+            # Nothing waits for the blocks if generation failed or the caller stopped reading
+            for task in simplified_blocks:
+                task.cancel()
+    
+    async def _stream_legal_response(self, prompt: str, context: str, system_prompt: str) -> AsyncIterator[str]:
+        """Stream the legal model's response, ending it early once LEGAL_MODEL_TIMEOUT_S has passed"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LEGAL_MODEL_TIMEOUT_S
+        stream = self.legal_ollama_service.stream_response(
+            prompt=prompt,
+            context=context,
+            system_prompt=system_prompt
+        )
+        
+        received = False
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(stream.__anext__(), max(deadline - loop.time(), 0))
+                except StopAsyncIteration:
+                    return
+                except asyncio.TimeoutError:
+                    # Without any text there is no answer to fall back on
+                    if not received:
+                        raise asyncio.TimeoutError(f"Legal model produced no response within {LEGAL_MODEL_TIMEOUT_S}s")
+                    logger.warning(f"Legal model exceeded {LEGAL_MODEL_TIMEOUT_S}s, keeping the partial response")
+                    return
+                
+                received = True
+                yield chunk
+        finally:
+            await stream.aclose()
     
     async def _get_relevant_context(self, legal_query: LegalQuery) -> str:
         """Retrieve relevant context from training data"""
@@ -178,18 +365,47 @@ class EnhancedLegalAgent:
             # Enhance query with context clues
             enhanced_query = self._enhance_query_for_search(legal_query)
             
+            # A query close enough to a recent one for the same location and query type
+            # gets its context without a database search
+            query_embedding = await self.vector_db_service.encode_query_async(enhanced_query)
+            query_vector = query_embedding[0] / (np.linalg.norm(query_embedding[0]) or 1.0)
+            scope = (legal_query.location, legal_query.query_type)
+            now = time.monotonic()
+            candidates = [
+                entry for entry in self._proximity_cache
+                if entry[1] == scope and now - entry[2] < PROXIMITY_CACHE_TTL
+            ]
+            if candidates:
+                similarities = np.stack([entry[0] for entry in candidates]) @ query_vector
+                best = int(similarities.argmax())
+                if similarities[best] >= PROXIMITY_CACHE_THRESHOLD:
+                    return candidates[best][3]
+            
             # Get relevant documents
             context = await self.vector_db_service.get_relevant_context(
                 enhanced_query,
-                max_tokens=1500  # Leave room for query and response
+                max_tokens=1500,  # Leave room for query and response
+                query_embedding=query_embedding
             )
             
+            # An empty context may be a failed search, which is worth retrying
+            if context:
+                self._proximity_cache.append((query_vector, scope, now, context))
             return context
             
         except Exception as e:
             logger.error(f"Error getting relevant context: {e}")
             return ""
     
+    async def _get_relevant_context_multi(self, queries: List[str]) -> str:
+        """Retrieve training data context for several queries with one batched lookup"""
+        try:
+            # The queries share the context budget of a single lookup
+            return await self.vector_db_service.get_relevant_context_multi(queries, max_tokens=1500)
+        except Exception as e:
+            logger.error(f"Error getting relevant context: {e}")
+            return ""
+    
     def _enhance_query_for_search(self, legal_query: LegalQuery) -> str:
         """Enhance query with additional context for better search"""
         enhanced_parts = [legal_query.query]
@@ -201,48 +417,23 @@ class EnhancedLegalAgent:
             enhanced_parts.append(f"jurisdiction {legal_query.location}")
         
         # Add legal keywords if query seems to be about specific areas
-        query_lower = legal_query.query.lower()
-        if any(word in query_lower for word in ["fir", "police", "crime", "criminal"]):
-            enhanced_parts.append("criminal law procedure")
-        elif any(word in query_lower for word in ["property", "land", "title", "ownership"]):
-            enhanced_parts.append("property law real estate")
-        elif any(word in query_lower for word in ["marriage", "divorce", "family"]):
-            enhanced_parts.append("family law")
-        elif any(word in query_lower for word in ["contract", "agreement", "business"]):
-            enhanced_parts.append("contract law civil")
+        tokens = set(_WORD_RE.findall(legal_query.query.lower()))
+        for keywords, area_terms in _SEARCH_AREA_KEYWORDS:
+            if tokens & keywords:
+                enhanced_parts.append(area_terms)
+                break
         
         return " ".join(enhanced_parts)
     
     def _generate_system_prompt(self, legal_query: LegalQuery) -> str:
         """Generate system prompt based on query type and context"""
-        base_prompt = """You are LegalLink AI, an expert legal assistant specializing in Indian law. 
-You have access to comprehensive legal training data including case law, procedures, and legal principles.
-
-Your responsibilities:
-1. Provide accurate legal guidance based on Indian legal system
-2. Cite relevant sections, acts, cases, and legal precedents when applicable
-3. Explain legal procedures step-by-step when asked
-4. Clarify legal concepts in simple, understandable language
-5. Always emphasize the importance of consulting qualified legal professionals for specific cases
-
-Guidelines:
-- Be precise and factual in your responses
-- Use the provided context to enhance your answers
-- If uncertain about any legal point, clearly state your limitations
-- Provide practical, actionable advice while maintaining legal accuracy
-- Structure your responses clearly with headings and bullet points when appropriate"""
-        
         # Add specific guidance based on query type
-        if legal_query.query_type == "procedure":
-            base_prompt += "\n\nFocus on: Providing step-by-step procedural guidance with timeline and required documents."
-        elif legal_query.query_type == "case_law":
-            base_prompt += "\n\nFocus on: Relevant case precedents, legal principles, and judicial interpretations."
-        elif legal_query.query_type == "rights":
-            base_prompt += "\n\nFocus on: Legal rights, protections available, and remedies under Indian law."
-        elif legal_query.urgency == "high":
-            base_prompt += "\n\nNote: This appears to be an urgent legal matter. Prioritize immediate actionable steps and emergency procedures."
-        
-        return base_prompt
+        system_prompt = _QUERY_TYPE_SYSTEM_PROMPTS.get(legal_query.query_type)
+        if system_prompt:
+            return system_prompt
+        if legal_query.urgency == "high":
+            return _URGENT_SYSTEM_PROMPT
+        return _BASE_SYSTEM_PROMPT
     
     async def _format_response(self, response: str, legal_query: LegalQuery, context: str) -> str:
         """Format the response for better readability"""
@@ -266,20 +457,7 @@ Guidelines:
     
     async def _get_sources_from_context(self, context: str) -> List[str]:
         """Extract source information from context"""
-        sources = []
-        
-        # This is a simplified extraction - in a real implementation,
-        # you'd want to track sources more systematically
-        if "Case:" in context:
-            sources.append("Case Law Database")
-        if "Court:" in context:
-            sources.append("Court Hierarchy Information")
-        if "Section" in context:
-            sources.append("Legal Acts and Sections")
-        if "Procedure" in context or "procedure" in context:
-            sources.append("Legal Procedures")
-        
-        return sources
+        return list(_context_sources(context))
     
     async def get_chat_response(self, messages: List[Dict[str, str]], user_id: str) -> str:
         """Handle chat-based conversations"""
@@ -298,8 +476,15 @@ Guidelines:
                 query_type=self._infer_query_type(latest_message.get("content", ""))
             )
             
-            # Get relevant context
-            context = await self._get_relevant_context(legal_query)
+            # Get relevant context; in a conversation, for the recent user messages together
+            recent_queries = [
+                message.get("content", "") for message in messages if message.get("role") == "user"
+            ][-CHAT_CONTEXT_MESSAGES:]
+            if len(messages) > 1 and len(recent_queries) > 1:
+                recent_queries[-1] = self._enhance_query_for_search(legal_query)
+                context = await self._get_relevant_context_multi(recent_queries)
+            else:
+                context = await self._get_relevant_context(legal_query)
             
             # Add context to the conversation if available
             if context:
@@ -312,7 +497,7 @@ Guidelines:
                 enhanced_messages = messages
             
             # Generate response
-            response = await self.ollama_service.chat_completion(enhanced_messages)
+            response = await self.legal_ollama_service.chat_completion(enhanced_messages)
             
             return response
             
@@ -323,24 +508,34 @@ Guidelines:
     def _infer_query_type(self, query: str) -> Optional[str]:
         """Infer the type of legal query"""
         query_lower = query.lower()
+        tokens = set(_WORD_RE.findall(query_lower))
         
-        if any(word in query_lower for word in ["how to", "procedure", "process", "steps"]):
+        if "how to" in query_lower or tokens & _PROCEDURE_KW:
             return "procedure"
-        elif any(word in query_lower for word in ["case", "judgment", "precedent", "court"]):
+        elif tokens & _CASE_LAW_KW:
             return "case_law"
-        elif any(word in query_lower for word in ["right", "rights", "entitled", "protection"]):
+        elif tokens & _RIGHTS_KW:
             return "rights"
-        elif any(word in query_lower for word in ["urgent", "emergency", "immediate", "asap"]):
+        elif tokens & _URGENT_KW:
             return "urgent"
         else:
             return None
     
     async def close(self):
         """Close the enhanced legal agent"""
-        if self.ollama_service:
-            await self.ollama_service.close()
-        if self.vector_db_service:
-            await self.vector_db_service.close()
+        services = (
+            self.legal_ollama_service,
+            self.language_ollama_service,
+            self.indian_kanoon_client,
+            self.vector_db_service
+        )
+        results = await asyncio.gather(
+            *(service.close() for service in services if service is not None),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error closing Enhanced Legal Agent service: {result}")
         
         logger.info("Enhanced Legal Agent closed")
     
@@ -361,18 +556,21 @@ Guidelines:
             if not search_results.get("success", False):
                 logger.warning("Failed to retrieve case law from Indian Kanoon")
                 return ""
-              # Format case law context
-            case_law_parts = []
-            for doc in search_results.get("documents", []):
-                case_law_parts.append(f"""
-Case Law: {doc.get('title', '')}
-Court: {doc.get('court', '')}
-Date: {doc.get('date', '')}
-Summary: {doc.get('summary', '')}
-Relevance: {doc.get('relevance_score', 0)}%
-""")
             
-            return "\n---\n".join(case_law_parts)
+            # Format case law context as fragments joined once, with a separator between documents
+            parts = []
+            for doc in search_results.get("documents", []):
+                if parts:
+                    parts.append("\n---\n")
+                parts.extend((
+                    "\nCase Law: ", doc.get('title', ''),
+                    "\nCourt: ", doc.get('court', ''),
+                    "\nDate: ", doc.get('date', ''),
+                    "\nSummary: ", doc.get('summary', ''),
+                    "\nRelevance: ", str(doc.get('relevance_score', 0)), "%\n"
+                ))
+            
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Error retrieving case law context: {e}")
@@ -380,27 +578,40 @@ Relevance: {doc.get('relevance_score', 0)}%
     
     def _combine_contexts(self, training_context: str, case_law_context: str) -> str:
         """Combine training data context with case law context"""
-        contexts = []
-        
-        if training_context:
-            contexts.append(f"=== TRAINING DATA CONTEXT ===\n{training_context}")
-        
-        if case_law_context:
-            contexts.append(f"=== CASE LAW CONTEXT (Indian Kanoon) ===\n{case_law_context}")
-        
-        return "\n\n".join(contexts)
+        if not case_law_context:
+            return _TRAINING_HEADER + training_context if training_context else ""
+        if not training_context:
+            return _CASE_LAW_HEADER + case_law_context
+        return "".join((_TRAINING_HEADER, training_context, "\n\n", _CASE_LAW_HEADER, case_law_context))
     
     async def _simplify_response_if_needed(self, legal_response: str, legal_query: LegalQuery) -> str:
         """
         Use gemma3 model to simplify response for better understanding
         Especially useful for multilingual support and complex legal language
         """
+        # Plain English responses skip the second model entirely
+        if not self._needs_simplification(legal_response, legal_query):
+            return legal_response
+        
         try:
-            # Check if simplification is needed
-            if self._needs_simplification(legal_response, legal_query):
-                logger.info("🔧 Simplifying response with Language Model (gemma3)...")
-                
-                simplification_prompt = f"""
+            logger.info("🔧 Simplifying response with Language Model (gemma3)...")
+            return await self._simplify(legal_response)
+            
+        except Exception as e:
+            logger.error(f"Error in response simplification: {e}")
+            return legal_response  # Return original if simplification fails
+    
+    async def _simplify_block(self, block: str) -> str:
+        """Simplify one block of a legal response as it streams, keeping the block if simplification fails"""
+        try:
+            return await self._simplify(block)
+        except Exception as e:
+            logger.error(f"Error in response simplification: {e}")
+            return block
+    
+    async def _simplify(self, legal_response: str) -> str:
+        """Simplify legal text with the Language Model (gemma3)"""
+        simplification_prompt = f"""
 Please simplify the following legal response to make it more understandable for a general audience while maintaining accuracy:
 
 Original Response:
@@ -415,44 +626,37 @@ Requirements:
 
 Simplified Response:
 """
-                
-                simplified = await self.language_ollama_service.generate_response(
+        
+        try:
+            return await asyncio.wait_for(
+                self.language_ollama_service.generate_response(
                     prompt=simplification_prompt,
                     system_prompt="You are a legal language simplification expert. Simplify complex legal language while maintaining accuracy."
-                )
-                
-                return simplified
-            
-            return legal_response
-            
-        except Exception as e:
-            logger.error(f"Error in response simplification: {e}")
-            return legal_response  # Return original if simplification fails
+                ),
+                LANGUAGE_MODEL_TIMEOUT_S
+            )
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"Language model exceeded {LANGUAGE_MODEL_TIMEOUT_S}s")
     
     def _needs_simplification(self, response: str, legal_query: LegalQuery) -> bool:
         """Determine if response needs simplification"""
-        # Check for complex legal terms
-        complex_terms = [
-            "whereas", "heretofore", "notwithstanding", "pursuant", "aforementioned",
-            "inter alia", "prima facie", "res judicata", "ultra vires", "bona fide"
-        ]
+        # Check query language (if not English, likely needs simplification)
+        if self._query_needs_translation(legal_query):
+            return True
         
-        # Check response complexity
+        # Check for complex legal terms
         response_lower = response.lower()
-        complex_term_count = sum(1 for term in complex_terms if term in response_lower)
-        
-        # Check query language (if not English, likely needs simplification)
-        query_needs_translation = any(
-            char for char in legal_query.query 
-            if ord(char) > 127  # Non-ASCII characters (Hindi, Bengali, etc.)
-        )
+        complex_term_count = sum(1 for term in COMPLEX_LEGAL_TERMS if term in response_lower)
         
         # Simplify if:
-        # 1. Multiple complex legal terms present
-        # 2. Query appears to be in regional language
-        # 3. Response is very long and technical
-        return (
-            complex_term_count >= 3 or 
-            query_needs_translation or 
-            len(response) > 1500
-        )
+        # 1. Query appears to be in regional language
+        # 2. Multiple complex legal terms present
+        # Length alone does not qualify: a long answer in plain English gains nothing from a second model
+        return complex_term_count >= 3
+    
+    def _query_needs_translation(self, legal_query: LegalQuery) -> bool:
+        """Whether the query is in a regional language, so any response needs the Language Model"""
+        if legal_query._needs_translation is None:
+            # Non-ASCII characters (Hindi, Bengali, etc.)
+            legal_query._needs_translation = not legal_query.query.isascii()
+        return legal_query._needs_translation
@@ -4,7 +4,7 @@ Following Technical Flow: Agentic Conversation System (LangGraph)
 """
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Tuple, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 import re
@@ -12,7 +12,7 @@ import json
 
 from app.models import (
     MessageType, ConversationStage, UrgencyLevel, Specialization,
-    UserContext, AdvocateSearchRequest
+    UserContext, UserLocation, AdvocateSearchRequest
 )
 from app.utils import (
     classify_legal_domain, detect_urgency_level, extract_location,
@@ -21,7 +21,17 @@ from app.utils import (
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+def has_location(user_context: UserContext) -> bool:
+    """Whether the user has told us at least their city or state"""
+    location = user_context.location
+    return bool(location and (location.city or location.state))
+
+def _merge_location(user_context: UserContext, location: Dict[str, str]):
+    """Fold an extracted location into the user's UserLocation"""
+    current = user_context.location.model_dump(exclude_none=True) if user_context.location else {}
+    user_context.location = UserLocation(**{**current, **location})
+
+@dataclass(slots=True)
 class AgentState:
     """Shared state between agents"""
     session_id: str
@@ -38,9 +48,13 @@ class AgentState:
     next_action: str
     response_data: Dict[str, Any]
     memory: Dict[str, Any]
+    # Rolling summary of turns that fell out of the history window; read when building context
+    history_summary: str = ""
+    # Turns evicted from the window this message, still to be folded into the summary
+    evicted_history: List[Dict[str, Any]] = field(default_factory=list)
     
 class BaseAgent(ABC):
-    """Base class for all legal agents"""
+    """Base class for all legal agents - stateless, so one instance serves every conversation"""
     
     def __init__(self, name: str):
         self.name = name
@@ -58,22 +72,23 @@ class BaseAgent(ABC):
 class DialogueAgent(BaseAgent):
     """Manages conversation flow and dialogue state"""
     
+    conversation_patterns = {
+        "greeting": [
+            "hello", "hi", "hey", "good morning", "good afternoon", 
+            "good evening", "namaste", "namaskar"
+        ],
+        "legal_help": [
+            "legal", "law", "lawyer", "advocate", "court", "case", 
+            "legal advice", "help", "problem", "issue"
+        ],
+        "emergency": [
+            "urgent", "emergency", "immediate", "help", "crisis",
+            "police", "arrest", "bail", "threat"
+        ]
+    }
+    
     def __init__(self):
         super().__init__("DialogueAgent")
-        self.conversation_patterns = {
-            "greeting": [
-                "hello", "hi", "hey", "good morning", "good afternoon", 
-                "good evening", "namaste", "namaskar"
-            ],
-            "legal_help": [
-                "legal", "law", "lawyer", "advocate", "court", "case", 
-                "legal advice", "help", "problem", "issue"
-            ],
-            "emergency": [
-                "urgent", "emergency", "immediate", "help", "crisis",
-                "police", "arrest", "bail", "threat"
-            ]
-        }
     
     async def process(self, state: AgentState) -> AgentState:
         """Process dialogue management"""
@@ -99,7 +114,7 @@ class DialogueAgent(BaseAgent):
             return ConversationStage.GREETING
         
         # Check if user context has basic information
-        if not state.user_context.legal_issue:
+        if not state.user_context.legal_issue_type:
             return ConversationStage.INFORMATION_GATHERING
         
         # Check if legal guidance has been provided
@@ -160,8 +175,10 @@ class ClassificationAgent(BaseAgent):
         """Process legal classification"""
         self.log_processing(state, "Processing legal classification")
         
-        # Classify legal domain
+        # Classify legal domain; a follow-up naming none stays in the domain of the earlier turns
         state.legal_domain = classify_legal_domain(state.current_message)
+        if state.legal_domain == "general":
+            state.legal_domain = classify_legal_domain(self._earlier_context(state))
         
         # Detect urgency level
         state.urgency_level = UrgencyLevel(detect_urgency_level(state.current_message))
@@ -174,6 +191,12 @@ class ClassificationAgent(BaseAgent):
         
         return state
     
+    def _earlier_context(self, state: AgentState) -> str:
+        """Text of the earlier turns: the rolling summary of evicted ones, then the history window"""
+        parts = [state.history_summary]
+        parts.extend(str(entry.get("content", "")) for entry in state.conversation_history)
+        return "\n".join(parts)
+    
     def _extract_entities(self, message: str) -> Dict[str, Any]:
         """Extract legal entities from message"""
         entities = {}
@@ -265,13 +288,11 @@ class ClassificationAgent(BaseAgent):
         entities = state.extracted_entities
         
         if "location" in entities:
-            if not state.user_context.location:
-                state.user_context.location = {}
-            state.user_context.location.update(entities["location"])
+            _merge_location(state.user_context, entities["location"])
         
         if "legal_terms" in entities:
-            if not state.user_context.legal_issue:
-                state.user_context.legal_issue = " ".join(entities["legal_terms"])
+            if not state.user_context.legal_issue_type:
+                state.user_context.legal_issue_type = " ".join(entities["legal_terms"])
         
         if "amounts" in entities:
             state.user_context.budget_range = {
@@ -282,14 +303,15 @@ class ClassificationAgent(BaseAgent):
 class ClarificationAgent(BaseAgent):
     """Handles clarification requests and missing information"""
     
+    required_fields = {
+        "location": "I need to know your location to provide relevant legal guidance and find local advocates.",
+        "legal_issue": "Could you please describe your legal issue in more detail?",
+        "urgency": "How urgent is this matter? Is this an emergency situation?",
+        "budget": "Do you have a budget range in mind for legal consultation?"
+    }
+    
     def __init__(self):
         super().__init__("ClarificationAgent")
-        self.required_fields = {
-            "location": "I need to know your location to provide relevant legal guidance and find local advocates.",
-            "legal_issue": "Could you please describe your legal issue in more detail?",
-            "urgency": "How urgent is this matter? Is this an emergency situation?",
-            "budget": "Do you have a budget range in mind for legal consultation?"
-        }
     
     async def process(self, state: AgentState) -> AgentState:
         """Process clarification needs"""
@@ -314,13 +336,13 @@ class ClarificationAgent(BaseAgent):
         """Identify missing required information"""
         missing = []
         
-        if not user_context.location or not any(user_context.location.values()):
+        if not has_location(user_context):
             missing.append("location")
         
-        if not user_context.legal_issue:
+        if not user_context.legal_issue_type:
             missing.append("legal_issue")
         
-        if user_context.urgency_level == UrgencyLevel.LOW and "urgent" not in str(user_context.legal_issue).lower():
+        if user_context.urgency_level == UrgencyLevel.LOW and "urgent" not in str(user_context.legal_issue_type).lower():
             missing.append("urgency")
         
         return missing
@@ -342,25 +364,26 @@ class ClarificationAgent(BaseAgent):
 class LegalReasoningAgent(BaseAgent):
     """Provides legal reasoning and guidance"""
     
+    legal_knowledge_base = {
+        "PROPERTY": {
+            "rent_disputes": "Under the Rent Control Act, tenants have specific rights regarding rent increases and eviction.",
+            "property_purchase": "Property transactions require due diligence including title verification and registration.",
+            "neighbor_disputes": "Property boundary disputes can be resolved through civil court or mediation."
+        },
+        "FAMILY": {
+            "divorce": "Divorce proceedings can be filed under Hindu Marriage Act, Special Marriage Act, or personal laws.",
+            "child_custody": "Child custody decisions are made based on the best interests of the child.",
+            "domestic_violence": "Domestic Violence Act provides protection and relief to women and children."
+        },
+        "CONSUMER": {
+            "product_defects": "Consumer Protection Act provides remedies for defective goods and services.",
+            "service_complaints": "Consumer courts have jurisdiction over service-related complaints.",
+            "refund_issues": "Consumers have right to refund for defective products or unsatisfactory services."
+        }
+    }
+    
     def __init__(self):
         super().__init__("LegalReasoningAgent")
-        self.legal_knowledge_base = {
-            "PROPERTY": {
-                "rent_disputes": "Under the Rent Control Act, tenants have specific rights regarding rent increases and eviction.",
-                "property_purchase": "Property transactions require due diligence including title verification and registration.",
-                "neighbor_disputes": "Property boundary disputes can be resolved through civil court or mediation."
-            },
-            "FAMILY": {
-                "divorce": "Divorce proceedings can be filed under Hindu Marriage Act, Special Marriage Act, or personal laws.",
-                "child_custody": "Child custody decisions are made based on the best interests of the child.",
-                "domestic_violence": "Domestic Violence Act provides protection and relief to women and children."
-            },
-            "CONSUMER": {
-                "product_defects": "Consumer Protection Act provides remedies for defective goods and services.",
-                "service_complaints": "Consumer courts have jurisdiction over service-related complaints.",
-                "refund_issues": "Consumers have right to refund for defective products or unsatisfactory services."
-            }
-        }
     
     async def process(self, state: AgentState) -> AgentState:
         """Process legal reasoning and guidance"""
@@ -435,13 +458,14 @@ class LegalReasoningAgent(BaseAgent):
 class RiskAssessmentAgent(BaseAgent):
     """Assesses legal risks and urgency"""
     
+    risk_indicators = {
+        "HIGH": ["lawsuit", "court notice", "arrest", "bail", "eviction", "seizure"],
+        "MEDIUM": ["dispute", "contract breach", "warning", "notice"],
+        "LOW": ["advice", "clarification", "general query"]
+    }
+    
     def __init__(self):
         super().__init__("RiskAssessmentAgent")
-        self.risk_indicators = {
-            "HIGH": ["lawsuit", "court notice", "arrest", "bail", "eviction", "seizure"],
-            "MEDIUM": ["dispute", "contract breach", "warning", "notice"],
-            "LOW": ["advice", "clarification", "general query"]
-        }
     
     async def process(self, state: AgentState) -> AgentState:
         """Process risk assessment"""
@@ -543,7 +567,7 @@ class RecommendationAgent(BaseAgent):
         """Generate advocate search criteria"""
         criteria = {
             "specialization": self._map_domain_to_specialization(state.legal_domain),
-            "location": state.user_context.location,
+            "location": state.user_context.location.model_dump() if state.user_context.location else None,
             "urgency": state.urgency_level.value,
             "budget_range": getattr(state.user_context, 'budget_range', None)
         }
@@ -624,9 +648,7 @@ class ContextAgent(BaseAgent):
         # Update user context with new information
         if state.extracted_entities:
             if "location" in state.extracted_entities:
-                if not state.user_context.location:
-                    state.user_context.location = {}
-                state.user_context.location.update(state.extracted_entities["location"])
+                _merge_location(state.user_context, state.extracted_entities["location"])
     
     def _update_memory(self, state: AgentState):
         """Update conversation memory"""
@@ -672,7 +694,7 @@ class ProgressAgent(BaseAgent):
         if state.conversation_history:
             completed_steps += 1  # greeting
         
-        if state.user_context.legal_issue:
+        if state.user_context.legal_issue_type:
             completed_steps += 1  # info_gathering
         
         if "legal_guidance_provided" in state.memory:
@@ -693,8 +715,8 @@ class ProgressAgent(BaseAgent):
     def _assess_completion(self, state: AgentState) -> Dict[str, Any]:
         """Assess if conversation goals are met"""
         requirements_met = {
-            "legal_issue_identified": bool(state.user_context.legal_issue),
-            "location_provided": bool(state.user_context.location and any(state.user_context.location.values())),
+            "legal_issue_identified": bool(state.user_context.legal_issue_type),
+            "location_provided": has_location(state.user_context),
             "legal_guidance_provided": "legal_guidance_provided" in state.memory,
             "recommendations_given": "recommendations" in state.response_data
         }
@@ -710,6 +732,8 @@ class ProgressAgent(BaseAgent):
 class MemoryAgent(BaseAgent):
     """Manages long-term and short-term memory"""
     
+    MAX_SUMMARY_CHARS = 2000
+    
     def __init__(self):
         super().__init__("MemoryAgent")
     
@@ -723,6 +747,9 @@ class MemoryAgent(BaseAgent):
         # Update long-term memory
         self._update_long_term_memory(state)
         
+        # Fold turns that left the history window into the rolling summary
+        self._update_rolling_summary(state)
+        
         # Retrieve relevant memories
         relevant_memories = self._retrieve_relevant_memories(state)
         state.response_data["context_from_memory"] = relevant_memories
@@ -757,7 +784,7 @@ class MemoryAgent(BaseAgent):
         
         # Update user profile
         if state.user_context.location:
-            state.memory["long_term"]["user_profile"]["location"] = state.user_context.location
+            state.memory["long_term"]["user_profile"]["location"] = state.user_context.location.model_dump()
         
         if state.legal_domain:
             if "legal_interests" not in state.memory["long_term"]["user_profile"]:
@@ -766,6 +793,28 @@ class MemoryAgent(BaseAgent):
             if state.legal_domain not in state.memory["long_term"]["user_profile"]["legal_interests"]:
                 state.memory["long_term"]["user_profile"]["legal_interests"].append(state.legal_domain)
     
+    def _update_rolling_summary(self, state: AgentState):
+        """Append one line per evicted turn to the rolling summary, keeping it bounded"""
+        if not state.evicted_history:
+            return
+        
+        lines = state.memory.get("rolling_summary", "").splitlines()
+        for entry in state.evicted_history:
+            content = " ".join(str(entry.get("content", "")).split())
+            if not content:
+                continue
+            intent = entry.get("intent")
+            lines.append(f"- [{intent}] {content[:160]}" if intent else f"- {content[:160]}")
+        
+        # Oldest turns go first once the summary is full
+        while len(lines) > 1 and sum(len(line) + 1 for line in lines) > self.MAX_SUMMARY_CHARS:
+            lines.pop(0)
+        
+        state.memory["rolling_summary"] = "\n".join(lines)
+        state.memory["summarized_through"] = state.evicted_history[-1]["turn_id"]
+        state.history_summary = state.memory["rolling_summary"]
+        state.evicted_history = []
+    
     def _retrieve_relevant_memories(self, state: AgentState) -> Dict[str, Any]:
         """Retrieve memories relevant to current context"""
         relevant = {}
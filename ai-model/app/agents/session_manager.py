@@ -15,6 +15,8 @@ from dataclasses import dataclass, asdict
 import os
 import logging
 
+from app.utils import dumps_json
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -31,6 +33,7 @@ class UserSession:
     query_history: List[Dict[str, Any]] = None
     clarification_needs: List[str] = None
     progress_tracking: Dict[str, Any] = None
+    memory: Dict[str, Any] = None
     
     def __post_init__(self):
         if self.query_history is None:
@@ -39,6 +42,9 @@ class UserSession:
             self.clarification_needs = []
         if self.progress_tracking is None:
             self.progress_tracking = {}
+        if self.memory is None:
+            # Sessions persisted before memory had its own field kept it in the conversation state
+            self.memory = self.conversation_state.pop("memory", {})
 
 class SessionManager:
     """Manages WebSocket sessions with Redis/MongoDB persistence"""
@@ -189,10 +195,11 @@ class SessionManager:
     async def send_to_user(self, user_id: str, message: Dict[str, Any]):
         """Send message to all user's WebSocket connections"""
         if user_id in self.websocket_connections:
+            text = dumps_json(message)
             disconnected = []
             for websocket in self.websocket_connections[user_id]:
                 try:
-                    await websocket.send_text(json.dumps(message))
+                    await websocket.send_text(text)
                 except Exception as e:
                     logger.error(f"Failed to send message to {user_id}: {e}")
                     disconnected.append(websocket)
@@ -228,7 +235,7 @@ class SessionManager:
                 await self.redis_client.setex(
                     f"session:{session.session_id}",
                     self.session_timeout,
-                    json.dumps(session_data)
+                    dumps_json(session_data)
                 )
             except Exception as e:
                 logger.error(f"Redis session persistence failed: {e}")
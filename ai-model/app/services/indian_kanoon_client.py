@@ -6,6 +6,9 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# One pooled client per process; keep-alive connections spare each search a new TCP/TLS handshake
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=60.0)
+
 class IndianKanoonClient:
     """Client for Indian Kanoon API integration"""
     
@@ -20,6 +23,7 @@ class IndianKanoonClient:
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=self.timeout,
+            limits=HTTP_POOL_LIMITS,
             headers={
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {self.api_key}"
@@ -12,7 +12,10 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Keep-alive connections spare each generation a new TCP handshake
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=60.0)
+
+@dataclass(frozen=True)
 class OllamaConfig:
     """Configuration for Ollama service"""
     base_url: str = "http://localhost:11434"
@@ -20,6 +23,8 @@ class OllamaConfig:
     timeout: int = 120
     temperature: float = 0.7
     max_tokens: int = 2048
+    # "ollama", or "openai" for OpenAI-compatible servers with continuous batching (vLLM, TGI)
+    api: str = "ollama"
 
 class OllamaService:
     """Service for interacting with local Ollama models"""
@@ -37,7 +42,8 @@ class OllamaService:
             # Create HTTP client
             self.client = httpx.AsyncClient(
                 base_url=self.config.base_url,
-                timeout=httpx.Timeout(self.config.timeout)
+                timeout=httpx.Timeout(self.config.timeout),
+                limits=HTTP_POOL_LIMITS
             )
             
             # Check if Ollama server is running
@@ -52,10 +58,15 @@ class OllamaService:
             logger.error(f"❌ Failed to initialize Ollama Service: {e}")
             raise
     
+    @property
+    def _openai_api(self) -> bool:
+        """Whether the server speaks the OpenAI-compatible API rather than Ollama's"""
+        return self.config.api == "openai"
+    
     async def _check_server_health(self):
         """Check if Ollama server is running"""
         try:
-            response = await self.client.get("/api/tags")
+            response = await self.client.get("/v1/models" if self._openai_api else "/api/tags")
             if response.status_code == 200:
                 logger.info("Ollama server is running")
             else:
@@ -66,14 +77,20 @@ class OllamaService:
     async def _check_model_availability(self):
         """Check if the specified model is available"""
         try:
-            response = await self.client.get("/api/tags")
+            response = await self.client.get("/v1/models" if self._openai_api else "/api/tags")
             if response.status_code == 200:
                 models = response.json()
-                available_models = [model["name"] for model in models.get("models", [])]
+                if self._openai_api:
+                    available_models = [model["id"] for model in models.get("data", [])]
+                else:
+                    available_models = [model["name"] for model in models.get("models", [])]
                 
                 if self.config.model_name in available_models:
                     self.model_available = True
                     logger.info(f"Model {self.config.model_name} is available")
+                elif self._openai_api:
+                    # OpenAI-compatible servers serve the models they were started with; nothing to pull
+                    raise Exception(f"Model {self.config.model_name} not served. Available models: {available_models}")
                 else:
                     logger.warning(f"Model {self.config.model_name} not found. Available models: {available_models}")
                     logger.info(f"Attempting to pull model {self.config.model_name}...")
@@ -129,15 +146,7 @@ class OllamaService:
             # Construct the full prompt
             full_prompt = self._construct_prompt(prompt, context, system_prompt)
             
-            payload = {
-                "model": self.config.model_name,
-                "prompt": full_prompt,
-                "stream": stream,
-                "options": {
-                    "temperature": self.config.temperature,
-                    "num_predict": self.config.max_tokens,
-                }
-            }
+            payload = self._build_payload(full_prompt, stream)
             
             if stream:
                 return await self._generate_streaming_response(payload)
@@ -148,13 +157,50 @@ class OllamaService:
             logger.error(f"Error generating response: {e}")
             raise
     
+    async def stream_response(self, 
+                            prompt: str, 
+                            context: str = "",
+                            system_prompt: str = "") -> AsyncGenerator[str, None]:
+        """Generate response from the model, yielding text chunks as they are decoded"""
+        if not self.model_available:
+            raise Exception("Model is not available")
+        
+        payload = self._build_payload(self._construct_prompt(prompt, context, system_prompt), True)
+        
+        async for chunk in self._generate_streaming_response(payload):
+            yield chunk
+    
+    def _build_payload(self, prompt: str, stream: bool) -> Dict[str, Any]:
+        """Build the generation request body for the configured API"""
+        if self._openai_api:
+            return {
+                "model": self.config.model_name,
+                "prompt": prompt,
+                "stream": stream,
+                "temperature": self.config.temperature,
+                "max_tokens": self.config.max_tokens,
+            }
+        return {
+            "model": self.config.model_name,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": self.config.temperature,
+                "num_predict": self.config.max_tokens,
+            }
+        }
+    
     async def _generate_single_response(self, payload: Dict[str, Any]) -> str:
         """Generate a single response (non-streaming)"""
         try:
-            response = await self.client.post("/api/generate", json=payload)
+            response = await self.client.post(
+                "/v1/completions" if self._openai_api else "/api/generate", json=payload
+            )
             
             if response.status_code == 200:
                 result = response.json()
+                if self._openai_api:
+                    return result["choices"][0]["text"]
                 return result.get("response", "")
             else:
                 raise Exception(f"Generation failed with status {response.status_code}")
@@ -166,12 +212,26 @@ class OllamaService:
     async def _generate_streaming_response(self, payload: Dict[str, Any]) -> AsyncGenerator[str, None]:
         """Generate streaming response"""
         try:
-            async with self.client.stream("POST", "/api/generate", json=payload) as response:
+            path = "/v1/completions" if self._openai_api else "/api/generate"
+            async with self.client.stream("POST", path, json=payload) as response:
                 if response.status_code == 200:
                     async for line in response.aiter_lines():
+                        if self._openai_api:
+                            # Server-sent events: "data: {...}" lines, ending with "data: [DONE]"
+                            if not line.startswith("data: "):
+                                continue
+                            line = line[len("data: "):]
+                            if line == "[DONE]":
+                                break
                         if line:
                             try:
                                 data = json.loads(line)
+                                if self._openai_api:
+                                    # The final usage chunk some servers send has no choices
+                                    choices = data.get("choices") or []
+                                    if choices:
+                                        yield choices[0].get("text", "")
+                                    continue
                                 if "response" in data:
                                     yield data["response"]
                                 if data.get("done", False):
@@ -223,15 +283,7 @@ Provide practical, actionable advice while emphasizing the importance of consult
             # Convert messages to prompt format
             prompt = self._messages_to_prompt(messages)
             
-            payload = {
-                "model": self.config.model_name,
-                "prompt": prompt,
-                "stream": stream,
-                "options": {
-                    "temperature": self.config.temperature,
-                    "num_predict": self.config.max_tokens,
-                }
-            }
+            payload = self._build_payload(prompt, stream)
             
             if stream:
                 return await self._generate_streaming_response(payload)
@@ -265,6 +317,14 @@ Provide practical, actionable advice while emphasizing the importance of consult
     async def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model"""
         try:
+            if self._openai_api:
+                # OpenAI-compatible servers only describe the models they serve, in the model list
+                response = await self.client.get("/v1/models")
+                if response.status_code != 200:
+                    return {}
+                models = response.json().get("data", [])
+                return next((model for model in models if model.get("id") == self.config.model_name), {})
+            
             response = await self.client.post("/api/show", json={"name": self.config.model_name})
             if response.status_code == 200:
                 return response.json()
@@ -10,6 +10,7 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import logging
 
+import numpy as np
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
@@ -275,61 +276,135 @@ Keywords: {', '.join(case.get('keywords', []))}
             logger.error(f"Error indexing documents: {e}")
             raise
     
-    async def similarity_search(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+    def encode_query(self, query: str) -> np.ndarray:
+        """Embed a query as a row for similarity_search"""
+        return self.embedding_model.encode([query], convert_to_tensor=False)
+    
+    async def encode_query_async(self, query: str) -> np.ndarray:
+        """encode_query in a worker thread, so the event loop keeps serving other work while the model runs"""
+        return await asyncio.to_thread(self.encode_query, query)
+    
+    async def similarity_search(
+        self,
+        query: str,
+        k: int = 5,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
         """Search for similar documents"""
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_model.encode([query], convert_to_tensor=False)
+            # Generate query embedding, unless the caller already has it
+            if query_embedding is None:
+                query_embedding = await self.encode_query_async(query)
             
-            # Search in ChromaDB
-            results = self.collection.query(
+            # Search in ChromaDB; the client call blocks, so it runs in a worker thread
+            results = await asyncio.to_thread(
+                self.collection.query,
                 query_embeddings=query_embedding.tolist(),
                 n_results=k,
                 include=["documents", "metadatas", "distances"]
             )
             
-            # Format results
-            formatted_results = []
-            if results['documents']:
-                for i in range(len(results['documents'][0])):
-                    formatted_results.append({
-                        "content": results['documents'][0][i],
-                        "metadata": results['metadatas'][0][i] if results['metadatas'] else {},
-                        "score": 1 - results['distances'][0][i] if results['distances'] else 0.0
-                    })
-            
-            return formatted_results
+            return self._format_results(results, 0)
             
         except Exception as e:
             logger.error(f"Error in similarity search: {e}")
             return []
     
-    async def get_relevant_context(self, query: str, max_tokens: int = 2000) -> str:
-        """Get relevant context for a query, limited by token count"""
+    async def similarity_search_batch(self, queries: List[str], k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Search for documents similar to each query, with one embedding pass and one collection query"""
+        if not queries:
+            return []
+        
         try:
-            results = await self.similarity_search(query, k=10)
+            # Generate all query embeddings at once; the model and the client call block,
+            # so both run in worker threads
+            query_embeddings = await asyncio.to_thread(
+                self.embedding_model.encode, queries, convert_to_tensor=False
+            )
             
-            context_parts = []
-            total_length = 0
+            # Search in ChromaDB
+            results = await asyncio.to_thread(
+                self.collection.query,
+                query_embeddings=query_embeddings.tolist(),
+                n_results=k,
+                include=["documents", "metadatas", "distances"]
+            )
             
-            for result in results:
-                content = result['content']
-                if total_length + len(content) <= max_tokens:
-                    context_parts.append(content)
-                    total_length += len(content)
-                else:
-                    # Add partial content if it fits
-                    remaining = max_tokens - total_length
-                    if remaining > 100:  # Only add if meaningful
-                        context_parts.append(content[:remaining] + "...")
-                    break
+            return [self._format_results(results, i) for i in range(len(queries))]
             
-            return "\n\n---\n\n".join(context_parts)
+        except Exception as e:
+            logger.error(f"Error in batch similarity search: {e}")
+            return [[] for _ in queries]
+    
+    def _format_results(self, results: Dict[str, Any], query_index: int) -> List[Dict[str, Any]]:
+        """Format the ChromaDB results of one query"""
+        formatted_results = []
+        if results['documents']:
+            documents = results['documents'][query_index]
+            for i in range(len(documents)):
+                formatted_results.append({
+                    "content": documents[i],
+                    "metadata": results['metadatas'][query_index][i] if results['metadatas'] else {},
+                    "score": 1 - results['distances'][query_index][i] if results['distances'] else 0.0
+                })
+        
+        return formatted_results
+    
+    async def get_relevant_context(
+        self,
+        query: str,
+        max_tokens: int = 2000,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> str:
+        """Get relevant context for a query, limited by token count"""
+        try:
+            results = await self.similarity_search(query, k=10, query_embedding=query_embedding)
+            return self._build_context(results, max_tokens)
             
         except Exception as e:
             logger.error(f"Error getting relevant context: {e}")
             return ""
     
+    async def get_relevant_context_multi(self, queries: List[str], max_tokens: int = 2000) -> str:
+        """Get one context for several related queries, ranking their results together within one token budget"""
+        try:
+            batch_results = await self.similarity_search_batch(queries, k=10)
+            
+            # A chunk found for several queries counts once, at its best score; the budget is applied
+            # after merging, so whole top chunks are kept instead of a slice of each query's context
+            best = {}
+            for results in reversed(batch_results):  # Latest query first, so it wins ties
+                for result in results:
+                    seen = best.get(result["content"])
+                    if seen is None or result["score"] > seen["score"]:
+                        best[result["content"]] = result
+            
+            merged = sorted(best.values(), key=lambda result: result["score"], reverse=True)
+            return self._build_context(merged, max_tokens)
+            
+        except Exception as e:
+            logger.error(f"Error getting relevant context for multiple queries: {e}")
+            return ""
+    
+    def _build_context(self, results: List[Dict[str, Any]], max_tokens: int) -> str:
+        """Join search results into a context limited by token count"""
+        context_parts = []
+        total_length = 0
+        
+        for result in results:
+            content = result['content']
+            if total_length + len(content) <= max_tokens:
+                context_parts.append(content)
+                total_length += len(content)
+            else:
+                # Add partial content if it fits
+                remaining = max_tokens - total_length
+                if remaining > 100:  # Only add if meaningful
+                    context_parts.append(content[:remaining] + "...")
+                break
+        
+        return "\n\n---\n\n".join(context_parts)
+    
     async def close(self):
         """Close the vector database service"""
         if self.client:
@@ -6,6 +6,7 @@ __all__ = [
     "generate_message_id",
     "safe_json_loads",
     "safe_json_dumps",
+    "dumps_json",
     "extract_keywords",
     "classify_legal_domain",
     "detect_urgency_level",
@@ -4,6 +4,12 @@ import uuid
 import json
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 def get_current_timestamp() -> str:
@@ -34,6 +40,12 @@ def safe_json_dumps(obj: Any, default: str = "{}") -> str:
         logger.error(f"Error converting to JSON: {str(e)}")
         return default
 
+def dumps_json(obj: Any) -> str:
+    """Convert object to compact JSON string, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
 def extract_keywords(text: str) -> List[str]:
     """Extract keywords from text for search purposes"""
     # Simple keyword extraction - can be enhanced with NLP
@@ -1,10 +1,18 @@
 from fastapi import WebSocket
-from typing import Dict, List
+from typing import Any, Dict, List
+import asyncio
 import json
 import logging
+import os
+
+from app.utils import dumps_json
 
 logger = logging.getLogger(__name__)
 
+# Messages queued for a user within this window go out together as one frame
+SEND_BATCH_WINDOW = float(os.getenv("WS_SEND_BATCH_WINDOW", "0.001"))
+SEND_BATCH_MAX = int(os.getenv("WS_SEND_BATCH_MAX", "32"))
+
 class ConnectionManager:
     """Manages WebSocket connections for chat"""
     
@@ -13,6 +21,9 @@ class ConnectionManager:
         self.active_connections: Dict[str, List[WebSocket]] = {}
         # Store connection metadata
         self.connection_info: Dict[str, Dict] = {}
+        # Outgoing messages per user, drained by one writer task per user
+        self.send_queues: Dict[str, asyncio.Queue] = {}
+        self.writer_tasks: Dict[str, asyncio.Task] = {}
     
     async def connect(self, websocket: WebSocket, user_id: str):
         """Accept a new WebSocket connection"""
@@ -23,6 +34,11 @@ class ConnectionManager:
         
         self.active_connections[user_id].append(websocket)
         
+        if user_id not in self.writer_tasks:
+            queue = asyncio.Queue()
+            self.send_queues[user_id] = queue
+            self.writer_tasks[user_id] = asyncio.create_task(self._write_batches(user_id, queue))
+        
         # Store connection info
         self.connection_info[user_id] = {
             "connected_at": None,
@@ -78,23 +94,60 @@ class ConnectionManager:
                 del self.active_connections[user_id]
                 if user_id in self.connection_info:
                     del self.connection_info[user_id]
+                
+                # Anything still queued has nowhere to go
+                writer = self.writer_tasks.pop(user_id, None)
+                if writer:
+                    writer.cancel()
+                self.send_queues.pop(user_id, None)
         
         logger.info(f"User {user_id} disconnected")
     
     async def send_personal_message(self, message: dict, user_id: str):
-        """Send a message to a specific user"""
+        """Queue a message for a specific user; it is sent with any others queued alongside it"""
+        queue = self.send_queues.get(user_id)
+        if queue is not None:
+            queue.put_nowait(message)
+        else:
+            logger.warning(f"Dropping {message.get('type', 'unknown')} message for {user_id}: no active connection")
+    
+    async def _write_batches(self, user_id: str, queue: asyncio.Queue):
+        """Drain a user's send queue, one frame per batch of messages"""
+        while True:
+            batch = [await queue.get()]
+            
+            # Let messages produced in the same burst catch up
+            await asyncio.sleep(SEND_BATCH_WINDOW)
+            while len(batch) < SEND_BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            # A lone message goes out as-is; several are wrapped in one batch frame
+            if len(batch) == 1:
+                frame: Dict[str, Any] = batch[0]
+            else:
+                frame = {"type": "batch", "messages": batch}
+            
+            # One bad batch must not stop the writer, or every later message for this user is lost
+            try:
+                await self._send_frame(user_id, frame, len(batch))
+            except Exception as e:
+                logger.exception(f"Error sending batch of {len(batch)} message(s) to {user_id}: {e}")
+    
+    async def _send_frame(self, user_id: str, frame: dict, message_count: int):
+        """Send one frame to every active connection of a user"""
         if user_id in self.active_connections:
-            # Send to all active connections for this user
+            # Serialized once for all active connections of this user
+            text = dumps_json(frame)
             disconnected_sockets = []
             
             for websocket in self.active_connections[user_id]:
                 try:
-                    await websocket.send_json(message)
+                    await websocket.send_text(text)
                     
                     # Update activity info
                     if user_id in self.connection_info:
                         self.connection_info[user_id]["last_activity"] = self._get_timestamp()
-                        self.connection_info[user_id]["message_count"] += 1
+                        self.connection_info[user_id]["message_count"] += message_count
                         
                 except Exception as e:
                     logger.error(f"Error sending message to {user_id}: {str(e)}")
@@ -5,6 +5,9 @@ import uvicorn
 import os
 from dotenv import load_dotenv
 
+# Load environment variables; app modules resolve their configuration when imported
+load_dotenv()
+
 from app.api.routes import api_router
 from app.websocket.connection_manager import ConnectionManager
 from app.websocket.chat_handler import ChatHandler
@@ -13,9 +16,6 @@ from app.services.indian_kanoon_client import IndianKanoonClient
 from app.agents.conversation_orchestrator import ConversationOrchestrator
 from app.utils import get_current_timestamp
 
-# Load environment variables
-load_dotenv()
-
 # Global instances
 connection_manager = ConnectionManager()
 chat_handler = ChatHandler()
@@ -74,12 +74,17 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
             # Receive message from client
             data = await websocket.receive_json()
             
+            # Stream the answer to the client while it is generated
+            async def send_delta(frame):
+                await connection_manager.send_personal_message(frame, user_id)
+            
             # Process through conversation orchestrator
             response = await conversation_orchestrator.process_user_message(
                 user_id=user_id,
                 message=data.get("message", ""),
                 websocket=websocket,
-                session_id=data.get("session_id")
+                session_id=data.get("session_id"),
+                on_delta=send_delta
             )
             
             # Send response back to client
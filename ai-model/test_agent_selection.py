@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test: Specialized Agent Selection
+Checks which specialized agents the agent graph fans out to for a classified message
+"""
+
+from app.agents.agent_graph import AgentGraph
+from app.models import UrgencyLevel, UserLocation
+
+def _classified_state(graph: AgentGraph, message: str, user_context: dict, **classification):
+    """Agent state as the classification agent would leave it"""
+    state = graph._build_agent_state("test_session", "test_user", message, [], user_context, {})
+    for name, value in classification.items():
+        setattr(state, name, value)
+    return state
+
+def test_select_specialized_agents():
+    """The selector reads the UserContext model and picks agents by what the message needs"""
+    graph = AgentGraph()
+    
+    # Nothing known about the user yet: clarification is needed alongside the domain agents
+    state = _classified_state(
+        graph, "My landlord will not return my deposit", {},
+        confidence=0.9, legal_domain="property", urgency_level=UrgencyLevel.LOW
+    )
+    assert graph._select_specialized_agents(state) == ["clarification", "legal_reasoning", "recommendation"]
+    
+    # Issue and location known, confident classification: no clarification round
+    state = _classified_state(
+        graph, "My landlord will not return my deposit",
+        {"legal_issue": "rent deposit", "location": {"city": "Mumbai", "state": "Maharashtra"}},
+        confidence=0.9, legal_domain="property", urgency_level=UrgencyLevel.LOW
+    )
+    assert state.user_context.location == UserLocation(city="Mumbai", state="Maharashtra")
+    assert graph._select_specialized_agents(state) == ["legal_reasoning", "recommendation"]
+    
+    # Criminal matters and urgent messages also get a risk assessment
+    state = _classified_state(
+        graph, "I was arrested last night",
+        {"legal_issue": "arrest", "location": {"city": "Delhi"}},
+        confidence=0.9, legal_domain="criminal", urgency_level=UrgencyLevel.HIGH
+    )
+    assert graph._select_specialized_agents(state) == [
+        "legal_reasoning", "risk_assessment", "recommendation"
+    ]
+    
+    # An unclassified message with no context only needs clarification
+    state = _classified_state(graph, "Can you help?", {}, confidence=0.2, legal_domain="")
+    assert graph._select_specialized_agents(state) == ["clarification"]
+    
+    print("✅ Specialized agent selection test passed")
+
+if __name__ == "__main__":
+    test_select_specialized_agents()
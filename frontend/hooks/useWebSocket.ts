@@ -25,6 +25,9 @@ interface WebSocketHookReturn {
   reconnect: () => void;
 }
 
+// Id of the answer being streamed in, until the complete response arrives
+const STREAMING_MESSAGE_ID = 'streaming';
+
 export const useWebSocket = (userId?: string): WebSocketHookReturn => {
   const [messages, setMessages] = useState<Message[]>([]);
   const [isConnected, setIsConnected] = useState(false);
@@ -77,17 +80,47 @@ export const useWebSocket = (userId?: string): WebSocketHookReturn => {
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
+          // Messages sent together arrive as one batch frame
+          const frames = data.type === 'batch' ? data.messages : [data];
           
-          const message: Message = {
-            id: data.message_id || Date.now(),
-            type: data.type || 'assistant',
-            content: data.content || data.message || '',
-            timestamp: data.timestamp ? new Date(data.timestamp).getTime() : Date.now(),
-            sessionId: data.session_id,
-            quickActions: data.quick_actions
-          };
-          
-          setMessages(prev => [...prev, message]);
+          setMessages(prev => {
+            const next = [...prev];
+            
+            for (const frame of frames) {
+              // Deltas grow a provisional answer, which the complete response then replaces
+              const last = next[next.length - 1];
+              const streaming = last?.id === STREAMING_MESSAGE_ID;
+              
+              if (frame.type === 'delta') {
+                if (streaming) {
+                  next[next.length - 1] = { ...last, content: last.content + frame.content };
+                } else {
+                  next.push({
+                    id: STREAMING_MESSAGE_ID,
+                    type: 'assistant',
+                    content: frame.content,
+                    timestamp: frame.timestamp ? new Date(frame.timestamp).getTime() : Date.now(),
+                    sessionId: frame.session_id
+                  });
+                }
+                continue;
+              }
+              
+              if (streaming) {
+                next.pop();
+              }
+              next.push({
+                id: frame.message_id || Date.now(),
+                type: frame.type || 'assistant',
+                content: frame.content || frame.message || '',
+                timestamp: frame.timestamp ? new Date(frame.timestamp).getTime() : Date.now(),
+                sessionId: frame.session_id,
+                quickActions: frame.quick_actions
+              });
+            }
+            
+            return next;
+          });
         } catch (error) {
           console.error('Error parsing WebSocket message:', error);
         }